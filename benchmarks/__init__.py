@@ -0,0 +1 @@
+"""Micro-benchmarks for yandex_smart_home integration."""
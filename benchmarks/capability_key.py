@@ -0,0 +1,151 @@
+"""Benchmark capability deduplication by identity key on a climate device.
+
+Run from the repository root: python -m benchmarks.capability_key
+"""
+
+from __future__ import annotations
+
+import asyncio
+import timeit
+from typing import Any
+
+from homeassistant.components.climate import ATTR_FAN_MODE, ATTR_FAN_MODES, ATTR_SWING_MODE, ATTR_SWING_MODES
+from homeassistant.components.climate.const import ClimateEntityFeature, HVACMode
+from homeassistant.const import ATTR_SUPPORTED_FEATURES, ATTR_TEMPERATURE
+from homeassistant.core import HomeAssistant, State
+from pytest_homeassistant_custom_component.common import async_test_home_assistant
+
+from custom_components.yandex_smart_home.capability import STATE_CAPABILITIES_REGISTRY, Capability
+from custom_components.yandex_smart_home.const import (
+    CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ENTITY_ID,
+    CONF_ENTITY_CUSTOM_MODE_SET_MODE,
+    CONF_ENTITY_CUSTOM_MODES,
+    CONF_ENTITY_CUSTOM_RANGE_SET_VALUE,
+    CONF_ENTITY_CUSTOM_RANGES,
+    CONF_ENTITY_CUSTOM_TOGGLE_TURN_OFF,
+    CONF_ENTITY_CUSTOM_TOGGLE_TURN_ON,
+    CONF_ENTITY_CUSTOM_TOGGLES,
+)
+from custom_components.yandex_smart_home.device import Device
+from custom_components.yandex_smart_home.schema import (
+    ModeCapabilityInstance,
+    RangeCapabilityInstance,
+    ToggleCapabilityInstance,
+)
+
+from .home import SyntheticEntryData
+
+CAPABILITIES_COUNT = 40
+NUMBER = 2000
+
+
+def _legacy_eq(capability: Capability[Any], other: Any) -> bool:
+    """Compare capabilities the way it was done before identity keys."""
+    if not isinstance(other, Capability):
+        return False
+
+    return bool(
+        capability.device_id == other.device_id
+        and capability.type == other.type
+        and capability.instance == other.instance
+    )
+
+
+def _dedup_legacy(candidates: list[Capability[Any]]) -> list[Capability[Any]]:
+    """Deduplicate capabilities using list membership and protocol isinstance checks."""
+    capabilities: list[Capability[Any]] = []
+    for candidate in candidates:
+        if not any(_legacy_eq(candidate, c) for c in capabilities):
+            capabilities.append(candidate)
+
+    return capabilities
+
+
+def _dedup_keys(candidates: list[Capability[Any]]) -> list[Capability[Any]]:
+    """Deduplicate capabilities using set of identity keys."""
+    capabilities: list[Capability[Any]] = []
+    seen_keys: set[tuple[str, str, str]] = set()
+    for candidate in candidates:
+        if candidate.key not in seen_keys:
+            capabilities.append(candidate)
+            seen_keys.add(candidate.key)
+
+    return capabilities
+
+
+def _get_climate_candidates(hass: HomeAssistant) -> tuple[Device, list[Capability[Any]]]:
+    """Return a climate device and its capability candidates (custom and state ones with duplicates)."""
+    state = State(
+        "climate.benchmark",
+        HVACMode.HEAT,
+        {
+            ATTR_SUPPORTED_FEATURES: ClimateEntityFeature.TARGET_TEMPERATURE
+            | ClimateEntityFeature.FAN_MODE
+            | ClimateEntityFeature.SWING_MODE
+            | ClimateEntityFeature.TURN_ON
+            | ClimateEntityFeature.TURN_OFF,
+            ATTR_TEMPERATURE: 21,
+            ATTR_FAN_MODES: ["low", "medium", "high"],
+            ATTR_FAN_MODE: "low",
+            ATTR_SWING_MODES: ["on", "off"],
+            ATTR_SWING_MODE: "off",
+            "hvac_modes": [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL, HVACMode.AUTO],
+        },
+    )
+    hass.states.async_set(state.entity_id, state.state, state.attributes)
+    hass.states.async_set("sensor.benchmark", "1")
+
+    state_entity_id = {CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ENTITY_ID: "sensor.benchmark"}
+    entry_data = SyntheticEntryData(
+        hass,
+        entity_config={
+            state.entity_id: {
+                CONF_ENTITY_CUSTOM_MODES: {
+                    i: state_entity_id | {CONF_ENTITY_CUSTOM_MODE_SET_MODE: {}} for i in ModeCapabilityInstance
+                },
+                CONF_ENTITY_CUSTOM_TOGGLES: {
+                    i: state_entity_id | {CONF_ENTITY_CUSTOM_TOGGLE_TURN_ON: {}, CONF_ENTITY_CUSTOM_TOGGLE_TURN_OFF: {}}
+                    for i in ToggleCapabilityInstance
+                },
+                CONF_ENTITY_CUSTOM_RANGES: {
+                    i: state_entity_id | {CONF_ENTITY_CUSTOM_RANGE_SET_VALUE: {}} for i in RangeCapabilityInstance
+                },
+            }
+        },
+    )
+
+    device = Device(hass, entry_data, state.entity_id, state)
+    candidates: list[Capability[Any]] = list(device.get_capabilities())
+    for CapabilityT in STATE_CAPABILITIES_REGISTRY:
+        capability = CapabilityT(hass, entry_data, state.entity_id, state)
+        if capability.supported:
+            candidates.append(capability)
+
+    while len(candidates) < CAPABILITIES_COUNT:
+        candidates.extend(device.get_capabilities()[: CAPABILITIES_COUNT - len(candidates)])
+
+    return device, candidates[:CAPABILITIES_COUNT]
+
+
+def _report(name: str, seconds: float) -> None:
+    """Print a benchmark result."""
+    print(f"{name:<32} {seconds / NUMBER * 1_000_000:10.2f} us/op")
+
+
+async def async_main() -> None:
+    """Run the benchmark."""
+    async with async_test_home_assistant() as hass:
+        device, candidates = _get_climate_candidates(hass)
+        assert _dedup_legacy(candidates) == _dedup_keys(candidates)
+
+        print(f"Climate device with {len(candidates)} capability candidates ({len(_dedup_keys(candidates))} unique)")
+        legacy = timeit.timeit(lambda: _dedup_legacy(candidates), number=NUMBER)
+        keys = timeit.timeit(lambda: _dedup_keys(candidates), number=NUMBER)
+        _report("dedup (list + isinstance)", legacy)
+        _report("dedup (key set)", keys)
+        print(f"{'speedup':<32} {legacy / keys:10.1f}x")
+        _report("Device.get_capabilities()", timeit.timeit(device.get_capabilities, number=NUMBER))
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
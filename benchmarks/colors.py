@@ -0,0 +1,146 @@
+"""Benchmark per-light and bulk conversion of light colors to Yandex colors.
+
+Run from the repository root: python -m benchmarks.colors --lights 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import timeit
+from unittest.mock import patch
+
+from homeassistant.components.light import (
+    ATTR_HS_COLOR,
+    ATTR_RGB_COLOR,
+    ATTR_SUPPORTED_COLOR_MODES,
+    ATTR_XY_COLOR,
+    ColorMode,
+)
+from homeassistant.const import STATE_ON
+from homeassistant.core import State
+from pytest_homeassistant_custom_component.common import async_test_home_assistant
+
+from custom_components.yandex_smart_home import color, device
+from custom_components.yandex_smart_home.color import ColorConverter, LightState, get_rgb_colors
+from custom_components.yandex_smart_home.device import async_get_device_states
+
+from .home import SyntheticEntryData, get_entity_filter
+
+NUMBER = 2000
+ROUNDS = 3
+
+
+class _LightState(LightState):
+    """Light state for per-light conversion."""
+
+    def __init__(self, state: State):
+        """Initialize."""
+        self.state = state
+
+
+def _get_states(count: int) -> list[State]:
+    """Return light states with hs, xy and rgb colors."""
+    rnd = random.Random(1)
+    states: list[State] = []
+    for idx in range(count):
+        match idx % 3:
+            case 0:
+                attributes = {
+                    ATTR_SUPPORTED_COLOR_MODES: [ColorMode.HS],
+                    ATTR_HS_COLOR: (rnd.uniform(0, 360), rnd.uniform(0, 100)),
+                }
+            case 1:
+                attributes = {
+                    ATTR_SUPPORTED_COLOR_MODES: [ColorMode.XY],
+                    ATTR_XY_COLOR: (rnd.uniform(0.1, 0.7), rnd.uniform(0.1, 0.6)),
+                }
+            case _:
+                attributes = {
+                    ATTR_SUPPORTED_COLOR_MODES: [ColorMode.RGB],
+                    ATTR_RGB_COLOR: (rnd.randrange(256), rnd.randrange(256), rnd.randrange(256)),
+                }
+
+        states.append(State(f"light.test_{idx}", STATE_ON, attributes))
+
+    return states
+
+
+def _report(name: str, seconds: float, number: int, baseline: float | None = None) -> None:
+    """Print timing of the benchmark."""
+    line = f"  {name:<28} {seconds / number * 1_000_000:9.2f} us/op"
+    if baseline is not None:
+        line += f"  speedup {baseline / seconds:5.1f}x"
+
+    print(line)
+
+
+def _benchmark_conversion(states: list[State]) -> None:
+    """Compare per-light conversion with bulk conversion."""
+    converter = ColorConverter()
+
+    def _per_light() -> list[int | None]:
+        colors = [_LightState(s)._rgb_color for s in states]
+        return [converter.get_yandex_color(c) if c else None for c in colors]
+
+    def _bulk() -> list[int | None]:
+        return [converter.get_yandex_color(c) if c else None for c in get_rgb_colors(states)]
+
+    assert _per_light() == _bulk()
+
+    print(f"conversion of {len(states)} lights:")
+    baseline = timeit.timeit(_per_light, number=NUMBER)
+    _report("per light", baseline, NUMBER)
+    _report("bulk", timeit.timeit(_bulk, number=NUMBER), NUMBER, baseline)
+    with patch.object(color, "np", None):
+        _report("bulk without numpy", timeit.timeit(_bulk, number=NUMBER), NUMBER, baseline)
+
+
+async def _async_benchmark_query(states: list[State]) -> None:
+    """Compare devices query with and without bulk conversion."""
+    async with async_test_home_assistant() as hass:
+        for state in states:
+            hass.states.async_set(state.entity_id, state.state, state.attributes)
+
+        entry_data = SyntheticEntryData(hass, entity_filter=get_entity_filter(include_entity_globs=["*"]))
+        device_ids = [s.entity_id for s in states]
+        number = NUMBER // 10
+
+        async def _async_query(min_lights: int) -> float:
+            with patch.object(device, "BULK_COLOR_CONVERSION_MIN_LIGHTS", min_lights):
+                start = time.perf_counter()
+                for _ in range(number):
+                    await async_get_device_states(hass, entry_data, device_ids)
+
+                return time.perf_counter() - start
+
+        await _async_query(1)  # warm up caches
+
+        timings: dict[bool, list[float]] = {False: [], True: []}
+        for _ in range(ROUNDS):
+            timings[False].append(await _async_query(len(states) + 1))
+            timings[True].append(await _async_query(1))
+
+        print(f"devices query of {len(states)} lights (best of {ROUNDS}):")
+        _report("per light", min(timings[False]), number)
+        _report("bulk", min(timings[True]), number, min(timings[False]))
+
+        await hass.async_stop(force=True)
+
+
+async def async_main(argv: list[str] | None = None) -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lights", type=int, nargs="+", default=[10, 40, 200], help="number of lights")
+    args = parser.parse_args(argv)
+
+    for count in args.lights:
+        states = _get_states(count)
+        _benchmark_conversion(states)
+        await _async_benchmark_query(states)
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
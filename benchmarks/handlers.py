@@ -0,0 +1,285 @@
+"""Benchmark request handlers and the notifier on synthetic homes.
+
+Run from the repository root: python -m benchmarks.handlers --sizes 100 1000 5000 --output results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable
+
+from homeassistant.const import __version__ as HA_VERSION
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    async_mock_service,
+    async_test_home_assistant,
+)
+
+from custom_components.yandex_smart_home import handlers
+from custom_components.yandex_smart_home.helpers import RequestData, SmartHomePlatform
+from custom_components.yandex_smart_home.notifier import (
+    INITIAL_REPORT_DELAY,
+    REPORT_STATE_WINDOW_MAX,
+    NotifierConfig,
+    YandexDirectNotifier,
+)
+from custom_components.yandex_smart_home.schema import CallbackRequest
+
+from .home import (
+    DEFAULT_RATIOS,
+    SyntheticEntryData,
+    SyntheticHome,
+    async_populate_home,
+    create_config_entry,
+    get_entity_state,
+)
+
+DEFAULT_SIZES = [100, 1000, 5000]
+DEFAULT_ITERATIONS = 20
+ACTION_DEVICES = 50
+QUERY_DEVICES = 100
+REQUEST_ID = "5ca6622d-97b5-465c-a494-fd9954f7599a"
+
+
+@dataclass
+class BenchmarkResult:
+    """Hold timings and allocations of a benchmark."""
+
+    name: str
+    size: int
+    iterations: int
+    min_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+    alloc_peak_kib: float
+    alloc_blocks: int
+
+
+class BenchmarkNotifier(YandexDirectNotifier):
+    """Notifier that records requests instead of sending them."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize."""
+        super().__init__(*args, **kwargs)
+        self.requests: list[CallbackRequest] = []
+
+    async def _async_send_request(self, url: str, request: CallbackRequest) -> bool:
+        """Record the request."""
+        self.requests.append(request)
+        request.as_json()
+        return True
+
+
+def _percentile(timings: list[float], percent: int) -> float:
+    """Return a percentile of timings."""
+    if len(timings) == 1:
+        return timings[0]
+
+    return statistics.quantiles(timings, n=100, method="inclusive")[percent - 1]
+
+
+async def _async_measure(
+    name: str, size: int, iterations: int, target: Callable[[int], Awaitable[Any]]
+) -> BenchmarkResult:
+    """Measure latency percentiles and allocations of the target, the iteration number is passed to the target."""
+    await target(0)  # warm up caches
+
+    timings: list[float] = []
+    for iteration in range(1, iterations + 1):
+        gc.collect()
+        start = time.perf_counter()
+        await target(iteration)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    gc.collect()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    blocks_before = sum(s.count for s in tracemalloc.take_snapshot().statistics("filename"))
+    await target(iterations + 1)
+    _, peak = tracemalloc.get_traced_memory()
+    blocks_after = sum(s.count for s in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+
+    result = BenchmarkResult(
+        name=name,
+        size=size,
+        iterations=iterations,
+        min_ms=round(min(timings), 3),
+        p50_ms=round(_percentile(timings, 50), 3),
+        p90_ms=round(_percentile(timings, 90), 3),
+        p99_ms=round(_percentile(timings, 99), 3),
+        max_ms=round(max(timings), 3),
+        alloc_peak_kib=round(peak / 1024, 1),
+        alloc_blocks=blocks_after - blocks_before,
+    )
+    print(
+        f"{name:<24} {size:>6} entities  p50 {result.p50_ms:9.3f} ms  p90 {result.p90_ms:9.3f} ms  "
+        f"p99 {result.p99_ms:9.3f} ms  peak {result.alloc_peak_kib:10.1f} KiB"
+    )
+    return result
+
+
+async def _async_fire_timers(hass: HomeAssistant, delay: timedelta) -> None:
+    """Run timers that are due within the delay and wait for their tasks."""
+    async_fire_time_changed(hass, dt_util.utcnow() + delay)
+    await hass.async_block_till_done()
+
+
+def _set_states(hass: HomeAssistant, home: SyntheticHome, entity_ids: list[str], variant: int) -> None:
+    """Change states of the entities."""
+    for entity_id in entity_ids:
+        domain, object_id = entity_id.split(".", 1)
+        if object_id.startswith("unexposed_"):
+            hass.states.async_set(entity_id, str(variant))
+            continue
+
+        index = int(object_id.rsplit("_", 1)[1])
+        state, attributes = get_entity_state(domain, index, variant)
+        hass.states.async_set(entity_id, state, attributes)
+
+
+async def async_benchmark_home(
+    size: int, iterations: int, burst: int, ratios: dict[str, float], unexposed: int
+) -> list[BenchmarkResult]:
+    """Run all benchmarks for a home of the given size."""
+    results: list[BenchmarkResult] = []
+
+    async with async_test_home_assistant() as hass:
+        entry = create_config_entry()
+        entry.add_to_hass(hass)
+
+        home = async_populate_home(hass, size, ratios, unexposed)
+        entry_data = SyntheticEntryData(hass, entry, entity_filter=home.entity_filter)
+        unsub_exposure = entry_data.exposure.async_setup()
+        unsub_discovery = entry_data.discovery.async_setup()
+        request_data = RequestData(entry_data, Context(), SmartHomePlatform.YANDEX, "user", REQUEST_ID)
+        for service in ("turn_on", "turn_off"):
+            async_mock_service(hass, "light", service)
+
+        async def _async_device_list(_: int) -> None:
+            (await handlers.async_handle_request(hass, request_data, "/user/devices", "")).as_json()
+
+        results.append(await _async_measure("device_list", size, iterations, _async_device_list))
+
+        query_payload = json.dumps({"devices": [{"id": e} for e in home.exposed_entity_ids[:QUERY_DEVICES]]})
+
+        async def _async_devices_query(_: int) -> None:
+            (await handlers.async_handle_request(hass, request_data, "/user/devices/query", query_payload)).as_json()
+
+        results.append(await _async_measure("devices_query", size, iterations, _async_devices_query))
+
+        action_entity_ids = home.entity_ids.get("light", [])[:ACTION_DEVICES]
+
+        async def _async_devices_action(iteration: int) -> None:
+            payload = {
+                "payload": {
+                    "devices": [
+                        {
+                            "id": entity_id,
+                            "capabilities": [
+                                {
+                                    "type": "devices.capabilities.on_off",
+                                    "state": {"instance": "on", "value": iteration % 2 == 0},
+                                }
+                            ],
+                        }
+                        for entity_id in action_entity_ids
+                    ]
+                }
+            }
+            response = await handlers.async_handle_request(
+                hass, request_data, "/user/devices/action", json.dumps(payload)
+            )
+            response.as_json()
+
+        results.append(await _async_measure("devices_action", size, iterations, _async_devices_action))
+
+        # every report is sent in one chunk, the pause between chunks is not measured
+        config = NotifierConfig(
+            user_id="user", token="token", skill_id="skill", chunk_devices=max(size, burst), chunk_size=sys.maxsize
+        )
+        notifier = BenchmarkNotifier(hass, entry_data, config, {}, {})
+        await notifier.async_setup()
+        await _async_fire_timers(hass, INITIAL_REPORT_DELAY)  # initial report and discovery are not measured
+
+        burst_exposed = home.exposed_entity_ids[: burst - burst // 4]
+        burst_entity_ids = burst_exposed + home.unexposed_entity_ids[: burst - len(burst_exposed)]
+
+        async def _async_state_changed_burst(iteration: int) -> None:
+            _set_states(hass, home, burst_entity_ids, iteration + 1)
+            await hass.async_block_till_done()
+            await _async_fire_timers(hass, REPORT_STATE_WINDOW_MAX)  # flush of buffered state changes
+            await _async_fire_timers(hass, REPORT_STATE_WINDOW_MAX)  # report of pending states
+
+        results.append(
+            await _async_measure(f"state_changed_burst_{burst}", size, iterations, _async_state_changed_burst)
+        )
+
+        await notifier.async_unload()
+        unsub_discovery()
+        unsub_exposure()
+        await hass.async_stop(force=True)
+
+    return results
+
+
+def _parse_ratios(value: str) -> dict[str, float]:
+    """Parse domain ratios in form light=0.4,sensor=0.6."""
+    ratios: dict[str, float] = {}
+    for item in value.split(","):
+        domain, ratio = item.split("=", 1)
+        if domain not in DEFAULT_RATIOS:
+            raise argparse.ArgumentTypeError(f"Unsupported domain: {domain}")
+        ratios[domain] = float(ratio)
+
+    return ratios
+
+
+async def async_main(argv: list[str] | None = None) -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="number of exposed entities")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--burst", type=int, default=200, help="number of state changes in a burst")
+    parser.add_argument("--unexposed", type=int, default=None, help="number of unexposed entities (default: size)")
+    parser.add_argument("--ratios", type=_parse_ratios, default=DEFAULT_RATIOS, help="e.g. light=0.5,sensor=0.5")
+    parser.add_argument("--output", help="write results to a JSON file")
+    args = parser.parse_args(argv)
+
+    results: list[BenchmarkResult] = []
+    for size in args.sizes:
+        unexposed = size if args.unexposed is None else args.unexposed
+        results.extend(await async_benchmark_home(size, args.iterations, args.burst, args.ratios, unexposed))
+
+    if args.output:
+        report = {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "homeassistant": HA_VERSION,
+            "ratios": args.ratios,
+            "burst": args.burst,
+            "results": [asdict(r) for r in results],
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
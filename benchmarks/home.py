@@ -0,0 +1,211 @@
+"""Synthetic Home Assistant homes for benchmarks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.components.climate import ATTR_FAN_MODE, ATTR_FAN_MODES, ATTR_HVAC_MODES
+from homeassistant.components.climate.const import ClimateEntityFeature, HVACMode
+from homeassistant.components.cover import ATTR_CURRENT_POSITION, CoverEntityFeature
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_COLOR_MODE,
+    ATTR_COLOR_TEMP_KELVIN,
+    ATTR_MAX_COLOR_TEMP_KELVIN,
+    ATTR_MIN_COLOR_TEMP_KELVIN,
+    ATTR_RGB_COLOR,
+    ATTR_SUPPORTED_COLOR_MODES,
+    ColorMode,
+)
+from homeassistant.components.media_player import (
+    ATTR_MEDIA_VOLUME_LEVEL,
+    ATTR_MEDIA_VOLUME_MUTED,
+    MediaPlayerEntityFeature,
+)
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_SUPPORTED_FEATURES,
+    ATTR_TEMPERATURE,
+    ATTR_UNIT_OF_MEASUREMENT,
+    PERCENTAGE,
+    STATE_OFF,
+    STATE_ON,
+    STATE_OPEN,
+    STATE_PLAYING,
+    UnitOfTemperature,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entityfilter
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.yandex_smart_home.config_flow import ConfigFlowHandler
+from custom_components.yandex_smart_home.const import CONF_FILTER_SOURCE, DOMAIN, EntityFilterSource
+from custom_components.yandex_smart_home.entry_data import ConfigEntryData
+from custom_components.yandex_smart_home.helpers import STORE_CACHE_ATTRS, CacheStore
+
+DEFAULT_RATIOS = {"light": 0.35, "climate": 0.05, "sensor": 0.4, "cover": 0.1, "media_player": 0.1}
+
+
+@dataclass
+class SyntheticHome:
+    """Entities of a synthetic home grouped by domain."""
+
+    entity_ids: dict[str, list[str]] = field(default_factory=dict)
+    unexposed_entity_ids: list[str] = field(default_factory=list)
+
+    @property
+    def exposed_entity_ids(self) -> list[str]:
+        """Return all exposed entities."""
+        return [entity_id for entity_ids in self.entity_ids.values() for entity_id in entity_ids]
+
+    @property
+    def entity_filter(self) -> entityfilter.EntityFilter:
+        """Return entity filter that exposes all domains of the home except unexposed entities."""
+        return get_entity_filter(include_domains=list(self.entity_ids), exclude_entity_globs=["sensor.unexposed_*"])
+
+
+class SyntheticCacheStore(CacheStore):
+    """Cache store that is kept in memory only."""
+
+    @callback
+    def save_attr_value(self, entity_id: str, attr: str, value: Any) -> None:
+        """Cache entity's attribute value in memory."""
+        attrs = self._data[STORE_CACHE_ATTRS].setdefault(entity_id, {})
+        if attr not in attrs or attrs[attr] != value:
+            attrs[attr] = value
+            self.revision += 1
+
+        return None
+
+
+class SyntheticEntryData(ConfigEntryData):
+    """Data of a config entry that reports states, uses the YAML entity filter and doesn't touch the storage."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: MockConfigEntry | None = None,
+        entity_config: dict[str, Any] | None = None,
+        entity_filter: entityfilter.EntityFilter | None = None,
+    ):
+        """Initialize."""
+        super().__init__(hass, entry or create_config_entry(), None, entity_config, entity_filter)
+        self.cache = SyntheticCacheStore(hass)
+
+    @property
+    def is_reporting_states(self) -> bool:
+        """Test if the config entry can report state changes."""
+        return True
+
+
+def create_config_entry() -> MockConfigEntry:
+    """Return a config entry with the entity filter from YAML configuration."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        version=ConfigFlowHandler.VERSION,
+        data={},
+        options={CONF_FILTER_SOURCE: EntityFilterSource.YAML},
+    )
+
+
+def get_entity_filter(
+    include_domains: list[str] | None = None,
+    include_entity_globs: list[str] | None = None,
+    exclude_entity_globs: list[str] | None = None,
+) -> entityfilter.EntityFilter:
+    """Return entity filter for the domains and globs."""
+    return entityfilter.EntityFilter(
+        {
+            entityfilter.CONF_INCLUDE_DOMAINS: include_domains or [],
+            entityfilter.CONF_INCLUDE_ENTITY_GLOBS: include_entity_globs or [],
+            entityfilter.CONF_INCLUDE_ENTITIES: [],
+            entityfilter.CONF_EXCLUDE_DOMAINS: [],
+            entityfilter.CONF_EXCLUDE_ENTITY_GLOBS: exclude_entity_globs or [],
+            entityfilter.CONF_EXCLUDE_ENTITIES: [],
+        }
+    )
+
+
+def get_entity_state(domain: str, index: int, variant: int = 0) -> tuple[str, dict[str, Any]]:
+    """Return state and attributes of a synthetic entity, variant changes the reported values."""
+    match domain:
+        case "light":
+            return STATE_ON if variant % 2 == 0 else STATE_OFF, {
+                ATTR_SUPPORTED_COLOR_MODES: [ColorMode.COLOR_TEMP, ColorMode.RGB],
+                ATTR_COLOR_MODE: ColorMode.RGB,
+                ATTR_BRIGHTNESS: (index + variant * 17) % 255 + 1,
+                ATTR_RGB_COLOR: ((index + variant) % 256, 128, 64),
+                ATTR_COLOR_TEMP_KELVIN: 4000,
+                ATTR_MIN_COLOR_TEMP_KELVIN: 2000,
+                ATTR_MAX_COLOR_TEMP_KELVIN: 6500,
+            }
+        case "climate":
+            return HVACMode.HEAT if variant % 2 == 0 else HVACMode.COOL, {
+                ATTR_SUPPORTED_FEATURES: ClimateEntityFeature.TARGET_TEMPERATURE
+                | ClimateEntityFeature.FAN_MODE
+                | ClimateEntityFeature.TURN_ON
+                | ClimateEntityFeature.TURN_OFF,
+                ATTR_HVAC_MODES: [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL, HVACMode.AUTO],
+                ATTR_FAN_MODES: ["low", "medium", "high"],
+                ATTR_FAN_MODE: ["low", "medium", "high"][variant % 3],
+                ATTR_TEMPERATURE: 18 + (index + variant) % 10,
+            }
+        case "sensor":
+            if index % 2 == 0:
+                return str(20 + (index + variant) % 100 / 10), {
+                    ATTR_DEVICE_CLASS: SensorDeviceClass.TEMPERATURE,
+                    ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS,
+                }
+
+            return str(30 + (index + variant) % 50), {
+                ATTR_DEVICE_CLASS: SensorDeviceClass.HUMIDITY,
+                ATTR_UNIT_OF_MEASUREMENT: PERCENTAGE,
+            }
+        case "cover":
+            return STATE_OPEN, {
+                ATTR_SUPPORTED_FEATURES: CoverEntityFeature.OPEN
+                | CoverEntityFeature.CLOSE
+                | CoverEntityFeature.SET_POSITION,
+                ATTR_CURRENT_POSITION: (index + variant * 10) % 101,
+            }
+        case "media_player":
+            return STATE_PLAYING if variant % 2 == 0 else STATE_OFF, {
+                ATTR_SUPPORTED_FEATURES: MediaPlayerEntityFeature.TURN_ON
+                | MediaPlayerEntityFeature.TURN_OFF
+                | MediaPlayerEntityFeature.VOLUME_SET
+                | MediaPlayerEntityFeature.VOLUME_MUTE
+                | MediaPlayerEntityFeature.PLAY_MEDIA,
+                ATTR_MEDIA_VOLUME_LEVEL: (index + variant) % 10 / 10,
+                ATTR_MEDIA_VOLUME_MUTED: variant % 3 == 0,
+            }
+
+    raise ValueError(f"Unsupported domain: {domain}")
+
+
+def async_populate_home(
+    hass: HomeAssistant, size: int, ratios: dict[str, float] | None = None, unexposed: int = 0
+) -> SyntheticHome:
+    """Add states of a synthetic home with the given number of exposed entities."""
+    ratios = ratios or DEFAULT_RATIOS
+    total_ratio = sum(ratios.values())
+    home = SyntheticHome()
+
+    counts = {domain: int(size * ratio / total_ratio) for domain, ratio in ratios.items()}
+    counts[max(ratios, key=lambda d: ratios[d])] += size - sum(counts.values())
+
+    for domain, count in counts.items():
+        home.entity_ids[domain] = []
+        for index in range(count):
+            entity_id = f"{domain}.benchmark_{index}"
+            state, attributes = get_entity_state(domain, index)
+            hass.states.async_set(entity_id, state, attributes)
+            home.entity_ids[domain].append(entity_id)
+
+    for index in range(unexposed):
+        entity_id = f"sensor.unexposed_{index}"
+        hass.states.async_set(entity_id, str(index), {ATTR_UNIT_OF_MEASUREMENT: PERCENTAGE})
+        home.unexposed_entity_ids.append(entity_id)
+
+    return home
@@ -0,0 +1,179 @@
+"""Benchmark compiled mode maps of mode capabilities on the built-in Xiaomi, Roborock and Tion maps.
+
+Run from the repository root: python -m benchmarks.mode_map
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+import timeit
+from typing import Callable
+
+from homeassistant.components import climate, fan, vacuum
+from homeassistant.components.climate.const import ClimateEntityFeature, HVACMode
+from homeassistant.components.fan import FanEntityFeature
+from homeassistant.components.vacuum import VacuumEntityFeature
+from homeassistant.const import ATTR_SUPPORTED_FEATURES, STATE_OFF
+from homeassistant.core import HomeAssistant, State
+from pytest_homeassistant_custom_component.common import async_test_home_assistant
+
+from custom_components.yandex_smart_home.capability_mode import (
+    CleanupModeCapability,
+    FanSpeedCapabilityClimate,
+    ModeCapability,
+    ProgramCapabilityFan,
+    RoborockCleanupMode,
+    StateModeCapability,
+    TionFanSpeed,
+    XiaomiFanMode,
+    XiaomiMiotFanMode,
+    _get_mode_map,
+)
+from custom_components.yandex_smart_home.schema import ModeCapabilityMode
+
+from .home import SyntheticEntryData
+
+NUMBER = 2000
+
+
+def _legacy_get_yandex_mode(capability: ModeCapability, ha_mode: str) -> ModeCapabilityMode | None:
+    """Return Yandex mode for HA mode the way it was done before compiled maps (without warnings)."""
+    mode = None
+    for yandex_mode, names in capability.modes_map.items():
+        if ha_mode.lower() in [n.lower() for n in names]:
+            mode = yandex_mode
+            break
+
+    if mode is not None and ha_mode not in capability.supported_ha_modes:
+        return None
+
+    if not capability.modes_map_config:
+        if mode is None:
+            with suppress(ValueError):
+                mode = ModeCapabilityMode(ha_mode.lower())
+
+        if mode is None and ha_mode.lower() != STATE_OFF:
+            with suppress(IndexError, ValueError, KeyError):
+                mode = capability._modes_map_index_fallback[capability.supported_ha_modes.index(ha_mode)]
+
+    return mode
+
+
+def _legacy_supported_yandex_modes(capability: ModeCapability) -> list[ModeCapabilityMode]:
+    """Return supported Yandex modes the way it was done before compiled maps."""
+    modes = set()
+    for ha_value in capability.supported_ha_modes:
+        if value := _legacy_get_yandex_mode(capability, ha_value):
+            modes.add(value)
+
+    return sorted(modes)
+
+
+def _legacy_get_ha_mode(capability: ModeCapability, yandex_mode: ModeCapabilityMode) -> str | None:
+    """Return HA mode for Yandex mode the way it was done before compiled maps (without the map mutation)."""
+    ha_modes = list(capability.modes_map.get(yandex_mode, []))
+    if not capability.modes_map_config:
+        ha_modes.append(yandex_mode.value)
+
+    for ha_mode in ha_modes:
+        for am in capability.supported_ha_modes:
+            if am.lower() == ha_mode.lower():
+                return am
+
+    if not capability.modes_map_config:
+        for ha_idx, yandex_mode_idx in capability._modes_map_index_fallback.items():
+            if yandex_mode_idx == yandex_mode:
+                return capability.supported_ha_modes[ha_idx]
+
+    return None
+
+
+def _get_capabilities(hass: HomeAssistant) -> dict[str, StateModeCapability]:
+    """Return mode capabilities of a Xiaomi fan, a Roborock vacuum and a Tion breezer."""
+    entry_data = SyntheticEntryData(hass)
+    xiaomi_fan = State(
+        "fan.xiaomi",
+        "on",
+        {
+            ATTR_SUPPORTED_FEATURES: FanEntityFeature.PRESET_MODE | FanEntityFeature.SET_SPEED,
+            fan.ATTR_PERCENTAGE_STEP: 1,
+            fan.ATTR_PRESET_MODES: [*XiaomiFanMode, *XiaomiMiotFanMode],
+            fan.ATTR_PRESET_MODE: XiaomiFanMode.FAVORITE,
+        },
+    )
+    roborock_vacuum = State(
+        "vacuum.roborock",
+        "cleaning",
+        {
+            ATTR_SUPPORTED_FEATURES: VacuumEntityFeature.FAN_SPEED,
+            vacuum.ATTR_FAN_SPEED_LIST: list(RoborockCleanupMode),
+            vacuum.ATTR_FAN_SPEED: RoborockCleanupMode.TURBO,
+        },
+    )
+    tion_breezer = State(
+        "climate.tion",
+        HVACMode.FAN_ONLY,
+        {
+            ATTR_SUPPORTED_FEATURES: ClimateEntityFeature.FAN_MODE,
+            climate.ATTR_FAN_MODES: [climate.FAN_AUTO, *TionFanSpeed],
+            climate.ATTR_FAN_MODE: TionFanSpeed.S4,
+        },
+    )
+
+    return {
+        "xiaomi fan": ProgramCapabilityFan(hass, entry_data, xiaomi_fan.entity_id, xiaomi_fan),
+        "roborock vacuum": CleanupModeCapability(hass, entry_data, roborock_vacuum.entity_id, roborock_vacuum),
+        "tion breezer": FanSpeedCapabilityClimate(hass, entry_data, tion_breezer.entity_id, tion_breezer),
+    }
+
+
+def _report(name: str, legacy: Callable[[], object], compiled: Callable[[], object]) -> None:
+    """Print timings of the legacy and compiled implementations."""
+    legacy_seconds = timeit.timeit(legacy, number=NUMBER)
+    compiled_seconds = timeit.timeit(compiled, number=NUMBER)
+    print(
+        f"  {name:<28} legacy {legacy_seconds / NUMBER * 1_000_000:9.2f} us/op  "
+        f"compiled {compiled_seconds / NUMBER * 1_000_000:9.2f} us/op  "
+        f"speedup {legacy_seconds / compiled_seconds:6.1f}x"
+    )
+
+
+async def async_main() -> None:
+    """Run the benchmark."""
+    async with async_test_home_assistant() as hass:
+        for name, capability in _get_capabilities(hass).items():
+            yandex_modes = _legacy_supported_yandex_modes(capability)
+            assert capability.supported_yandex_modes == yandex_modes
+            for yandex_mode in yandex_modes:
+                assert capability.get_ha_mode_by_yandex_mode(yandex_mode) == _legacy_get_ha_mode(
+                    capability, yandex_mode
+                )
+
+            print(f"{name}: {len(capability.supported_ha_modes)} HA modes, {len(yandex_modes)} Yandex modes")
+            _report(
+                "supported_yandex_modes",
+                lambda: _legacy_supported_yandex_modes(capability),  # noqa: B023
+                lambda: capability.supported_yandex_modes,  # noqa: B023
+            )
+            _report(
+                "get_value",
+                lambda: _legacy_get_yandex_mode(capability, str(capability._ha_value)),  # noqa: B023
+                capability.get_value,
+            )
+            _report(
+                "get_ha_mode_by_yandex_mode",
+                lambda: [_legacy_get_ha_mode(capability, m) for m in yandex_modes],  # noqa: B023
+                lambda: [capability.get_ha_mode_by_yandex_mode(m) for m in yandex_modes],  # noqa: B023
+            )
+
+            def _compile() -> None:
+                _get_mode_map.cache_clear()
+                capability.__dict__.pop("_mode_map", None)  # noqa: B023
+                capability._mode_map  # noqa: B023
+
+            _report("compile (cold cache)", lambda: _legacy_supported_yandex_modes(capability), _compile)  # noqa: B023
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
@@ -0,0 +1,84 @@
+"""Benchmark pydantic and fast serializer backends on device list and device states of a synthetic home.
+
+Run from the repository root: python -m benchmarks.serializer --sizes 100 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import timeit
+from typing import Callable
+
+from pytest_homeassistant_custom_component.common import async_test_home_assistant
+
+from custom_components.yandex_smart_home.device import (
+    async_get_device_description,
+    async_get_device_states,
+    async_get_devices,
+)
+from custom_components.yandex_smart_home.schema import DeviceDescription, DeviceList, DeviceState, DeviceStates
+from custom_components.yandex_smart_home.schema.base import SerializerBackend, set_serializer_backend
+
+from .home import SyntheticEntryData, async_populate_home
+
+NUMBER = 20
+
+
+def _report(name: str, target: Callable[[], str]) -> None:
+    """Print timings of the target with both serializer backends."""
+    timings: dict[SerializerBackend, float] = {}
+    results: dict[SerializerBackend, str] = {}
+    for backend in (SerializerBackend.PYDANTIC, SerializerBackend.FAST):
+        set_serializer_backend(backend)
+        results[backend] = target()
+        timings[backend] = min(timeit.repeat(target, number=NUMBER, repeat=3)) / NUMBER
+
+    set_serializer_backend(SerializerBackend.PYDANTIC)
+    assert results[SerializerBackend.PYDANTIC] == results[SerializerBackend.FAST]
+
+    print(
+        f"  {name:<14} pydantic {timings[SerializerBackend.PYDANTIC] * 1000:8.2f} ms  "
+        f"fast {timings[SerializerBackend.FAST] * 1000:8.2f} ms  "
+        f"speedup {timings[SerializerBackend.PYDANTIC] / timings[SerializerBackend.FAST]:5.1f}x"
+    )
+
+
+async def async_main(argv: list[str] | None = None) -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000], help="number of entities")
+    args = parser.parse_args(argv)
+
+    for size in args.sizes:
+        async with async_test_home_assistant() as hass:
+            home = async_populate_home(hass, size)
+            entry_data = SyntheticEntryData(hass, entity_filter=home.entity_filter)
+
+            descriptions: list[DeviceDescription] = []
+            for device in await async_get_devices(hass, entry_data):
+                if (description := await async_get_device_description(hass, device)) is not None:
+                    descriptions.append(description)
+            states: list[DeviceState] = await async_get_device_states(hass, entry_data, home.exposed_entity_ids)
+
+            def _device_list() -> str:
+                for description in descriptions:
+                    description._json = None  # serialize every time, not the cached JSON
+
+                return DeviceList(user_id="user", devices=descriptions).as_json()
+
+            def _device_states() -> str:
+                for state in states:
+                    state._json = None
+
+                return DeviceStates(devices=states).as_json()
+
+            print(f"{size} entities ({len(descriptions)} devices):")
+            _report("device list", _device_list)
+            _report("device states", _device_states)
+
+            await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(async_main())
@@ -6,7 +6,7 @@ import logging
 from typing import TYPE_CHECKING, Any, cast
 
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
-from homeassistant.const import CONF_ID, CONF_PLATFORM, CONF_TOKEN, SERVICE_RELOAD
+from homeassistant.const import CONF_ID, CONF_PLATFORM, CONF_TOKEN, SERVICE_RELOAD, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entityfilter import FILTER_SCHEMA, EntityFilter
 from homeassistant.helpers.reload import async_integration_yaml_config
@@ -27,6 +27,8 @@ from .const import (
     CONF_NOTIFIER_OAUTH_TOKEN,
     CONF_NOTIFIER_SKILL_ID,
     CONF_NOTIFIER_USER_ID,
+    CONF_SERIALIZER,
+    CONF_SETTINGS,
     CONF_SKILL,
     CONF_USER_ID,
     DOMAIN,
@@ -36,7 +38,9 @@ from .const import (
 from .entry_data import ConfigEntryData
 from .helpers import SmartHomePlatform
 from .http import async_register_http
+from .notifier import async_remove_failed_states_stores
 from .repairs import delete_unexposed_entity_found_issues
+from .schema.base import SerializerBackend, set_serializer_backend
 
 if TYPE_CHECKING:
     from .cloud_stream import CloudStreamManager
@@ -45,6 +49,7 @@ _LOGGER = logging.getLogger(__name__)
 
 
 CONFIG_SCHEMA = vol.Schema({DOMAIN: YANDEX_SMART_HOME_SCHEMA}, extra=vol.ALLOW_EXTRA)
+PLATFORMS = [Platform.SENSOR]
 
 
 class YandexSmartHome:
@@ -58,18 +63,25 @@ class YandexSmartHome:
         self._yaml_config = yaml_config
         self._entry_datas: dict[str, ConfigEntryData] = {}
 
+        self._setup_serializer_backend()
         async_register_admin_service(hass, DOMAIN, SERVICE_RELOAD, self._handle_yaml_config_reload)
 
     async def _handle_yaml_config_reload(self, _: Any) -> None:
         """Handle yaml configuration reloading."""
         if config := await async_integration_yaml_config(self._hass, DOMAIN):
             self._yaml_config = config.get(DOMAIN, {})
+            self._setup_serializer_backend()
 
         for entry in self._hass.config_entries.async_entries(DOMAIN):
             await _async_entry_update_listener(self._hass, entry)
 
         return None
 
+    def _setup_serializer_backend(self) -> None:
+        """Set serializer backend for API models from yaml configuration."""
+        settings = self._yaml_config.get(CONF_SETTINGS, {})
+        set_serializer_backend(SerializerBackend(settings.get(CONF_SERIALIZER, SerializerBackend.PYDANTIC)))
+
     def get_entry_data(self, entry: ConfigEntry) -> ConfigEntryData:
         """Return a config entry data for a config entry."""
         return self._entry_datas[entry.entry_id]
@@ -126,12 +138,18 @@ class YandexSmartHome:
         entry.async_on_unload(entry.add_update_listener(_async_entry_update_listener))
         delete_unexposed_entity_found_issues(self._hass)
 
+        if data.notifier_sensors:
+            await self._hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
         return True
 
     async def async_unload_entry(self, entry: ConfigEntry) -> bool:
         """Unload a config entry."""
         delete_unexposed_entity_found_issues(self._hass)
         data = self.get_entry_data(entry)
+        if data.notifier_sensors and not await self._hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+            return False
+
         await data.async_unload()
         return True
 
@@ -142,6 +160,7 @@ class YandexSmartHome:
         except KeyError:
             pass
 
+        await async_remove_failed_states_stores(self._hass, entry.entry_id)
         return None
 
 
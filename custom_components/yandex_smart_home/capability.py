@@ -119,6 +119,11 @@ class Capability(Protocol[CapabilityInstanceActionState]):
 
         return True
 
+    @cached_property
+    def key(self) -> tuple[str, str, str]:
+        """Return identity key of the capability: device id, type and instance."""
+        return self.device_id, self.type, self.instance
+
     def __str__(self) -> str:
         """Return string representation."""
         return f"instance {self.instance} of {self.type.short} capability of {self.device_id}"
@@ -134,13 +139,18 @@ class Capability(Protocol[CapabilityInstanceActionState]):
         )
 
     def __eq__(self, other: Any) -> bool:
-        """Compare capabilities."""
-        return bool(
-            isinstance(other, Capability)
-            and self.type == other.type
-            and self.instance == other.instance
-            and self.device_id == other.device_id
-        )
+        """Compare capability keys."""
+        if self is other:
+            return True
+
+        try:
+            return bool(self.key == other.key)
+        except AttributeError:
+            return False
+
+    def __hash__(self) -> int:
+        """Return hash of the capability key."""
+        return hash(self.key)
 
 
 class ActionOnlyCapabilityMixin:
@@ -26,7 +26,14 @@ from homeassistant.core import Context, HomeAssistant, State
 from homeassistant.util.color import RGBColor
 
 from .capability import STATE_CAPABILITIES_REGISTRY, Capability, StateCapability
-from .color import SOLID_LIGHT_EFFECT, ColorConverter, ColorTemperatureConverter, LightState
+from .color import (
+    SOLID_LIGHT_EFFECT,
+    ColorConverter,
+    ColorTemperatureConverter,
+    LightState,
+    get_color_converter,
+    get_color_temperature_converter,
+)
 from .const import CONF_COLOR_PROFILE, CONF_ENTITY_CUSTOM_MODES, CONF_ENTITY_MODE_MAP
 from .helpers import APIError
 from .schema import (
@@ -177,14 +184,14 @@ class RGBColorCapability(StateCapability[RGBInstanceActionState], LightState):
         """Return the color converter."""
         if color_profile_name := self._entity_config.get(CONF_COLOR_PROFILE):
             try:
-                return ColorConverter(self._entry_data.color_profiles[color_profile_name])
+                return get_color_converter(self._entry_data.color_profiles[color_profile_name])
             except KeyError:
                 raise APIError(
                     ResponseCode.NOT_SUPPORTED_IN_CURRENT_MODE,
                     f"Color profile '{color_profile_name}' not found for {self}",
                 )
 
-        return ColorConverter()
+        return get_color_converter(None)
 
 
 class ColorTemperatureCapability(StateCapability[TemperatureKInstanceActionState], LightState):
@@ -287,7 +294,7 @@ class ColorTemperatureCapability(StateCapability[TemperatureKInstanceActionState
         """Return the color temperature converter."""
         if color_profile_name := self._entity_config.get(CONF_COLOR_PROFILE):
             try:
-                return ColorTemperatureConverter(self._entry_data.color_profiles[color_profile_name], self.state)
+                return get_color_temperature_converter(self._entry_data.color_profiles[color_profile_name], self.state)
 
             except KeyError:
                 raise APIError(
@@ -295,7 +302,7 @@ class ColorTemperatureCapability(StateCapability[TemperatureKInstanceActionState
                     f"Color profile '{color_profile_name}' not found for {self}",
                 )
 
-        return ColorTemperatureConverter(None, self.state)
+        return get_color_temperature_converter(None, self.state)
 
 
 class ColorSceneCapability(Capability[SceneInstanceActionState]):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from copy import copy
 from functools import cached_property
 import itertools
 import logging
@@ -108,16 +109,10 @@ class CustomCapability(Capability[Any], Protocol):
         return super().reportable
 
     def new_with_value(self, value: Any) -> Self:
-        """Return copy of the state with new value."""
-        return self.__class__(
-            self._hass,
-            self._entry_data,
-            self._config,
-            self.instance,
-            self.device_id,
-            self._value_template,
-            value,
-        )
+        """Return copy of the state with new value (attributes cached from the configuration are shared)."""
+        state = copy(self)
+        state._value = value
+        return state
 
     @callback
     def _get_source_value(self) -> Any:
@@ -1,11 +1,11 @@
 """Implement the Yandex Smart Home mode capabilities."""
 
 from abc import ABC, abstractmethod
-from contextlib import suppress
 from enum import StrEnum
+from functools import cached_property, lru_cache
 import logging
 import math
-from typing import Any, Iterable, Protocol
+from typing import Any, Iterable, Mapping, Protocol, Sequence
 
 from homeassistant.components import climate, fan, humidifier, media_player, vacuum
 from homeassistant.components.climate import ClimateEntityFeature, HVACMode
@@ -31,6 +31,9 @@ from .schema import (
 
 _LOGGER = logging.getLogger(__name__)
 
+MODE_MAPS_CACHE_SIZE = 1024
+_YANDEX_MODES_BY_VALUE: dict[str, ModeCapabilityMode] = {m.value: m for m in ModeCapabilityMode}
+
 
 class GenericMode(StrEnum):
     """Generic HA mode for various devices."""
@@ -143,6 +146,100 @@ class XiaomiMiotCleanupMode(StrEnum):
     CUSTOM = "Custom"
 
 
+class ModeMap:
+    """Compiled bidirectional mapping between Yandex modes and supported HA modes.
+
+    HA mode names are compared case-insensitively. When index fallback is set (no mode map in the entity
+    configuration), unmapped HA modes also match Yandex modes with the same name or by their position.
+    """
+
+    def __init__(
+        self,
+        modes_map: Mapping[ModeCapabilityMode, Iterable[str]],
+        index_fallback: Mapping[int, ModeCapabilityMode] | None,
+        supported_ha_modes: Sequence[str],
+    ):
+        """Compile the mapping."""
+        self.supported_ha_modes = tuple(supported_ha_modes)
+        self.index_fallback = index_fallback is not None
+
+        self._supported_ha_modes = frozenset(self.supported_ha_modes)
+        self._supported_ha_modes_lower: dict[str, str] = {}
+        for ha_mode in self.supported_ha_modes:
+            self._supported_ha_modes_lower.setdefault(ha_mode.lower(), ha_mode)
+
+        self._yandex_modes: dict[str, ModeCapabilityMode] = {}
+        for yandex_mode, names in modes_map.items():
+            for name in names:
+                self._yandex_modes.setdefault(name.lower(), yandex_mode)
+
+        self._yandex_modes_by_index: dict[str, ModeCapabilityMode] = {}
+        if index_fallback is not None:
+            for idx, ha_mode in enumerate(self.supported_ha_modes):
+                if idx in index_fallback:
+                    self._yandex_modes_by_index.setdefault(ha_mode, index_fallback[idx])
+
+        self._ha_modes: dict[ModeCapabilityMode, str] = {}
+        for yandex_mode in ModeCapabilityMode if index_fallback is not None else modes_map:
+            names = list(modes_map.get(yandex_mode, []))
+            if index_fallback is not None:
+                names.append(yandex_mode.value)
+
+            for name in names:
+                if (supported_ha_mode := self._supported_ha_modes_lower.get(name.lower())) is not None:
+                    self._ha_modes[yandex_mode] = supported_ha_mode
+                    break
+
+        if index_fallback is not None:
+            for idx, yandex_mode in index_fallback.items():
+                if idx < len(self.supported_ha_modes):
+                    self._ha_modes.setdefault(yandex_mode, self.supported_ha_modes[idx])
+
+        self.supported_yandex_modes = sorted(
+            {m for m, _ in (self.get_yandex_mode(ha_mode) for ha_mode in self.supported_ha_modes) if m is not None}
+        )
+
+    def get_yandex_mode(self, ha_mode: str) -> tuple[ModeCapabilityMode | None, bool]:
+        """Return Yandex mode for HA mode and whether the mode is found in the modes mapping (not by a fallback)."""
+        ha_mode_lower = ha_mode.lower()
+        if (mode := self._yandex_modes.get(ha_mode_lower)) is not None:
+            return mode, True
+
+        if not self.index_fallback:
+            return None, False
+
+        if (mode := _YANDEX_MODES_BY_VALUE.get(ha_mode_lower)) is not None or ha_mode_lower == STATE_OFF:
+            return mode, False
+
+        return self._yandex_modes_by_index.get(ha_mode), False
+
+    def get_ha_mode(self, yandex_mode: ModeCapabilityMode) -> str | None:
+        """Return HA mode for Yandex mode."""
+        return self._ha_modes.get(yandex_mode)
+
+    def is_supported(self, ha_mode: str) -> bool:
+        """Test if HA mode is supported (case-sensitive)."""
+        return ha_mode in self._supported_ha_modes
+
+    def is_supported_lower(self, ha_mode: str) -> bool:
+        """Test if HA mode is supported (case-insensitive)."""
+        return ha_mode.lower() in self._supported_ha_modes_lower
+
+
+@lru_cache(maxsize=MODE_MAPS_CACHE_SIZE)
+def _get_mode_map(
+    capability_type: type["ModeCapability"],
+    instance: ModeCapabilityInstance,
+    modes_map_config: tuple[tuple[ModeCapabilityMode, tuple[str, ...]], ...],
+    supported_ha_modes: tuple[str, ...],
+) -> ModeMap:
+    """Return compiled modes mapping shared by all capabilities with the same class, instance and configuration."""
+    if modes_map_config:
+        return ModeMap(dict(modes_map_config), None, supported_ha_modes)
+
+    return ModeMap(capability_type._modes_map_default, capability_type._modes_map_index_fallback, supported_ha_modes)
+
+
 class ModeCapability(Capability[ModeCapabilityInstanceActionState], Protocol):
     """Base class for capabilities with mode functionality like thermostat mode or fan speed.
 
@@ -179,12 +276,7 @@ class ModeCapability(Capability[ModeCapabilityInstanceActionState], Protocol):
     @property
     def supported_yandex_modes(self) -> list[ModeCapabilityMode]:
         """Returns a list of supported Yandex modes."""
-        modes = set()
-        for ha_value in self.supported_ha_modes:
-            if value := self.get_yandex_mode_by_ha_mode(ha_value, hide_warnings=True):
-                modes.add(value)
-
-        return sorted(modes)
+        return list(self._mode_map.supported_yandex_modes)
 
     @property
     def supported_ha_modes(self) -> list[str]:
@@ -209,32 +301,18 @@ class ModeCapability(Capability[ModeCapabilityInstanceActionState], Protocol):
 
     def get_yandex_mode_by_ha_mode(self, ha_mode: str, hide_warnings: bool = False) -> ModeCapabilityMode | None:
         """Return Yandex mode for HA mode."""
-        mode = None
-        for yandex_mode, names in self.modes_map.items():
-            if ha_mode.lower() in [n.lower() for n in names]:
-                mode = yandex_mode
-                break
+        mode_map = self._mode_map
+        mode, mapped = mode_map.get_yandex_mode(ha_mode)
 
-        if mode is not None and ha_mode not in self.supported_ha_modes:
+        if mapped and not mode_map.is_supported(ha_mode):
             raise APIError(
                 ResponseCode.INVALID_VALUE,
-                f"Unsupported HA mode '{ha_mode}' for {self}: not in {self.supported_ha_modes}",
+                f"Unsupported HA mode '{ha_mode}' for {self}: not in {list(mode_map.supported_ha_modes)}",
             )
 
-        if not self.modes_map_config:
-            if mode is None:
-                with suppress(ValueError):
-                    mode = ModeCapabilityMode(ha_mode.lower())
-
-            if mode is None and ha_mode.lower() != STATE_OFF:
-                try:
-                    mode = self._modes_map_index_fallback[self.supported_ha_modes.index(ha_mode)]
-                except (IndexError, ValueError, KeyError):
-                    pass
-
         if mode is None and not hide_warnings:
             if ha_mode.lower() not in (STATE_OFF, STATE_UNAVAILABLE, STATE_UNKNOWN, STATE_NONE):
-                if ha_mode.lower() in [m.lower() for m in self.supported_ha_modes]:
+                if mode_map.is_supported_lower(ha_mode):
                     _LOGGER.warning(
                         f"Failed to get Yandex mode for mode '{ha_mode}' for {self}. "
                         f"It may cause inconsistencies between Yandex and HA. "
@@ -245,19 +323,8 @@ class ModeCapability(Capability[ModeCapabilityInstanceActionState], Protocol):
 
     def get_ha_mode_by_yandex_mode(self, yandex_mode: ModeCapabilityMode) -> str:
         """Return HA mode for Yandex mode."""
-        ha_modes = self.modes_map.get(yandex_mode, [])
-        if not self.modes_map_config:
-            ha_modes.append(yandex_mode.value)
-
-        for ha_mode in ha_modes:
-            for am in self.supported_ha_modes:
-                if am.lower() == ha_mode.lower():
-                    return am
-
-        if not self.modes_map_config:
-            for ha_idx, yandex_mode_idx in self._modes_map_index_fallback.items():
-                if yandex_mode_idx == yandex_mode:
-                    return self.supported_ha_modes[ha_idx]
+        if (ha_mode := self._mode_map.get_ha_mode(yandex_mode)) is not None:
+            return ha_mode
 
         raise APIError(
             ResponseCode.INVALID_VALUE,
@@ -269,6 +336,18 @@ class ModeCapability(Capability[ModeCapabilityInstanceActionState], Protocol):
         """Return the current capability value."""
         ...
 
+    @cached_property
+    def _mode_map(self) -> ModeMap:
+        """Return compiled modes mapping for the supported HA modes."""
+        modes_map_config: tuple[tuple[ModeCapabilityMode, tuple[str, ...]], ...] = ()
+        if CONF_ENTITY_MODE_MAP in self._entity_config:
+            modes_map_config = tuple(
+                (ModeCapabilityMode(k), tuple(v))
+                for k, v in self._entity_config[CONF_ENTITY_MODE_MAP].get(self.instance, {}).items()
+            )
+
+        return _get_mode_map(type(self), self.instance, modes_map_config, tuple(map(str, self._ha_modes)))
+
     @property
     @abstractmethod
     def _ha_modes(self) -> Iterable[Any]:
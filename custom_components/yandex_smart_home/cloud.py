@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from asyncio import TimeoutError
+from asyncio import Semaphore, Task, TimeoutError
 from datetime import datetime, timedelta
 import logging
 from typing import TYPE_CHECKING, Any, AsyncIterable, cast
 
 from aiohttp import ClientConnectorError, ClientResponseError, ClientWebSocketResponse, WSMessage, WSMsgType, hdrs
-from homeassistant.core import CALLBACK_TYPE, Context, HassJob, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Context, HassJob, HomeAssistant, callback
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE, async_create_clientsession, async_get_clientsession
 from homeassistant.helpers.event import async_call_later
@@ -28,6 +28,7 @@ DEFAULT_RECONNECTION_DELAY = 2
 MAX_RECONNECTION_DELAY = 180
 FAST_RECONNECTION_TIME = timedelta(seconds=6)
 FAST_RECONNECTION_THRESHOLD = 5
+MAX_IN_FLIGHT_REQUESTS = 8
 BASE_API_URL = f"{CLOUD_BASE_URL}/api/home_assistant/v1"
 
 
@@ -68,6 +69,10 @@ class CloudManager:
         self._ws_reconnect_delay = DEFAULT_RECONNECTION_DELAY
         self._ws_active = True
         self._unsub_connect: CALLBACK_TYPE | None = None
+        self._in_flight_slots = Semaphore(MAX_IN_FLIGHT_REQUESTS)
+        self._in_flight_requests = 0
+        self._queued_requests = 0
+        self._request_tasks: set[Task[None]] = set()
 
         self._url = f"{BASE_API_URL}/connect"
 
@@ -92,7 +97,7 @@ class CloudManager:
 
             async for msg in cast(AsyncIterable[WSMessage], self._ws):
                 if msg.type == WSMsgType.TEXT:
-                    await self._on_message(msg)
+                    self._on_message(self._ws, msg)
 
             _LOGGER.debug(f"Disconnected: {self._ws.close_code}")
             if self._ws.close_code is not None:
@@ -116,27 +121,81 @@ class CloudManager:
             self._unsub_connect()
             self._unsub_connect = None
 
+        for task in self._request_tasks:
+            task.cancel()
+
         return None
 
-    async def _on_message(self, message: WSMessage) -> None:
+    @property
+    def in_flight_requests(self) -> int:
+        """Return number of requests that are being handled."""
+        return self._in_flight_requests
+
+    @property
+    def queued_requests(self) -> int:
+        """Return number of requests that are waiting for a free slot in the in-flight window."""
+        return self._queued_requests
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return diagnostics for the cloud connection."""
+        return {
+            "in_flight_requests": self.in_flight_requests,
+            "queued_requests": self.queued_requests,
+        }
+
+    @callback
+    def _on_message(self, ws: ClientWebSocketResponse, message: WSMessage) -> None:
         """Handle incoming request from the cloud."""
         request = CloudRequest.parse_raw(message.data)
         _LOGGER.debug("Request: %s (message: %s)" % (request.action, request.message))
 
-        data = RequestData(
-            entry_data=self._entry_data,
-            context=Context(user_id=await self._entry_data.async_get_context_user_id()),
-            platform=request.platform,
-            request_user_id=self._entry_data.cloud_instance_id,
-            request_id=request.request_id,
+        task = self._hass.async_create_task(
+            self._async_handle_request(ws, request), f"{DOMAIN} cloud request {request.request_id}", eager_start=True
         )
+        if not task.done():
+            self._request_tasks.add(task)
+            task.add_done_callback(self._request_tasks.discard)
+
+        return None
 
-        result = await handlers.async_handle_request(self._hass, data, request.action, request.message)
-        response = result.as_json()
-        _LOGGER.debug(f"Response: {response}")
+    async def _async_handle_request(self, ws: ClientWebSocketResponse, request: CloudRequest) -> None:
+        """Handle the request and send the response tagged by request id."""
+        try:
+            self._queued_requests += 1
+            if self._in_flight_slots.locked():
+                _LOGGER.debug(f"Request {request.request_id} is queued ({self._queued_requests} requests waiting)")
+
+            try:
+                await self._in_flight_slots.acquire()
+            finally:
+                self._queued_requests -= 1
+
+            self._in_flight_requests += 1
+            try:
+                data = RequestData(
+                    entry_data=self._entry_data,
+                    context=Context(user_id=await self._entry_data.async_get_context_user_id()),
+                    platform=request.platform,
+                    request_user_id=self._entry_data.cloud_instance_id,
+                    request_id=request.request_id,
+                )
+
+                result = await handlers.async_handle_request(self._hass, data, request.action, request.message)
+            finally:
+                self._in_flight_requests -= 1
+                self._in_flight_slots.release()
+
+            response = result.as_json()
+            _LOGGER.debug(f"Response: {response}")
+
+            if ws.closed:
+                _LOGGER.debug(f"Connection closed, response for request {request.request_id} is dropped")
+                return None
+
+            await ws.send_str(response)
+        except Exception:
+            _LOGGER.exception(f"Failed to handle request {request.request_id}")
 
-        assert self._ws is not None
-        await self._ws.send_str(response)
         return None
 
     def _try_reconnect(self) -> None:
@@ -1,9 +1,10 @@
 """Color manipulation helpers."""
 
+from collections.abc import Mapping, Sequence
 from enum import StrEnum
-from functools import cached_property
-from math import sqrt
-from typing import Final, Protocol, Self
+from functools import cached_property, lru_cache
+from itertools import product
+from typing import Any, Final, Protocol, Self
 
 from homeassistant.components.light import (
     ATTR_EFFECT_LIST,
@@ -20,7 +21,15 @@ from homeassistant.components.light import (
 from homeassistant.core import State
 from homeassistant.util.color import RGBColor, color_hs_to_RGB, color_xy_to_RGB
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
 SOLID_LIGHT_EFFECT: Final = "Solid"
+BULK_NUMPY_MIN_SIZE: Final = 16
+CONVERTERS_CACHE_SIZE: Final = 256
+COLOR_MATCH_DISTANCE: Final = 2
 
 
 class ColorName(StrEnum):
@@ -90,7 +99,7 @@ class ColorProfiles(dict[str, ColorProfile]):
     @classmethod
     def from_dict(cls, data: dict[str, dict[str, int]]) -> Self:
         """Intialize the color profiles from a dict."""
-        profiles = cls._default_profiles.copy()
+        profiles = {name: profile.copy() for name, profile in cls._default_profiles.items()}
         for profile_name, mapping in data.items():
             profiles.setdefault(profile_name, {})
             profiles[profile_name].update({ColorName(name): v for name, v in mapping.items()})
@@ -121,6 +130,12 @@ class ColorConverter:
         ColorName.RASPBERRY: 16711765,
     }
 
+    _match_offsets = [
+        (r, g, b)
+        for r, g, b in product(range(-COLOR_MATCH_DISTANCE, COLOR_MATCH_DISTANCE + 1), repeat=3)
+        if r**2 + g**2 + b**2 <= COLOR_MATCH_DISTANCE**2
+    ]
+
     def __init__(self, profile: ColorProfile | None = None):
         """Initialize the color converter from color profile."""
         profile = profile or {}
@@ -134,22 +149,28 @@ class ColorConverter:
             self._yandex_mapping[yandex_value] = ha_value
             self._ha_mapping[ha_value] = yandex_value
 
+        self._ha_lookup = self._get_ha_lookup()
+
     def get_ha_color(self, yandex_color: int) -> RGBColor:
         """Return HA color for Yandex color."""
         return int_to_rgb(self._yandex_mapping.get(yandex_color, yandex_color))
 
     def get_yandex_color(self, ha_color: RGBColor) -> int:
         """Return Yandex color for HA color."""
-        for from_ha_value, to_yandex_value in self._ha_mapping.items():
-            if self._distance(ha_color, int_to_rgb(from_ha_value)) <= 2:
-                return to_yandex_value
+        value = rgb_to_int(ha_color)
+        return self._ha_lookup.get(value, value)
 
-        return rgb_to_int(ha_color)
+    def _get_ha_lookup(self) -> dict[int, int]:
+        """Return Yandex colors for all HA colors close to the mapped ones, the first mapped color wins."""
+        lookup: dict[int, int] = {}
+        for ha_value, yandex_value in self._ha_mapping.items():
+            color = int_to_rgb(ha_value)
+            for dr, dg, db in self._match_offsets:
+                r, g, b = color.r + dr, color.g + dg, color.b + db
+                if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255:
+                    lookup.setdefault((r << 16) + (g << 8) + b, yandex_value)
 
-    @staticmethod
-    def _distance(a: RGBColor, b: RGBColor) -> float:
-        """Return a distance between two colors."""
-        return abs(sqrt((a.r - b.r) ** 2 + (a.g - b.g) ** 2 + (a.b - b.b) ** 2))
+        return lookup
 
 
 class ColorTemperatureConverter:
@@ -169,16 +190,16 @@ class ColorTemperatureConverter:
     }
     _temperature_steps = sorted(_palette.values())
 
-    def __init__(self, profile: ColorProfile | None, state: State):
-        """Initialize the color temperature converter from color profile."""
+    def __init__(self, profile: ColorProfile | None, min_color_temp: int, max_color_temp: int):
+        """Initialize the color temperature converter from color profile and supported kelvin range."""
 
         self._yandex_mapping: dict[int, int] = {}
         self._ha_mapping: dict[int, int] = {}
 
         profile = profile or {}
         range_extend_threshold = 200
-        min_color_temp = self._round_color_temperature(int(state.attributes.get(ATTR_MIN_COLOR_TEMP_KELVIN, 2000)))
-        max_color_temp = self._round_color_temperature(int(state.attributes.get(ATTR_MAX_COLOR_TEMP_KELVIN, 6500)))
+        min_color_temp = self._round_color_temperature(min_color_temp)
+        max_color_temp = self._round_color_temperature(max_color_temp)
 
         for color_name, yandex_value in self._palette.items():
             ha_value = self._round_color_temperature(profile.get(color_name, yandex_value))
@@ -247,6 +268,151 @@ class ColorTemperatureConverter:
         return None
 
 
+def get_color_converter(profile: ColorProfile | None) -> ColorConverter:
+    """Return a shared color converter for the color profile."""
+    return _get_color_converter(tuple((profile or {}).items()))
+
+
+@lru_cache(maxsize=CONVERTERS_CACHE_SIZE)
+def _get_color_converter(profile: tuple[tuple[ColorName, int], ...]) -> ColorConverter:
+    """Return a color converter for the color profile items."""
+    return ColorConverter(dict(profile))
+
+
+def get_color_temperature_converter(profile: ColorProfile | None, state: State) -> ColorTemperatureConverter:
+    """Return a shared color temperature converter for the color profile and kelvin range of the state."""
+    return _get_color_temperature_converter(
+        tuple((profile or {}).items()),
+        ColorTemperatureConverter._round_color_temperature(int(state.attributes.get(ATTR_MIN_COLOR_TEMP_KELVIN, 2000))),
+        ColorTemperatureConverter._round_color_temperature(int(state.attributes.get(ATTR_MAX_COLOR_TEMP_KELVIN, 6500))),
+    )
+
+
+@lru_cache(maxsize=CONVERTERS_CACHE_SIZE)
+def _get_color_temperature_converter(
+    profile: tuple[tuple[ColorName, int], ...], min_color_temp: int, max_color_temp: int
+) -> ColorTemperatureConverter:
+    """Return a color temperature converter for the color profile items and kelvin range."""
+    return ColorTemperatureConverter(dict(profile), min_color_temp, max_color_temp)
+
+
+def hs_to_rgb_colors(hs_colors: Sequence[tuple[float, float]]) -> list[RGBColor]:
+    """Convert hs colors to RGB colors, the result is the same as of color_hs_to_RGB."""
+    if np is None or len(hs_colors) < BULK_NUMPY_MIN_SIZE:
+        return [RGBColor(*color_hs_to_RGB(*hs_color)) for hs_color in hs_colors]
+
+    hs = np.asarray(hs_colors, dtype=np.float64).reshape(-1, 2)
+    h = (hs[:, 0] / 360) * 6.0
+    s = hs[:, 1] / 100
+    i = np.trunc(h)
+    f = h - i
+    p = 1.0 - s
+    q = 1.0 - s * f
+    t = 1.0 - s * (1.0 - f)
+    v = np.ones_like(s)
+    sector = np.mod(i, 6).astype(np.intp)
+
+    # same sectors as in colorsys.hsv_to_rgb
+    rgb = np.choose(
+        sector[:, None],
+        [
+            np.stack([v, t, p], axis=1),
+            np.stack([q, v, p], axis=1),
+            np.stack([p, v, t], axis=1),
+            np.stack([p, q, v], axis=1),
+            np.stack([t, p, v], axis=1),
+            np.stack([v, p, q], axis=1),
+        ],
+    )
+    return [RGBColor(*c) for c in np.rint(rgb * 255).astype(int).tolist()]
+
+
+def xy_to_rgb_colors(xy_colors: Sequence[tuple[float, float]]) -> list[RGBColor]:
+    """Convert xy colors to RGB colors, the result is the same as of color_xy_to_RGB without a gamut."""
+    if np is None or len(xy_colors) < BULK_NUMPY_MIN_SIZE:
+        return [RGBColor(*color_xy_to_RGB(*xy_color, Gamut=None)) for xy_color in xy_colors]
+
+    xy = np.asarray(xy_colors, dtype=np.float64).reshape(-1, 2)
+    x = xy[:, 0]
+    y = np.where(xy[:, 1] == 0.0, xy[:, 1] + 0.00000000001, xy[:, 1])
+    brightness = 1.0
+
+    # same operations as in color_xy_brightness_to_RGB with full brightness
+    vx = (brightness / y) * x
+    vz = (brightness / y) * (1 - x - y)
+    rgb = np.stack(
+        [
+            vx * 1.656492 - brightness * 0.354851 - vz * 0.255038,
+            -vx * 0.707196 + brightness * 1.655397 + vz * 0.036152,
+            vx * 0.051713 - brightness * 0.121364 + vz * 1.011530,
+        ],
+        axis=1,
+    )
+    rgb = np.where(
+        rgb <= 0.0031308,
+        12.92 * rgb,
+        (1.0 + 0.055) * np.power(np.maximum(rgb, 0.0031308), (1.0 / 2.4)) - 0.055,
+    )
+    rgb = np.maximum(rgb, 0)
+    max_component = rgb.max(axis=1, keepdims=True)
+    rgb = np.where(max_component > 1, rgb / np.maximum(max_component, 1), rgb)
+    return [RGBColor(*c) for c in np.trunc(rgb * 255).astype(int).tolist()]
+
+
+def get_rgb_colors(states: Sequence[State]) -> list[RGBColor | None]:
+    """Return current RGB colors of light states, hs and xy colors are converted in bulk."""
+    rgb_colors: list[RGBColor | None] = [None] * len(states)
+    hs_indexes: list[int] = []
+    hs_colors: list[tuple[float, float]] = []
+    xy_indexes: list[int] = []
+    xy_colors: list[tuple[float, float]] = []
+
+    for idx, state in enumerate(states):
+        match _get_light_color(state.attributes, set(state.attributes.get(ATTR_SUPPORTED_COLOR_MODES, []))):
+            case (ColorMode.RGB, rgb_color):
+                rgb_colors[idx] = RGBColor(*rgb_color)
+            case (ColorMode.HS, hs_color):
+                hs_indexes.append(idx)
+                hs_colors.append(hs_color)
+            case (ColorMode.XY, xy_color):
+                xy_indexes.append(idx)
+                xy_colors.append(xy_color)
+
+    for indexes, colors in ((hs_indexes, hs_to_rgb_colors(hs_colors)), (xy_indexes, xy_to_rgb_colors(xy_colors))):
+        for idx, color in zip(indexes, colors):
+            rgb_colors[idx] = color
+
+    return rgb_colors
+
+
+def _get_light_color(
+    attributes: Mapping[str, Any], supported_color_modes: set[ColorMode]
+) -> tuple[ColorMode, Any] | None:
+    """Return a color mode and a color value the RGB color of a light is calculated from."""
+    rgb_color: tuple[int, ...] | None = None
+
+    if ColorMode.RGBWW in supported_color_modes:
+        rgb_color = attributes.get(ATTR_RGBWW_COLOR)
+    elif ColorMode.RGBW in supported_color_modes:
+        rgb_color = attributes.get(ATTR_RGBW_COLOR)
+    else:
+        rgb_color = attributes.get(ATTR_RGB_COLOR)
+
+    if rgb_color:
+        return ColorMode.RGB, rgb_color[:3]
+
+    if ColorMode.HS in supported_color_modes:
+        hs_color: tuple[float, float] | None = attributes.get(ATTR_HS_COLOR)
+        if hs_color:
+            return ColorMode.HS, hs_color
+
+    xy_color: tuple[float, float] | None = attributes.get(ATTR_XY_COLOR)
+    if xy_color:
+        return ColorMode.XY, xy_color
+
+    return None
+
+
 class LightState(Protocol):
     """Helper class for the state of a light device."""
 
@@ -260,29 +426,20 @@ class LightState(Protocol):
     @cached_property
     def _rgb_color(self) -> RGBColor | None:
         """Return current RGB color."""
-        rgb_color: tuple[int, ...] | None = None
-
-        if ColorMode.RGBWW in self._supported_color_modes:
-            rgb_color = self.state.attributes.get(ATTR_RGBWW_COLOR)
-        elif ColorMode.RGBW in self._supported_color_modes:
-            rgb_color = self.state.attributes.get(ATTR_RGBW_COLOR)
-        else:
-            rgb_color = self.state.attributes.get(ATTR_RGB_COLOR)
-
-        if rgb_color:
-            return RGBColor(*rgb_color[:3])
-
-        if ColorMode.HS in self._supported_color_modes:
-            hs_color: tuple[float, float] | None = self.state.attributes.get(ATTR_HS_COLOR)
-            if hs_color:
-                return RGBColor(*color_hs_to_RGB(*hs_color))
-
-        xy_color: tuple[float, float] | None = self.state.attributes.get(ATTR_XY_COLOR)
-        if xy_color:
-            return RGBColor(*color_xy_to_RGB(*xy_color, Gamut=None))
+        match _get_light_color(self.state.attributes, self._supported_color_modes):
+            case (ColorMode.RGB, rgb_color):
+                return RGBColor(*rgb_color)
+            case (ColorMode.HS, hs_color):
+                return RGBColor(*color_hs_to_RGB(hs_color[0], hs_color[1]))
+            case (ColorMode.XY, xy_color):
+                return RGBColor(*color_xy_to_RGB(xy_color[0], xy_color[1], Gamut=None))
 
         return None
 
+    def set_rgb_color(self, rgb_color: RGBColor | None) -> None:
+        """Set current RGB color calculated in bulk for the same state."""
+        self._rgb_color = rgb_color
+
     @cached_property
     def _white_brightness(self) -> int | None:
         """Return current white brightness or cold white brightness."""
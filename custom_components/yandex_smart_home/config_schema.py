@@ -44,14 +44,24 @@ from .const import (
     CONF_ENTITY_RANGE_MAX,
     CONF_ENTITY_RANGE_MIN,
     CONF_ENTITY_RANGE_PRECISION,
+    CONF_ENTITY_REPORT_FILTER,
+    CONF_ENTITY_REPORT_FILTER_DEADBAND,
+    CONF_ENTITY_REPORT_FILTER_MIN_INTERVAL,
+    CONF_ENTITY_TEMPLATE_RATE_LIMIT,
     CONF_ERROR_CODE_TEMPLATE,
     CONF_FEATURES,
     CONF_FILTER,
     CONF_NOTIFIER,
+    CONF_NOTIFIER_CHUNK_DEVICES,
+    CONF_NOTIFIER_CHUNK_SIZE,
     CONF_NOTIFIER_OAUTH_TOKEN,
+    CONF_NOTIFIER_SENSORS,
     CONF_NOTIFIER_SKILL_ID,
+    CONF_NOTIFIER_SPOOL,
     CONF_NOTIFIER_USER_ID,
+    CONF_PARALLEL_ACTIONS,
     CONF_PRESSURE_UNIT,
+    CONF_SERIALIZER,
     CONF_SETTINGS,
     CONF_SLOW,
     CONF_STATE_UNKNOWN,
@@ -72,6 +82,7 @@ from .schema import (
     RangeCapabilityInstance,
     ToggleCapabilityInstance,
 )
+from .schema.base import SerializerBackend
 from .schema.property_event import get_supported_events_for_instance
 from .unit_conversion import UnitOfPressure, UnitOfTemperature
 
@@ -221,6 +232,35 @@ def event_map(value: dict[str, dict[str, list[str]]]) -> dict[str, dict[str, lis
     return value
 
 
+def float_instance(value: str) -> str:
+    try:
+        FloatPropertyInstance(value)
+    except ValueError:
+        _LOGGER.error(
+            f"Float instance '{value}' is not supported, "
+            f"see valid values at https://docs.yaha-cloud.ru/v1.0.x/devices/sensor/float/#type"
+        )
+        raise vol.Invalid(f"Float instance '{value}' is not supported")
+
+    return value
+
+
+def report_deadband(value: Any) -> float | str:
+    """Validate absolute (number) or relative (percent of the last reported value) deadband."""
+    if isinstance(value, str) and value.strip().endswith("%"):
+        percent = vol.Coerce(float)(value.strip()[:-1].strip())
+        if percent < 0:
+            raise vol.Invalid("Deadband must not be negative")
+
+        return f"{percent}%"
+
+    deadband = float(vol.Coerce(float)(value))
+    if deadband < 0:
+        raise vol.Invalid("Deadband must not be negative")
+
+    return deadband
+
+
 def toggle_instance(value: str) -> str:
     try:
         ToggleCapabilityInstance(value)
@@ -351,6 +391,17 @@ ENTITY_RANGE_SCHEMA = vol.Schema(
     },
 )
 
+ENTITY_REPORT_FILTER_SCHEMA = vol.Schema(
+    {
+        vol.All(cv.string, float_instance): vol.Schema(
+            {
+                vol.Optional(CONF_ENTITY_REPORT_FILTER_DEADBAND): report_deadband,
+                vol.Optional(CONF_ENTITY_REPORT_FILTER_MIN_INTERVAL): cv.positive_time_period,
+            }
+        )
+    }
+)
+
 ENTITY_CUSTOM_MODE_SCHEMA = vol.Schema(
     {
         vol.All(cv.string, mode_instance): vol.Any(
@@ -429,6 +480,8 @@ ENTITY_SCHEMA = vol.All(
             vol.Optional(CONF_ENTITY_RANGE): ENTITY_RANGE_SCHEMA,
             vol.Optional(CONF_ENTITY_MODE_MAP): ENTITY_MODE_MAP_SCHEMA,
             vol.Optional(CONF_ENTITY_EVENT_MAP): vol.All(ENTITY_EVENT_MAP_SCHEMA, event_map),
+            vol.Optional(CONF_ENTITY_REPORT_FILTER): ENTITY_REPORT_FILTER_SCHEMA,
+            vol.Optional(CONF_ENTITY_TEMPLATE_RATE_LIMIT): cv.positive_time_period,
             vol.Optional(CONF_ENTITY_CUSTOM_MODES): ENTITY_CUSTOM_MODE_SCHEMA,
             vol.Optional(CONF_ENTITY_CUSTOM_TOGGLES): ENTITY_CUSTOM_TOGGLE_SCHEMA,
             vol.Optional(CONF_ENTITY_CUSTOM_RANGES): ENTITY_CUSTOM_RANGE_SCHEMA,
@@ -451,6 +504,12 @@ SETTINGS_SCHEMA = vol.All(
         vol.Optional(CONF_PRESSURE_UNIT): cv.string,
         vol.Optional(CONF_BETA): cv.boolean,
         vol.Optional(CONF_CLOUD_STREAM): cv.boolean,
+        vol.Optional(CONF_PARALLEL_ACTIONS): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_SERIALIZER): vol.Coerce(SerializerBackend),
+        vol.Optional(CONF_NOTIFIER_SPOOL): cv.boolean,
+        vol.Optional(CONF_NOTIFIER_CHUNK_DEVICES): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_NOTIFIER_CHUNK_SIZE): vol.All(vol.Coerce(int), vol.Range(min=1024)),
+        vol.Optional(CONF_NOTIFIER_SENSORS): cv.boolean,
     },
 )
 
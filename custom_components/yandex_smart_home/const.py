@@ -8,6 +8,12 @@ CONF_SETTINGS = "settings"
 CONF_PRESSURE_UNIT = "pressure_unit"
 CONF_BETA = "beta"
 CONF_CLOUD_STREAM = "cloud_stream"
+CONF_PARALLEL_ACTIONS = "parallel_actions"
+CONF_SERIALIZER = "serializer"
+CONF_NOTIFIER_SPOOL = "notifier_spool"
+CONF_NOTIFIER_CHUNK_DEVICES = "notifier_chunk_devices"
+CONF_NOTIFIER_CHUNK_SIZE = "notifier_chunk_size"
+CONF_NOTIFIER_SENSORS = "notifier_sensors"
 CONF_CONNECTION_TYPE = "connection_type"
 CONF_CLOUD_INSTANCE = "cloud_instance"
 CONF_CLOUD_INSTANCE_ID = "id"
@@ -45,6 +51,10 @@ CONF_ENTITY_RANGE_MAX = "max"
 CONF_ENTITY_RANGE_PRECISION = "precision"
 CONF_ENTITY_MODE_MAP = "modes"
 CONF_ENTITY_EVENT_MAP = "events"
+CONF_ENTITY_REPORT_FILTER = "report_filter"
+CONF_ENTITY_REPORT_FILTER_DEADBAND = "deadband"
+CONF_ENTITY_REPORT_FILTER_MIN_INTERVAL = "min_interval"
+CONF_ENTITY_TEMPLATE_RATE_LIMIT = "template_rate_limit"
 CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ENTITY_ID = "state_entity_id"
 CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ATTRIBUTE = "state_attribute"
 CONF_ENTITY_CUSTOM_MODES = "custom_modes"
@@ -76,6 +86,7 @@ CLOUD_BASE_URL = "https://yaha-cloud.ru"
 CLOUD_STREAM_BASE_URL = "https://stream.yaha-cloud.ru"
 
 EVENT_DEVICE_ACTION = "yandex_smart_home_device_action"
+SIGNAL_NOTIFIERS_SETUP = "yandex_smart_home_notifiers_setup_{}"
 ATTR_CAPABILITY = "capability"
 ATTR_ERROR_CODE = "error_code"
 
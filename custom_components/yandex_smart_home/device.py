@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 import logging
 import re
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.components import (
     air_quality,
@@ -53,6 +55,7 @@ from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.helpers.area_registry import AreaEntry
 from homeassistant.helpers.entity_registry import RegistryEntry
 from homeassistant.helpers.template import Template
+from homeassistant.util.color import RGBColor
 
 from . import (  # noqa: F401
     capability_color,
@@ -67,8 +70,10 @@ from . import (  # noqa: F401
     property_float,
 )
 from .capability import STATE_CAPABILITIES_REGISTRY, Capability, DummyCapability, StateCapability
+from .capability_color import ColorTemperatureCapability, RGBColorCapability
 from .capability_custom import get_custom_capability
 from .capability_toggle import BacklightCapability
+from .color import get_rgb_colors
 from .const import (
     CONF_BACKLIGHT_ENTITY_ID,
     CONF_ENTITY_CUSTOM_MODES,
@@ -101,6 +106,8 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+BULK_COLOR_CONVERSION_MIN_LIGHTS: Final = 8
+
 _DOMAIN_TO_DEVICE_TYPES: dict[str, DeviceType] = {
     air_quality.DOMAIN: DeviceType.SENSOR,
     automation.DOMAIN: DeviceType.OTHER,
@@ -168,6 +175,57 @@ _DEVICE_CLASS_TO_DEVICE_TYPES: dict[tuple[str, str], DeviceType] = {
 type DeviceId = str
 
 
+@dataclass
+class DevicePlan:
+    """Registry types of capabilities and properties supported by a device state.
+
+    The plan is valid as long as the state attributes and cached attribute values are unchanged.
+    """
+
+    entity_id: str
+    attributes: Mapping[str, Any]
+    cache_revision: int
+    capability_registry: list[type[StateCapability[Any]]] | None = None
+    capability_types: list[type[StateCapability[Any]]] = field(default_factory=list)
+    property_registry: list[type[StateProperty]] | None = None
+    property_types: list[type[StateProperty]] = field(default_factory=list)
+
+    def matches(self, state: State, cache_revision: int) -> bool:
+        """Test if the plan was built for the state."""
+        return (
+            self.entity_id == state.entity_id
+            and self.cache_revision == cache_revision
+            and (self.attributes is state.attributes or self.attributes == state.attributes)
+        )
+
+
+class DevicePlanCache:
+    """Cache of device plans for a config entry."""
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._plans: dict[str, DevicePlan] = {}
+
+    @callback
+    def async_get(self, device_id: str, state: State, cache_revision: int) -> DevicePlan:
+        """Return a plan for the device state, a new empty one is created if the cached plan is outdated."""
+        plan = self._plans.get(device_id)
+        if plan is None or not plan.matches(state, cache_revision):
+            plan = self._plans[device_id] = DevicePlan(state.entity_id, state.attributes, cache_revision)
+
+        return plan
+
+    @callback
+    def async_invalidate(self, device_id: str | None = None) -> None:
+        """Drop a plan for the device or all plans."""
+        if device_id is None:
+            self._plans.clear()
+        else:
+            self._plans.pop(device_id, None)
+
+        return None
+
+
 class Device:
     """Represent user device."""
 
@@ -188,23 +246,24 @@ class Device:
     def get_capabilities(self) -> list[Capability[Any]]:
         """Return all capabilities of the device."""
         capabilities: list[Capability[Any]] = []
-        disabled_capabilities: list[Capability[Any]] = []
+        seen_keys: set[tuple[str, str, str]] = set()
 
         def _append_capabilities(_capability: Capability[Any]) -> None:
-            if _capability.supported and _capability not in capabilities and _capability not in disabled_capabilities:
+            if _capability.supported and _capability.key not in seen_keys:
                 capabilities.append(_capability)
+                seen_keys.add(_capability.key)
 
         if (state_template := self._config.get(CONF_STATE_TEMPLATE)) is not None:
-            capabilities.append(
-                get_custom_capability(
-                    self._hass,
-                    self._entry_data,
-                    {CONF_STATE_TEMPLATE: state_template},
-                    CapabilityType.ON_OFF,
-                    OnOffCapabilityInstance.ON,
-                    self.id,
-                )
+            state_template_capability = get_custom_capability(
+                self._hass,
+                self._entry_data,
+                {CONF_STATE_TEMPLATE: state_template},
+                CapabilityType.ON_OFF,
+                OnOffCapabilityInstance.ON,
+                self.id,
             )
+            capabilities.append(state_template_capability)
+            seen_keys.add(state_template_capability.key)
 
         for capability_type, config_key in (
             (CapabilityType.MODE, CONF_ENTITY_CUSTOM_MODES),
@@ -216,8 +275,8 @@ class Device:
                     capability_config = self._config[config_key][instance]
                     match capability_config:
                         case False:
-                            disabled_capabilities.append(
-                                DummyCapability(self._hass, self._entry_data, capability_type, instance, self.id)
+                            seen_keys.add(
+                                DummyCapability(self._hass, self._entry_data, capability_type, instance, self.id).key
                             )
                         case dict():
                             custom_capability = get_custom_capability(
@@ -231,9 +290,22 @@ class Device:
 
                             _append_capabilities(custom_capability)
 
-        for CapabilityT in STATE_CAPABILITIES_REGISTRY:
+        plan = self._get_plan()
+        capability_types: list[type[StateCapability[Any]]] = STATE_CAPABILITIES_REGISTRY
+        if plan.capability_registry is STATE_CAPABILITIES_REGISTRY:
+            capability_types = plan.capability_types
+
+        supported_capability_types: list[type[StateCapability[Any]]] = []
+        for CapabilityT in capability_types:
             state_capability = CapabilityT(self._hass, self._entry_data, self.id, self._state)
-            _append_capabilities(state_capability)
+            if state_capability.supported:
+                supported_capability_types.append(CapabilityT)
+                if state_capability.key not in seen_keys:
+                    capabilities.append(state_capability)
+                    seen_keys.add(state_capability.key)
+
+        plan.capability_registry = STATE_CAPABILITIES_REGISTRY
+        plan.capability_types = supported_capability_types
 
         if backlight_entity_id := self._config.get(CONF_BACKLIGHT_ENTITY_ID):
             backlight_state = self._hass.states.get(backlight_entity_id)
@@ -257,6 +329,7 @@ class Device:
     def get_properties(self) -> list[Property]:
         """Return all properties for the device."""
         properties: list[Property] = []
+        seen_keys: set[tuple[str, str, str]] = set()
 
         for property_config in self._config.get(CONF_ENTITY_PROPERTIES, []):
             try:
@@ -265,21 +338,35 @@ class Device:
                 _LOGGER.error(e)
                 continue
 
-            if custom_property and custom_property.supported and custom_property not in properties:
+            if custom_property and custom_property.supported and custom_property.key not in seen_keys:
                 properties.append(custom_property)
+                seen_keys.add(custom_property.key)
                 continue
 
             if event_platform_property_type := get_event_platform_custom_property_type(property_config):
                 event_platform_property = event_platform_property_type(
                     self._hass, self._entry_data, self.id, State(self.id, STATE_UNKNOWN)
                 )
-                if event_platform_property.supported and event_platform_property not in properties:
+                if event_platform_property.supported and event_platform_property.key not in seen_keys:
                     properties.append(event_platform_property)
+                    seen_keys.add(event_platform_property.key)
 
-        for PropertyT in STATE_PROPERTIES_REGISTRY:
+        plan = self._get_plan()
+        property_types: list[type[StateProperty]] = STATE_PROPERTIES_REGISTRY
+        if plan.property_registry is STATE_PROPERTIES_REGISTRY:
+            property_types = plan.property_types
+
+        supported_property_types: list[type[StateProperty]] = []
+        for PropertyT in property_types:
             device_property = PropertyT(self._hass, self._entry_data, self.id, self._state)
-            if device_property.supported and device_property not in properties:
-                properties.append(device_property)
+            if device_property.supported:
+                supported_property_types.append(PropertyT)
+                if device_property.key not in seen_keys:
+                    properties.append(device_property)
+                    seen_keys.add(device_property.key)
+
+        plan.property_registry = STATE_PROPERTIES_REGISTRY
+        plan.property_types = supported_property_types
 
         return properties
 
@@ -288,6 +375,11 @@ class Device:
         """Return properties for the device based on the state."""
         return [p for p in self.get_properties() if isinstance(p, StateProperty)]
 
+    @callback
+    def _get_plan(self) -> DevicePlan:
+        """Return registry types supported by the device state."""
+        return self._entry_data.device_plans.async_get(self.id, self._state, self._entry_data.cache.revision)
+
     @property
     def should_expose(self) -> bool:
         """Test if the device should be exposed."""
@@ -364,8 +456,8 @@ class Device:
         )
 
     @callback
-    def query(self) -> DeviceState:
-        """Return state of the device."""
+    def query(self, rgb_colors: Mapping[str, RGBColor | None] | None = None) -> DeviceState:
+        """Return state of the device, RGB colors of lights may be calculated in bulk beforehand."""
         check_availability = True
 
         if self.unavailable:
@@ -373,6 +465,10 @@ class Device:
 
         capabilities: list[CapabilityInstanceState] = []
         for c in self.get_capabilities():
+            if rgb_colors and isinstance(c, (RGBColorCapability, ColorTemperatureCapability)):
+                if c.state.entity_id in rgb_colors:
+                    c.set_rgb_color(rgb_colors[c.state.entity_id])
+
             if c.retrievable:
                 try:
                     if (capability_state := c.get_instance_state()) is not None:
@@ -485,9 +581,9 @@ async def async_get_devices(hass: HomeAssistant, entry_data: ConfigEntryData) ->
     """Return list of supported user devices."""
     devices: list[Device] = []
 
-    for state in hass.states.async_all():
+    for state in entry_data.exposure.async_get_exposed_states():
         device = Device(hass, entry_data, state.entity_id, state)
-        if device.should_expose and not device.unavailable:
+        if not device.unavailable:
             devices.append(device)
 
     return devices
@@ -507,14 +603,19 @@ async def async_get_device_states(
 ) -> list[DeviceState]:
     """Return list of the states of user devices."""
     states: list[DeviceState] = []
+    ha_states = [hass.states.get(device_id) for device_id in device_ids]
+
+    rgb_colors: dict[str, RGBColor | None] = {}
+    light_states = [s for s in ha_states if s and s.domain == light.DOMAIN]
+    if len(light_states) >= BULK_COLOR_CONVERSION_MIN_LIGHTS:
+        rgb_colors = dict(zip([s.entity_id for s in light_states], get_rgb_colors(light_states)))
 
-    for device_id in device_ids:
-        state = hass.states.get(device_id)
+    for device_id, state in zip(device_ids, ha_states):
         device = Device(hass, entry_data, device_id, state)
 
         if state and not device.should_expose:
             entry_data.mark_entity_unexposed(state.entity_id)
 
-        states.append(device.query())
+        states.append(device.query(rgb_colors))
 
     return states
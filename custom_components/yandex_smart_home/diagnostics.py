@@ -21,6 +21,8 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry:
         "entry": async_redact_data(config_entry.as_dict(), [CONF_CLOUD_INSTANCE, CONF_SKILL]),
         "devices": {},
         "issues": [i.to_json() for i in issue_registry.async_get(hass).issues.values() if i.domain == DOMAIN],
+        "notifiers": [n.get_diagnostics() for n in entry_data.notifiers],
+        "cloud": entry_data.cloud_manager.get_diagnostics() if entry_data.cloud_manager else None,
     }
     diag.update(component.get_diagnostics())
 
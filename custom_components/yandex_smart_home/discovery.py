@@ -0,0 +1,299 @@
+"""Incrementally maintained device list (discovery snapshot) for the Yandex Smart Home."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+from typing import TYPE_CHECKING, Any, Callable
+
+from homeassistant.const import CONF_STATE_TEMPLATE, EVENT_STATE_CHANGED, STATE_UNAVAILABLE
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, State, callback
+from homeassistant.helpers import area_registry as ar, device_registry as dr, entity_registry as er
+from homeassistant.helpers.event import EventStateChangedData, async_call_later
+
+from .const import (
+    CONF_BACKLIGHT_ENTITY_ID,
+    CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ENTITY_ID,
+    CONF_ENTITY_CUSTOM_MODES,
+    CONF_ENTITY_CUSTOM_RANGES,
+    CONF_ENTITY_CUSTOM_TOGGLES,
+    CONF_ENTITY_PROPERTIES,
+    CONF_ENTITY_PROPERTY_ENTITY,
+    EntityId,
+)
+from .device import Device, DeviceId, async_get_device_description
+from .schema import DeviceDescription
+
+if TYPE_CHECKING:
+    from .entry_data import ConfigEntryData
+
+_LOGGER = logging.getLogger(__name__)
+
+DISCOVERY_SNAPSHOT_REFRESH_DELAY = timedelta(seconds=30)
+
+
+class DiscoverySnapshot:
+    """Hold descriptions of exposed devices and recompute only devices whose inputs changed.
+
+    Without tracking (see async_setup) every call rebuilds the snapshot from scratch.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_data: ConfigEntryData):
+        """Initialize."""
+        self._hass = hass
+        self._entry_data = entry_data
+
+        self._descriptions: dict[DeviceId, DeviceDescription | None] = {}
+        self._description_hashes: dict[DeviceId, int] = {}
+        self._unavailable: set[DeviceId] = set()
+        self._hash = 0
+
+        self._dirty: set[DeviceId] = set()
+        self._dirty_all = True
+        self._cache_revision = -1
+        self._dependents: dict[EntityId, set[DeviceId]] = {}
+        self._volatile: set[DeviceId] = set()
+
+        self._unsub_listeners: list[CALLBACK_TYPE] = []
+        self._unsub_refresh: CALLBACK_TYPE | None = None
+        self._change_listener: Callable[[], None] | None = None
+        self._tracked_hash: int | None = None
+
+    @callback
+    def async_setup(self) -> CALLBACK_TYPE:
+        """Start tracking registry and state changes, return a callback that stops tracking."""
+        for device_id, entity_config in self._entry_data.entity_config.items():
+            if entity_config.get(CONF_STATE_TEMPLATE) is not None:
+                self._volatile.add(device_id)
+
+            for entity_id in _get_referenced_entity_ids(entity_config):
+                self._dependents.setdefault(entity_id, set()).add(device_id)
+
+        self._unsub_listeners = [
+            self._hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed),
+            self._hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated),
+            self._hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated),
+            self._hass.bus.async_listen(ar.EVENT_AREA_REGISTRY_UPDATED, self._async_area_registry_updated),
+        ]
+        self._dirty_all = True
+
+        return self._async_unload
+
+    @callback
+    def async_track_changes(self, change_listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call the listener when the snapshot hash changes, return a callback that stops tracking."""
+        self._change_listener = change_listener
+        self._tracked_hash = None
+        self._schedule_refresh()
+
+        @callback
+        def _async_remove_listener() -> None:
+            self._change_listener = None
+            self._cancel_refresh()
+
+        return _async_remove_listener
+
+    @property
+    def tracking(self) -> bool:
+        """Test if the snapshot is updated incrementally."""
+        return bool(self._unsub_listeners)
+
+    @property
+    def hash(self) -> int:
+        """Return hash of the snapshot (unavailable devices keep their last known description)."""
+        return self._hash
+
+    async def async_get_device_descriptions(self) -> list[DeviceDescription]:
+        """Return descriptions of available exposed devices."""
+        await self._async_update()
+
+        return [
+            description
+            for device_id, description in self._descriptions.items()
+            if description is not None and device_id not in self._unavailable
+        ]
+
+    @callback
+    def _async_unload(self) -> None:
+        """Stop tracking changes."""
+        for unsub in self._unsub_listeners:
+            unsub()
+
+        self._unsub_listeners.clear()
+        self._cancel_refresh()
+        self._change_listener = None
+
+    async def _async_update(self) -> None:
+        """Recompute descriptions of changed devices."""
+        if self._cache_revision != self._entry_data.cache.revision:
+            self._cache_revision = self._entry_data.cache.revision
+            self._dirty_all = True
+
+        if self._dirty_all or not self.tracking:
+            self._dirty_all = False
+            self._dirty.clear()
+
+            previous_descriptions = self._descriptions
+            self._descriptions = {}
+            self._unavailable.clear()
+            for state in self._entry_data.exposure.async_get_exposed_states():
+                if state.entity_id in previous_descriptions:
+                    self._descriptions[state.entity_id] = previous_descriptions[state.entity_id]
+
+                await self._async_update_device(state.entity_id, state)
+
+            if self.tracking:
+                self._rehash()
+
+            return None
+
+        dirty = self._dirty | self._volatile
+        self._dirty = set()
+        for device_id in dirty:
+            self._unset_description_hash(device_id)
+            await self._async_update_device(device_id, self._hass.states.get(device_id))
+            self._set_description_hash(device_id)
+
+        return None
+
+    async def _async_update_device(self, device_id: DeviceId, state: State | None) -> None:
+        """Recompute description of the device, unavailable device keeps the last known description."""
+        if state is None or not (device := Device(self._hass, self._entry_data, device_id, state)).should_expose:
+            self._descriptions.pop(device_id, None)
+            self._unavailable.discard(device_id)
+            return None
+
+        if device.unavailable:
+            self._descriptions.setdefault(device_id, None)
+            self._unavailable.add(device_id)
+            return None
+
+        self._descriptions[device_id] = await async_get_device_description(self._hass, device)
+        self._unavailable.discard(device_id)
+        return None
+
+    def _rehash(self) -> None:
+        """Recompute hash of the snapshot."""
+        self._hash = 0
+        self._description_hashes.clear()
+        for device_id in self._descriptions:
+            self._set_description_hash(device_id)
+
+    def _set_description_hash(self, device_id: DeviceId) -> None:
+        """Add the device description to hash of the snapshot."""
+        if (description := self._descriptions.get(device_id)) is not None:
+            description_hash = hash((device_id, description.as_json()))
+            self._description_hashes[device_id] = description_hash
+            self._hash ^= description_hash
+
+    def _unset_description_hash(self, device_id: DeviceId) -> None:
+        """Remove the device description from hash of the snapshot."""
+        if (description_hash := self._description_hashes.pop(device_id, None)) is not None:
+            self._hash ^= description_hash
+
+    @callback
+    def _async_mark_dirty(self, *device_ids: DeviceId | None) -> None:
+        """Mark devices as changed."""
+        for device_id in device_ids:
+            if device_id:
+                self._dirty.add(device_id)
+                self._dirty.update(self._dependents.get(device_id, ()))
+
+        self._schedule_refresh()
+
+    @callback
+    def _async_mark_dirty_all(self) -> None:
+        """Mark all devices as changed."""
+        self._dirty_all = True
+        self._schedule_refresh()
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Mark the device as changed if its description may differ."""
+        old_state, new_state = event.data["old_state"], event.data["new_state"]
+        if (
+            old_state is None
+            or new_state is None
+            or (old_state.attributes is not new_state.attributes and old_state.attributes != new_state.attributes)
+            or (old_state.state == STATE_UNAVAILABLE) != (new_state.state == STATE_UNAVAILABLE)
+        ):
+            self._async_mark_dirty(event.data["entity_id"])
+
+        return None
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        """Mark the entity as changed."""
+        if event.data["action"] == "update":
+            self._async_mark_dirty(event.data["entity_id"], event.data.get("old_entity_id"))
+        else:
+            self._async_mark_dirty(event.data["entity_id"])
+
+        return None
+
+    @callback
+    def _async_device_registry_updated(self, event: Event[dr.EventDeviceRegistryUpdatedData]) -> None:
+        """Mark entities of the device as changed."""
+        if event.data["action"] != "update":
+            return self._async_mark_dirty_all()
+
+        entity_registry = er.async_get(self._hass)
+        self._async_mark_dirty(
+            *[e.entity_id for e in er.async_entries_for_device(entity_registry, event.data["device_id"])]
+        )
+        return None
+
+    @callback
+    def _async_area_registry_updated(self, _: Event[ar.EventAreaRegistryUpdatedData]) -> None:
+        """Mark all devices as changed."""
+        return self._async_mark_dirty_all()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule recomputing of changed devices if someone tracks the snapshot changes."""
+        if self._change_listener is None or self._unsub_refresh is not None:
+            return None
+
+        self._unsub_refresh = async_call_later(
+            self._hass, DISCOVERY_SNAPSHOT_REFRESH_DELAY, HassJob(self._async_refresh, cancel_on_shutdown=True)
+        )
+        return None
+
+    @callback
+    def _cancel_refresh(self) -> None:
+        """Cancel scheduled recomputing."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    async def _async_refresh(self, *_: Any) -> None:
+        """Recompute changed devices and notify the listener if the snapshot hash changed."""
+        self._unsub_refresh = None
+        await self._async_update()
+
+        if self._tracked_hash is not None and self._tracked_hash != self._hash and self._change_listener:
+            _LOGGER.debug("Device list changed")
+            self._change_listener()
+
+        self._tracked_hash = self._hash
+        return None
+
+
+def _get_referenced_entity_ids(entity_config: dict[str, Any]) -> set[EntityId]:
+    """Return entities that affect description of the device."""
+    entity_ids: set[EntityId] = set()
+
+    if backlight_entity_id := entity_config.get(CONF_BACKLIGHT_ENTITY_ID):
+        entity_ids.add(backlight_entity_id)
+
+    for property_config in entity_config.get(CONF_ENTITY_PROPERTIES, []):
+        if entity_id := property_config.get(CONF_ENTITY_PROPERTY_ENTITY):
+            entity_ids.add(entity_id)
+
+    for config_key in (CONF_ENTITY_CUSTOM_MODES, CONF_ENTITY_CUSTOM_TOGGLES, CONF_ENTITY_CUSTOM_RANGES):
+        for capability_config in entity_config.get(config_key, {}).values():
+            if isinstance(capability_config, dict):
+                if entity_id := capability_config.get(CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ENTITY_ID):
+                    entity_ids.add(entity_id)
+
+    return entity_ids
@@ -17,8 +17,9 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNKNOWN,
 )
-from homeassistant.core import CoreState, HomeAssistant, State
+from homeassistant.core import CoreState, Event, HomeAssistant, State, callback
 from homeassistant.helpers import entity_registry as er, issue_registry as ir
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entityfilter import EntityFilter
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.typing import ConfigType
@@ -46,6 +47,11 @@ from .const import (
     CONF_LABEL,
     CONF_LINKED_PLATFORMS,
     CONF_NOTIFIER,
+    CONF_NOTIFIER_CHUNK_DEVICES,
+    CONF_NOTIFIER_CHUNK_SIZE,
+    CONF_NOTIFIER_SENSORS,
+    CONF_NOTIFIER_SPOOL,
+    CONF_PARALLEL_ACTIONS,
     CONF_PRESSURE_UNIT,
     CONF_SETTINGS,
     CONF_SKILL,
@@ -56,13 +62,23 @@ from .const import (
     ISSUE_ID_DEPRECATED_YAML_SEVERAL_NOTIFIERS,
     ISSUE_ID_MISSING_SKILL_DATA,
     ISSUE_ID_PREFIX_UNEXPOSED_ENTITY_FOUND,
+    SIGNAL_NOTIFIERS_SETUP,
     ConnectionType,
     EntityFilterSource,
     EntityId,
 )
-from .device import BacklightCapability, DeviceId, StateCapability
+from .device import BacklightCapability, DeviceId, DevicePlanCache, StateCapability
+from .discovery import DiscoverySnapshot
+from .exposure import ExposureIndex
 from .helpers import APIError, CacheStore, SmartHomePlatform
-from .notifier import CloudNotifier, Notifier, NotifierConfig, YandexDirectNotifier
+from .notifier import (
+    REPORT_STATES_CHUNK_DEVICES,
+    REPORT_STATES_CHUNK_SIZE,
+    CloudNotifier,
+    Notifier,
+    NotifierConfig,
+    YandexDirectNotifier,
+)
 from .property import StateProperty
 from .property_custom import CustomProperty, get_custom_property, get_event_platform_custom_property_type
 from .schema import CapabilityType, OnOffCapabilityInstance
@@ -98,6 +114,9 @@ class ConfigEntryData:
         self.entry = entry
         self.entity_config: ConfigType = entity_config or {}
         self.unexposed_entities: set[str] = set()
+        self.device_plans = DevicePlanCache()
+        self.exposure = ExposureIndex(hass, self._evaluate_should_expose)
+        self.discovery = DiscoverySnapshot(hass, self)
         self._yaml_config: ConfigType = yaml_config or {}
 
         self.component_version = "unknown"
@@ -114,6 +133,11 @@ class ConfigEntryData:
         await self.cache.async_load()
 
         self._entity_registry = er.async_get(self._hass)
+        self.entry.async_on_unload(
+            self._hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated)
+        )
+        self.entry.async_on_unload(self.exposure.async_setup())
+        self.entry.async_on_unload(self.discovery.async_setup())
 
         with suppress(KeyError):
             integration = (await async_get_custom_components(self._hass))[DOMAIN]
@@ -168,6 +192,15 @@ class ConfigEntryData:
 
         return None
 
+    @callback
+    def _async_entity_registry_updated(self, event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        """Invalidate device plans of updated entities."""
+        self.device_plans.async_invalidate(event.data["entity_id"])
+        if event.data["action"] == "update" and (old_entity_id := event.data.get("old_entity_id")):
+            self.device_plans.async_invalidate(old_entity_id)
+
+        return None
+
     async def async_get_context_user_id(self) -> str | None:
         """Return user id for service calls (cloud connection only)."""
         if user_id := self.entry.options.get(CONF_USER_ID):
@@ -195,6 +228,46 @@ class ConfigEntryData:
         settings = self._yaml_config.get(CONF_SETTINGS, {})
         return bool(settings.get(CONF_CLOUD_STREAM))
 
+    @property
+    def parallel_actions(self) -> int:
+        """Return maximum number of devices that can execute actions concurrently."""
+        settings = self._yaml_config.get(CONF_SETTINGS, {})
+        return int(settings.get(CONF_PARALLEL_ACTIONS, 1))
+
+    @property
+    def notifier_spool(self) -> bool:
+        """Test if unsent state reports should be saved to disk."""
+        settings = self._yaml_config.get(CONF_SETTINGS, {})
+        return bool(settings.get(CONF_NOTIFIER_SPOOL))
+
+    @property
+    def notifier_chunk_devices(self) -> int:
+        """Return maximum number of devices in a state report."""
+        settings = self._yaml_config.get(CONF_SETTINGS, {})
+        return int(settings.get(CONF_NOTIFIER_CHUNK_DEVICES, REPORT_STATES_CHUNK_DEVICES))
+
+    @property
+    def notifier_chunk_size(self) -> int:
+        """Return maximum size of serialized device states in a state report (in bytes)."""
+        settings = self._yaml_config.get(CONF_SETTINGS, {})
+        return int(settings.get(CONF_NOTIFIER_CHUNK_SIZE, REPORT_STATES_CHUNK_SIZE))
+
+    @property
+    def notifier_sensors(self) -> bool:
+        """Test if notifier metrics should be exposed as sensors."""
+        settings = self._yaml_config.get(CONF_SETTINGS, {})
+        return bool(settings.get(CONF_NOTIFIER_SENSORS))
+
+    @property
+    def cloud_manager(self) -> CloudManager | None:
+        """Return manager of the cloud connection."""
+        return self._cloud_manager
+
+    @property
+    def notifiers(self) -> list[Notifier]:
+        """Return active notifiers."""
+        return self._notifiers
+
     @property
     def use_entry_aliases(self) -> bool:
         """Test if device or area entry aliases should be used for device or room name."""
@@ -239,7 +312,7 @@ class ConfigEntryData:
         user_id = self.cloud_instance_id if self.connection_type == ConnectionType.CLOUD_PLUS else config[CONF_USER_ID]
         return SkillConfig(user_id=user_id, id=config[CONF_ID], token=config.get(CONF_TOKEN))
 
-    @property
+    @cached_property
     def color_profiles(self) -> ColorProfiles:
         """Return color profiles."""
         return ColorProfiles.from_dict(self._yaml_config.get(CONF_COLOR_PROFILE, {}))
@@ -250,6 +323,10 @@ class ConfigEntryData:
 
     def should_expose(self, entity_id: str) -> bool:
         """Test if the entity should be exposed."""
+        return self.exposure.should_expose(entity_id)
+
+    def _evaluate_should_expose(self, entity_id: str) -> bool:
+        """Test if the entity should be exposed using the entity filter or labels."""
         if self.entry.options.get(CONF_FILTER_SOURCE) == EntityFilterSource.LABEL:
             entity_entry = self._entity_registry.async_get(entity_id)
             if not entity_entry:
@@ -356,6 +433,9 @@ class ConfigEntryData:
                         token=self.cloud_connection_token,
                         platform=platform,
                         extended_log=extended_log,
+                        spool=self.notifier_spool,
+                        chunk_devices=self.notifier_chunk_devices,
+                        chunk_size=self.notifier_chunk_size,
                     )
                     self._notifiers.append(
                         CloudNotifier(self._hass, self, config, track_templates, track_entity_states)
@@ -368,6 +448,9 @@ class ConfigEntryData:
                         token=self.skill.token,
                         skill_id=self.skill.id,
                         extended_log=extended_log,
+                        spool=self.notifier_spool,
+                        chunk_devices=self.notifier_chunk_devices,
+                        chunk_size=self.notifier_chunk_size,
                     )
                     self._notifiers.append(
                         YandexDirectNotifier(self._hass, self, config, track_templates, track_entity_states)
@@ -380,6 +463,9 @@ class ConfigEntryData:
                         token=self.skill.token,
                         skill_id=self.skill.id,
                         extended_log=extended_log,
+                        spool=self.notifier_spool,
+                        chunk_devices=self.notifier_chunk_devices,
+                        chunk_size=self.notifier_chunk_size,
                     )
                     self._notifiers.append(
                         YandexDirectNotifier(self._hass, self, config, track_templates, track_entity_states)
@@ -387,6 +473,16 @@ class ConfigEntryData:
 
         if self._notifiers:
             await asyncio.wait([asyncio.create_task(n.async_setup()) for n in self._notifiers])
+            self.entry.async_on_unload(self.discovery.async_track_changes(self._async_device_list_changed))
+            async_dispatcher_send(self._hass, SIGNAL_NOTIFIERS_SETUP.format(self.entry.entry_id))
+
+        return None
+
+    @callback
+    def _async_device_list_changed(self) -> None:
+        """Send discovery request when descriptions of exposed devices changed."""
+        for notifier in self._notifiers:
+            self._hass.async_create_task(notifier.async_send_discovery(), "yandex_smart_home_discovery")
 
         return None
 
@@ -0,0 +1,132 @@
+"""Index of entities exposed to the smart home platform."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import EventStateChangedData
+
+from .const import EntityId
+
+
+class ExposureIndex:
+    """Maintain set of exposed entities, so testing an entity is a set lookup instead of the filter evaluation.
+
+    Without tracking (see async_setup) every test evaluates the filter.
+    """
+
+    def __init__(self, hass: HomeAssistant, evaluate: Callable[[EntityId], bool]):
+        """Initialize."""
+        self._hass = hass
+        self._evaluate = evaluate
+
+        self._known: set[EntityId] = set()
+        self._exposed: dict[EntityId, None] = {}
+
+        self._unsub_listeners: list[CALLBACK_TYPE] = []
+        self._change_listeners: list[Callable[[EntityId, bool], None]] = []
+
+    @callback
+    def async_setup(self) -> CALLBACK_TYPE:
+        """Build the index and start tracking new entities, return a callback that stops tracking."""
+        self._known.clear()
+        self._exposed.clear()
+
+        for entity_id in self._hass.states.async_entity_ids():
+            self._async_update_entity(entity_id)
+
+        for entity_id in er.async_get(self._hass).entities:
+            self._async_update_entity(entity_id)
+
+        self._unsub_listeners = [
+            self._hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed),
+            self._hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated),
+        ]
+
+        return self._async_unload
+
+    @callback
+    def async_track_changes(self, change_listener: Callable[[EntityId, bool], None]) -> CALLBACK_TYPE:
+        """Call the listener when the entity becomes exposed or unexposed, return a callback that stops tracking."""
+        self._change_listeners.append(change_listener)
+
+        @callback
+        def _async_remove_listener() -> None:
+            if change_listener in self._change_listeners:
+                self._change_listeners.remove(change_listener)
+
+        return _async_remove_listener
+
+    @property
+    def tracking(self) -> bool:
+        """Test if the index is updated incrementally."""
+        return bool(self._unsub_listeners)
+
+    @property
+    def exposed_entity_ids(self) -> list[EntityId]:
+        """Return exposed entities (only when the index is tracking)."""
+        return list(self._exposed)
+
+    def should_expose(self, entity_id: EntityId) -> bool:
+        """Test if the entity should be exposed."""
+        if self.tracking and entity_id in self._known:
+            return entity_id in self._exposed
+
+        return self._evaluate(entity_id)
+
+    def async_get_exposed_states(self) -> list[State]:
+        """Return states of exposed entities in the order of the state machine."""
+        if not self.tracking:
+            return [state for state in self._hass.states.async_all() if self._evaluate(state.entity_id)]
+
+        return [state for state in self._hass.states.async_all() if state.entity_id in self._exposed]
+
+    @callback
+    def _async_unload(self) -> None:
+        """Stop tracking changes."""
+        for unsub in self._unsub_listeners:
+            unsub()
+
+        self._unsub_listeners.clear()
+        self._change_listeners.clear()
+        self._known.clear()
+        self._exposed.clear()
+
+    @callback
+    def _async_update_entity(self, entity_id: EntityId) -> None:
+        """Evaluate the filter for the entity and update the index."""
+        self._known.add(entity_id)
+
+        exposed = self._evaluate(entity_id)
+        if exposed == (entity_id in self._exposed):
+            return None
+
+        if exposed:
+            self._exposed[entity_id] = None
+        else:
+            self._exposed.pop(entity_id)
+
+        for change_listener in self._change_listeners:
+            change_listener(entity_id, exposed)
+
+        return None
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add new entities to the index."""
+        if event.data["old_state"] is None and (entity_id := event.data["entity_id"]) not in self._known:
+            self._async_update_entity(entity_id)
+
+        return None
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        """Re-evaluate the entity on creation, removal, rename or labels change."""
+        self._async_update_entity(event.data["entity_id"])
+        if event.data["action"] == "update" and (old_entity_id := event.data.get("old_entity_id")):
+            self._async_update_entity(old_entity_id)
+
+        return None
@@ -1,5 +1,7 @@
 """The Yandex Smart Home request handlers."""
 
+import asyncio
+from collections import defaultdict
 import logging
 from typing import Any, Callable, Coroutine
 
@@ -8,7 +10,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.util.decorator import Registry
 
 from .const import ATTR_CAPABILITY, ATTR_ERROR_CODE, EVENT_DEVICE_ACTION
-from .device import Device, async_get_device_description, async_get_device_states, async_get_devices
+from .device import Device, async_get_device_states
 from .helpers import ActionNotAllowed, APIError, RequestData
 from .schema import (
     ActionRequest,
@@ -16,7 +18,7 @@ from .schema import (
     ActionResultCapability,
     ActionResultCapabilityState,
     ActionResultDevice,
-    DeviceDescription,
+    CapabilityInstanceAction,
     DeviceList,
     DeviceStates,
     FailedActionResult,
@@ -65,10 +67,7 @@ async def async_device_list(hass: HomeAssistant, data: RequestData, _payload: st
     """
     assert data.request_user_id
 
-    devices: list[DeviceDescription] = []
-    for device in await async_get_devices(hass, data.entry_data):
-        if (description := await async_get_device_description(hass, device)) is not None:
-            devices.append(description)
+    devices = await data.entry_data.discovery.async_get_device_descriptions()
 
     data.entry_data.link_platform(data.platform)
     return DeviceList(user_id=data.request_user_id, devices=devices)
@@ -92,73 +91,93 @@ async def async_devices_action(hass: HomeAssistant, data: RequestData, payload:
     https://yandex.ru/dev/dialogs/smart-home/doc/reference/post-action.html
     """
     request = ActionRequest.parse_raw(payload)
-    results: list[ActionResultDevice] = []
-
-    for device_id, actions in [(rd.id, rd.capabilities) for rd in request.payload.devices]:
-        state = hass.states.get(device_id)
-        device = Device(hass, data.entry_data, device_id, state)
-
-        if state and not device.should_expose:
-            data.entry_data.mark_entity_unexposed(state.entity_id)
-
-        if device.unavailable:
+    device_actions = [(rd.id, rd.capabilities) for rd in request.payload.devices]
+
+    parallel_actions = data.entry_data.parallel_actions
+    if parallel_actions == 1 or len(device_actions) == 1:
+        results = [
+            await _async_execute_device_actions(hass, data, device_id, actions) for device_id, actions in device_actions
+        ]
+        return ActionResult(devices=results)
+
+    semaphore = asyncio.Semaphore(parallel_actions)
+    device_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def _async_execute_device_actions_limited(
+        device_id: str, actions: list[CapabilityInstanceAction]
+    ) -> ActionResultDevice:
+        async with device_locks[device_id], semaphore:
+            return await _async_execute_device_actions(hass, data, device_id, actions)
+
+    results = await asyncio.gather(
+        *[_async_execute_device_actions_limited(device_id, actions) for device_id, actions in device_actions]
+    )
+    return ActionResult(devices=list(results))
+
+
+async def _async_execute_device_actions(
+    hass: HomeAssistant, data: RequestData, device_id: str, actions: list[CapabilityInstanceAction]
+) -> ActionResultDevice:
+    """Execute actions for the device one by one."""
+    state = hass.states.get(device_id)
+    device = Device(hass, data.entry_data, device_id, state)
+
+    if state and not device.should_expose:
+        data.entry_data.mark_entity_unexposed(state.entity_id)
+
+    if device.unavailable:
+        hass.bus.async_fire(
+            EVENT_DEVICE_ACTION,
+            {ATTR_ENTITY_ID: device_id, ATTR_ERROR_CODE: ResponseCode.DEVICE_UNREACHABLE.value},
+            context=data.context,
+        )
+
+        return ActionResultDevice(
+            id=device_id, action_result=FailedActionResult(error_code=ResponseCode.DEVICE_UNREACHABLE)
+        )
+
+    capability_results: list[ActionResultCapability] = []
+    for action in actions:
+        try:
+            value = await device.execute(data.context, action)
             hass.bus.async_fire(
                 EVENT_DEVICE_ACTION,
-                {ATTR_ENTITY_ID: device_id, ATTR_ERROR_CODE: ResponseCode.DEVICE_UNREACHABLE.value},
+                {ATTR_ENTITY_ID: device_id, ATTR_CAPABILITY: action.as_dict()},
                 context=data.context,
             )
+        except (APIError, ActionNotAllowed) as err:
+            if isinstance(err, APIError):
+                _LOGGER.error(f"{err.message} ({err.code.value})")
 
-            results.append(
-                ActionResultDevice(
-                    id=device_id, action_result=FailedActionResult(error_code=ResponseCode.DEVICE_UNREACHABLE)
-                )
+            hass.bus.async_fire(
+                EVENT_DEVICE_ACTION,
+                {ATTR_ENTITY_ID: device_id, ATTR_CAPABILITY: action.as_dict(), ATTR_ERROR_CODE: err.code.value},
+                context=data.context,
             )
-            continue
-
-        capability_results: list[ActionResultCapability] = []
-        for action in actions:
-            try:
-                value = await device.execute(data.context, action)
-                hass.bus.async_fire(
-                    EVENT_DEVICE_ACTION,
-                    {ATTR_ENTITY_ID: device_id, ATTR_CAPABILITY: action.as_dict()},
-                    context=data.context,
-                )
-            except (APIError, ActionNotAllowed) as err:
-                if isinstance(err, APIError):
-                    _LOGGER.error(f"{err.message} ({err.code.value})")
-
-                hass.bus.async_fire(
-                    EVENT_DEVICE_ACTION,
-                    {ATTR_ENTITY_ID: device_id, ATTR_CAPABILITY: action.as_dict(), ATTR_ERROR_CODE: err.code.value},
-                    context=data.context,
-                )
-
-                capability_results.append(
-                    ActionResultCapability(
-                        type=action.type,
-                        state=ActionResultCapabilityState(
-                            instance=action.state.instance,
-                            action_result=FailedActionResult(error_code=ResponseCode(err.code)),
-                        ),
-                    )
-                )
-                continue
 
             capability_results.append(
                 ActionResultCapability(
                     type=action.type,
                     state=ActionResultCapabilityState(
                         instance=action.state.instance,
-                        value=value,
-                        action_result=SuccessActionResult(),
+                        action_result=FailedActionResult(error_code=ResponseCode(err.code)),
                     ),
                 )
             )
+            continue
 
-        results.append(ActionResultDevice(id=device_id, capabilities=capability_results))
+        capability_results.append(
+            ActionResultCapability(
+                type=action.type,
+                state=ActionResultCapabilityState(
+                    instance=action.state.instance,
+                    value=value,
+                    action_result=SuccessActionResult(),
+                ),
+            )
+        )
 
-    return ActionResult(devices=results)
+    return ActionResultDevice(id=device_id, capabilities=capability_results)
 
 
 @HANDLERS.register("/user/unlink")
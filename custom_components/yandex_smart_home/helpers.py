@@ -78,6 +78,8 @@ class CacheStore:
     _STORAGE_VERSION = 1
     _STORAGE_KEY = f"{DOMAIN}.cache"
 
+    revision: int = 0
+
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a cache store."""
         self._hass = hass
@@ -103,6 +105,7 @@ class CacheStore:
         self._data[STORE_CACHE_ATTRS][entity_id][attr] = value
 
         if has_changed:
+            self.revision += 1
             self._store.async_delay_save(lambda: self._data, 5.0)
 
         return None
@@ -112,6 +115,7 @@ class CacheStore:
         data = await self._store.async_load()
         if data:
             self._data = data
+            self.revision += 1
 
         return None
 
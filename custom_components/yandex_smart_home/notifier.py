@@ -4,18 +4,27 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 import asyncio
-from contextlib import suppress
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import timedelta
-import itertools
 import logging
-from random import randint
-from typing import TYPE_CHECKING, Any, Mapping, Protocol, Self, Sequence
-
-from aiohttp import ClientTimeout, JsonPayload, hdrs
+from random import uniform
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Coroutine, Iterable, Iterator, Mapping, Protocol, Self, Sequence, cast
+import zlib
+
+from aiohttp import (
+    ClientSession,
+    ClientTimeout,
+    JsonPayload,
+    TraceConfig,
+    TraceConnectionCreateEndParams,
+    TraceConnectionReuseconnParams,
+    hdrs,
+)
 from aiohttp.client_exceptions import ClientConnectionError
-from homeassistant.const import ATTR_ENTITY_ID, EVENT_STATE_CHANGED
-from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, State
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_HOMEASSISTANT_CLOSE, EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, State, callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE, async_create_clientsession
 from homeassistant.helpers.event import (
@@ -24,14 +33,24 @@ from homeassistant.helpers.event import (
     TrackTemplateResult,
     TrackTemplateResultInfo,
     async_call_later,
+    async_track_state_change_event,
     async_track_template_result,
 )
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.template import Template
 from pydantic.v1 import ValidationError
 
 from . import DOMAIN
 from .capability import Capability
-from .const import CLOUD_BASE_URL, EntityId
+from .const import (
+    CLOUD_BASE_URL,
+    CONF_ENTITY_REPORT_FILTER,
+    CONF_ENTITY_REPORT_FILTER_DEADBAND,
+    CONF_ENTITY_REPORT_FILTER_MIN_INTERVAL,
+    CONF_ENTITY_TEMPLATE_RATE_LIMIT,
+    EntityId,
+)
 from .device import Device, DeviceId
 from .helpers import APIError, SmartHomePlatform
 from .property import Property
@@ -45,6 +64,7 @@ from .schema import (
     CapabilityInstanceState,
     DeviceState,
     PropertyInstanceState,
+    PropertyType,
 )
 
 if TYPE_CHECKING:
@@ -55,7 +75,22 @@ _LOGGER = logging.getLogger(__name__)
 INITIAL_REPORT_DELAY = timedelta(seconds=15)
 DISCOVERY_REQUEST_DELAY = timedelta(seconds=5)
 HEARTBEAT_REPORT_INTERVAL = timedelta(hours=1)
+HEARTBEAT_REPORT_BUCKETS = 60
 REPORT_STATE_WINDOW = timedelta(seconds=1)
+REPORT_STATE_WINDOW_MIN = timedelta(milliseconds=100)
+REPORT_STATE_WINDOW_MAX = timedelta(seconds=5)
+REPORT_STATE_WINDOW_BUSY_RATE = 10  # devices per second
+REPORT_STATE_WINDOW_IDLE_RATE = 2  # devices per second
+REPORT_STATES_CHUNK_DEVICES = 100
+REPORT_STATES_CHUNK_SIZE = 64 * 1024
+REPORT_STATES_CHUNK_DELAY = timedelta(milliseconds=500)
+RETRY_STATES_INITIAL_DELAY = timedelta(seconds=5)
+RETRY_STATES_MAX_DELAY = timedelta(minutes=5)
+RETRY_STATES_MAX_DEVICES = 1000
+RETRY_STATES_SAVE_DELAY = timedelta(seconds=5)
+CALLBACK_REQUEST_TIMEOUT = ClientTimeout(total=5)
+CALLBACK_LATENCY_SAMPLES = 1000
+DATA_CALLBACK_SESSION = f"{DOMAIN}_callback_session"
 
 
 @dataclass
@@ -67,6 +102,84 @@ class NotifierConfig:
     skill_id: str | None = None
     platform: SmartHomePlatform | None = None
     extended_log: bool = False
+    spool: bool = False
+    chunk_devices: int = REPORT_STATES_CHUNK_DEVICES
+    chunk_size: int = REPORT_STATES_CHUNK_SIZE
+
+
+@dataclass
+class NotifierMetrics:
+    """Hold metrics of a notifier.
+
+    Latency percentiles are calculated from the last CALLBACK_LATENCY_SAMPLES requests.
+    """
+
+    events: int = 0
+    scheduled_states: int = 0
+    requests: int = 0
+    failed_requests: int = 0
+    payload_bytes: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    failures: dict[str, int] = field(default_factory=dict)
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=CALLBACK_LATENCY_SAMPLES))
+
+    @property
+    def connection_reuse_rate(self) -> float | None:
+        """Return share of requests that used an already established connection."""
+        if connections := self.connections_created + self.connections_reused:
+            return self.connections_reused / connections
+
+        return None
+
+    @property
+    def average_latency(self) -> float | None:
+        """Return average request latency in seconds."""
+        if self.requests:
+            return self.total_latency / self.requests
+
+        return None
+
+    def get_latency_percentile(self, percent: int) -> float | None:
+        """Return a percentile of recent request latencies in seconds (nearest-rank method)."""
+        if not self.latencies:
+            return None
+
+        latencies = sorted(self.latencies)
+        return latencies[max(0, -(-len(latencies) * percent // 100) - 1)]
+
+    def record_request(self, latency: float, payload_bytes: int, failure: str | None = None) -> None:
+        """Record a finished request, failure is a reason of the failed request."""
+        self.requests += 1
+        self.payload_bytes += payload_bytes
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.latencies.append(latency)
+        if failure is not None:
+            self.failed_requests += 1
+            self.failures[failure] = self.failures.get(failure, 0) + 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return dictionary representation of the metrics."""
+        return {
+            "events": self.events,
+            "scheduled_states": self.scheduled_states,
+            "requests": self.requests,
+            "failed_requests": self.failed_requests,
+            "failures": dict(self.failures),
+            "payload_bytes": self.payload_bytes,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "connection_reuse_rate": self.connection_reuse_rate,
+            "total_latency": self.total_latency,
+            "average_latency": self.average_latency,
+            "max_latency": self.max_latency,
+            "latency_p50": self.get_latency_percentile(50),
+            "latency_p95": self.get_latency_percentile(95),
+            "latency_p99": self.get_latency_percentile(99),
+        }
 
 
 class ReportableDeviceState(Protocol):
@@ -74,6 +187,11 @@ class ReportableDeviceState(Protocol):
 
     device_id: str
 
+    @property
+    def key(self) -> tuple[str, str, str]:
+        """Return identity key of the capability or property."""
+        ...
+
     @property
     @abstractmethod
     def time_sensitive(self) -> bool:
@@ -117,8 +235,9 @@ class PendingStates:
 
     def __init__(self) -> None:
         """Initialize."""
-        self._device_states: dict[str, list[ReportableDeviceState]] = {}
-        self._lock = asyncio.Lock()
+        self._device_states: dict[str, dict[tuple[str, str, str], ReportableDeviceState]] = {}
+        self._count = 0
+        self._time_sensitive_count = 0
 
     async def async_add(
         self,
@@ -127,33 +246,72 @@ class PendingStates:
     ) -> list[ReportableDeviceState]:
         """Add changed states to pending and return list of them."""
         scheduled_states: list[ReportableDeviceState] = []
+        old_states_by_key = {s.key: s for s in reversed(old_states)}
 
-        async with self._lock:
-            for state in new_states:
-                try:
-                    old_state = old_states[old_states.index(state)]
-                except ValueError:
-                    old_state = None
-                try:
-                    if state.check_value_change(old_state):
-                        device_states = self._device_states.setdefault(state.device_id, [])
-                        with suppress(ValueError):
-                            device_states.remove(state)
-
-                        device_states.append(state)
-                        scheduled_states.append(state)
-                except APIError as e:
-                    _LOGGER.warning(e)
+        for state in new_states:
+            old_state = old_states_by_key.get(state.key)
+            try:
+                if state.check_value_change(old_state):
+                    device_states = self._device_states.setdefault(state.device_id, {})
+                    if (replaced_state := device_states.pop(state.key, None)) is not None:
+                        self._count -= 1
+                        if replaced_state.time_sensitive:
+                            self._time_sensitive_count -= 1
+
+                    device_states[state.key] = state
+                    self._count += 1
+                    if state.time_sensitive:
+                        self._time_sensitive_count += 1
+
+                    scheduled_states.append(state)
+            except APIError as e:
+                _LOGGER.warning(e)
 
         return scheduled_states
 
+    async def async_discard(self, states: Sequence[ReportableDeviceState]) -> None:
+        """Remove pending states with the same keys as the states."""
+        for state in states:
+            if (device_states := self._device_states.get(state.device_id)) is None:
+                continue
+
+            if (discarded_state := device_states.pop(state.key, None)) is not None:
+                self._count -= 1
+                if discarded_state.time_sensitive:
+                    self._time_sensitive_count -= 1
+
+            if not device_states:
+                del self._device_states[state.device_id]
+
+        return None
+
     async def async_get_all(self) -> dict[str, list[ReportableDeviceState]]:
         """Return all states and clear pending."""
-        async with self._lock:
-            states = self._device_states.copy()
-            self._device_states.clear()
+        states = {device_id: list(device_states.values()) for device_id, device_states in self._device_states.items()}
+        self._device_states.clear()
+        self._count = 0
+        self._time_sensitive_count = 0
+        return states
+
+    async def async_get_time_sensitive(self) -> dict[str, list[ReportableDeviceState]]:
+        """Return time sensitive states and remove them from pending."""
+        states: dict[str, list[ReportableDeviceState]] = {}
+        if not self._time_sensitive_count:
             return states
 
+        for device_id, device_states in list(self._device_states.items()):
+            if time_sensitive_states := [s for s in device_states.values() if s.time_sensitive]:
+                states[device_id] = time_sensitive_states
+                for state in time_sensitive_states:
+                    del device_states[state.key]
+
+            if not device_states:
+                del self._device_states[device_id]
+
+        self._count -= self._time_sensitive_count
+        self._time_sensitive_count = 0
+        return states
+
     @property
     def empty(self) -> bool:
         """Test if pending states exist."""
@@ -162,11 +320,197 @@ class PendingStates:
     @property
     def time_sensitive(self) -> bool:
         """Test if pending states should be sent immediately."""
-        for state in itertools.chain(*self._device_states.values()):
-            if state.time_sensitive:
-                return True
+        return self._time_sensitive_count > 0
 
-        return False
+    @property
+    def delayable(self) -> bool:
+        """Test if pending states include states that can be sent with a delay."""
+        return self._count > self._time_sensitive_count
+
+    def __len__(self) -> int:
+        """Return number of states."""
+        return self._count
+
+
+class ReportFilter:
+    """Filter changes of float properties by deadband and minimum report interval configured for the entity.
+
+    A change within the deadband of the last reported value is dropped, a change that comes earlier than the minimum
+    interval after the last report is deferred until the interval ends.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_data: ConfigEntryData) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._entry_data = entry_data
+        self._reported: dict[tuple[str, str, str], tuple[float, float, dict[str, Any]]] = {}
+        self._deferred: dict[tuple[str, str, str], tuple[float, ReportableDeviceState]] = {}
+
+    def filter(
+        self, states: Sequence[ReportableDeviceState]
+    ) -> tuple[list[ReportableDeviceState], list[ReportableDeviceState]]:
+        """Return states that should be reported now and states that returned within the deadband.
+
+        A pending state of a property that returned within the deadband is stale and should be discarded.
+        """
+        filtered_states: list[ReportableDeviceState] = []
+        deadband_states: list[ReportableDeviceState] = []
+
+        for state in states:
+            if (reported := self._reported.get(state.key)) is None or (value := _get_float_value(state)) is None:
+                filtered_states.append(state)
+                continue
+
+            reported_value, reported_at, config = reported
+            if _in_deadband(value, reported_value, config.get(CONF_ENTITY_REPORT_FILTER_DEADBAND)):
+                self._deferred.pop(state.key, None)
+                deadband_states.append(state)
+                continue
+
+            min_interval: timedelta | None = config.get(CONF_ENTITY_REPORT_FILTER_MIN_INTERVAL)
+            if min_interval and self._hass.loop.time() - reported_at < min_interval.total_seconds():
+                self._deferred[state.key] = (reported_at + min_interval.total_seconds(), state)
+                continue
+
+            self._deferred.pop(state.key, None)
+            filtered_states.append(state)
+
+        return filtered_states, deadband_states
+
+    def mark_reported(self, states: Iterable[DeviceState]) -> None:
+        """Remember values of successfully reported properties that have a filter configured."""
+        now = self._hass.loop.time()
+        for state in states:
+            for property_state in state.properties or []:
+                if property_state.type != PropertyType.FLOAT:
+                    continue
+
+                value = property_state.state.value
+                if not isinstance(value, (int, float)) or isinstance(value, bool):
+                    continue
+
+                if not (config := self._get_config(state.id, property_state.state.instance)):
+                    continue
+
+                key = (state.id, property_state.type, property_state.state.instance)
+                self._reported[key] = (float(value), now, config)
+                self._deferred.pop(key, None)
+
+        return None
+
+    def pop_deferred(self) -> list[ReportableDeviceState]:
+        """Return deferred states which minimum interval has ended and remove them."""
+        now = self._hass.loop.time()
+        states: list[ReportableDeviceState] = []
+        for key, (due, state) in list(self._deferred.items()):
+            if due <= now:
+                states.append(state)
+                del self._deferred[key]
+
+        return states
+
+    @property
+    def deferred_due(self) -> float | None:
+        """Return loop time when the next deferred state can be reported."""
+        if not self._deferred:
+            return None
+
+        return min(due for due, _ in self._deferred.values())
+
+    def _get_config(self, device_id: str, instance: str) -> dict[str, Any] | None:
+        """Return filter configuration for the property instance of the device."""
+        entity_config = self._entry_data.get_entity_config(device_id)
+        if CONF_ENTITY_REPORT_FILTER not in entity_config:
+            return None
+
+        return cast(dict[str, Any] | None, entity_config[CONF_ENTITY_REPORT_FILTER].get(instance))
+
+
+class FailedStates:
+    """Hold states of devices that failed to be reported.
+
+    States are merged per capability or property instance, the state from the latest report wins.
+    Reports are ordered by sequence number (a newer report has a greater number).
+    """
+
+    def __init__(self, max_devices: int = RETRY_STATES_MAX_DEVICES) -> None:
+        """Initialize."""
+        self._max_devices = max_devices
+        self._device_states: dict[
+            str, dict[tuple[str, str], tuple[int, CapabilityInstanceState | PropertyInstanceState]]
+        ] = {}
+
+    def add(self, states: Iterable[DeviceState], seq: int) -> int:
+        """Add states of a failed report, return number of dropped devices when the queue is full."""
+        for state in states:
+            device_states = self._device_states.pop(state.id, {})
+            for instance_state in _iter_instance_states(state):
+                key = (instance_state.type, instance_state.state.instance)
+                if key not in device_states or device_states[key][0] <= seq:
+                    device_states[key] = (seq, instance_state)
+
+            self._device_states[state.id] = device_states
+
+        dropped = 0
+        while len(self._device_states) > self._max_devices:
+            self._device_states.pop(next(iter(self._device_states)))
+            dropped += 1
+
+        return dropped
+
+    def discard(self, states: Iterable[DeviceState], seq: int) -> None:
+        """Remove states that are superseded by a delivered report."""
+        for state in states:
+            if (device_states := self._device_states.get(state.id)) is None:
+                continue
+
+            for instance_state in _iter_instance_states(state):
+                key = (instance_state.type, instance_state.state.instance)
+                if key in device_states and device_states[key][0] <= seq:
+                    del device_states[key]
+
+            if not device_states:
+                del self._device_states[state.id]
+
+        return None
+
+    def get_all(self) -> list[DeviceState]:
+        """Return states of all devices."""
+        states: list[DeviceState] = []
+        for device_id, device_states in self._device_states.items():
+            capabilities: list[CapabilityInstanceState] = []
+            properties: list[PropertyInstanceState] = []
+            for _, instance_state in device_states.values():
+                if isinstance(instance_state, CapabilityInstanceState):
+                    capabilities.append(instance_state)
+                else:
+                    properties.append(instance_state)
+
+            states.append(DeviceState(id=device_id, capabilities=capabilities or None, properties=properties or None))
+
+        return states
+
+    def as_data(self) -> list[dict[str, Any]]:
+        """Return data for the store."""
+        return [state.as_dict() for state in self.get_all()]
+
+    def load(self, data: list[dict[str, Any]]) -> None:
+        """Add states from the store."""
+        try:
+            self.add([DeviceState.parse_obj(item) for item in data], 0)
+        except ValidationError as e:
+            _LOGGER.warning(f"Failed to load unsent states: {e}")
+
+        return None
+
+    @property
+    def empty(self) -> bool:
+        """Test if there are no failed states."""
+        return not bool(self._device_states)
+
+    def __len__(self) -> int:
+        """Return number of devices."""
+        return len(self._device_states)
 
 
 class Notifier(ABC):
@@ -184,29 +528,63 @@ class Notifier(ABC):
         self._hass = hass
         self._entry_data = entry_data
         self._config = config
-        self._session = async_create_clientsession(hass)
+        self._session = async_get_callback_session(hass)
+        self.metrics = NotifierMetrics()
 
         self._pending = PendingStates()
+        self._report_filter = ReportFilter(hass, entry_data)
+        self._failed = FailedStates()
+        self._failed_store: Store[list[dict[str, Any]]] | None = None
+        if config.spool:
+            self._failed_store = _get_failed_states_store(hass, entry_data.entry.entry_id, self.platform)
 
         self._track_entity_states = track_entity_states
         self._track_templates = track_templates
         self._template_changes_tracker: TrackTemplateResultInfo | None = None
+        self._template_states: dict[Template, list[ReportableTemplateDeviceState]] = {}
+
+        self._state_changes: dict[EntityId, tuple[State | None, State]] = {}
+        self._time_sensitive_entities: dict[EntityId, bool] = {}
+        self._state_changes_flush_handle: asyncio.TimerHandle | None = None
+        self._state_changes_flush_task: asyncio.Task[None] | None = None
+        self._state_changes_flush_scheduled = False
+        self._state_changes_flushed_at = -REPORT_STATE_WINDOW_MAX.total_seconds()
+
+        self._report_window = REPORT_STATE_WINDOW
+        self._reported_at = hass.loop.time()
+
+        self._report_tasks: set[asyncio.Task[None]] = set()
+        self._report_lock = asyncio.Lock()
+        self._report_seq = 0
+        self._report_seqs: dict[tuple[str, str, str], int] = {}  # latest report of an instance
+        self._retry_attempts = 0
+        self._retrying = False
+        self._heartbeat_bucket = 0
+        self._heartbeat_buckets: list[dict[EntityId, None]] | None = None
 
         self._unsub_state_changed: CALLBACK_TYPE | None = None
+        self._unsub_entity_state_changed: dict[EntityId, CALLBACK_TYPE] = {}
         self._unsub_initial_report: CALLBACK_TYPE | None = None
         self._unsub_heartbeat_report: CALLBACK_TYPE | None = None
         self._unsub_report_states: CALLBACK_TYPE | None = None
+        self._unsub_report_time_sensitive_states: CALLBACK_TYPE | None = None
+        self._unsub_report_deferred_states: CALLBACK_TYPE | None = None
+        self._unsub_retry_states: CALLBACK_TYPE | None = None
         self._unsub_discovery: CALLBACK_TYPE | None = None
 
     async def async_setup(self) -> None:
         """Set up the notifier."""
-        self._unsub_state_changed = self._hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+        if self._failed_store is not None and (data := await self._failed_store.async_load()):
+            self._failed.load(data)
+            self._schedule_retry_states()
+
+        self._unsub_state_changed = self._async_subscribe_state_changes()
         self._unsub_initial_report = async_call_later(
             self._hass, INITIAL_REPORT_DELAY, HassJob(self._async_initial_report)
         )
         self._unsub_heartbeat_report = async_call_later(
             self._hass,
-            delay=HEARTBEAT_REPORT_INTERVAL + timedelta(minutes=randint(1, 15)),
+            delay=HEARTBEAT_REPORT_INTERVAL / HEARTBEAT_REPORT_BUCKETS * uniform(1, 2),
             action=HassJob(self._async_hearbeat_report),
         )
         self._unsub_discovery = async_call_later(
@@ -216,7 +594,10 @@ class Notifier(ABC):
         if self._track_templates:
             self._template_changes_tracker = async_track_template_result(
                 self._hass,
-                [TrackTemplate(t, None) for t in self._track_templates],
+                [
+                    TrackTemplate(template, None, self._get_template_rate_limit(states))
+                    for template, states in self._track_templates.items()
+                ],
                 self._async_template_result_changed,
             )
             self._template_changes_tracker.async_refresh()
@@ -230,6 +611,9 @@ class Notifier(ABC):
             self._unsub_initial_report,
             self._unsub_heartbeat_report,
             self._unsub_report_states,
+            self._unsub_report_time_sensitive_states,
+            self._unsub_report_deferred_states,
+            self._unsub_retry_states,
             self._unsub_discovery,
         ]:
             if unsub:
@@ -239,19 +623,64 @@ class Notifier(ABC):
         self._unsub_initial_report = None
         self._unsub_heartbeat_report = None
         self._unsub_report_states = None
+        self._unsub_report_time_sensitive_states = None
+        self._unsub_report_deferred_states = None
+        self._unsub_retry_states = None
         self._unsub_discovery = None
 
         if self._template_changes_tracker is not None:
             self._template_changes_tracker.async_remove()
             self._template_changes_tracker = None
 
+        if self._state_changes_flush_handle is not None:
+            self._state_changes_flush_handle.cancel()
+            self._state_changes_flush_handle = None
+
+        if self._state_changes_flush_task is not None:
+            self._state_changes_flush_task.cancel()
+            self._state_changes_flush_task = None
+
+        self._state_changes.clear()
+        self._state_changes_flush_scheduled = False
+
+        for task in self._report_tasks:
+            task.cancel()
+
+        if self._failed_store is not None:
+            await self._failed_store.async_save(self._failed.as_data())
+
         return None
 
     async def async_send_discovery(self, *_: Any) -> None:
         """Send notification about change of devices' parameters."""
         self._debug_log("Sending discovery request")
         request = CallbackDiscoveryRequest(payload=CallbackDiscoveryRequestPayload(user_id=self._config.user_id))
-        return await self._async_send_request(f"{self._base_url}/discovery", request)
+        await self._async_send_request(f"{self._base_url}/discovery", request)
+        return None
+
+    @property
+    def platform(self) -> SmartHomePlatform:
+        """Return smart home platform the notifier reports to."""
+        return self._config.platform or SmartHomePlatform.YANDEX
+
+    @property
+    def pending_states(self) -> int:
+        """Return number of states waiting to be reported."""
+        return len(self._pending)
+
+    @property
+    def failed_devices(self) -> int:
+        """Return number of devices with unsent states."""
+        return len(self._failed)
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return diagnostics for the notifier."""
+        return {
+            "platform": self.platform,
+            "pending_states": self.pending_states,
+            "failed_devices": self.failed_devices,
+            "metrics": self.metrics.as_dict(),
+        }
 
     @property
     @abstractmethod
@@ -281,9 +710,63 @@ class Notifier(ABC):
 
     async def _async_report_states(self, *_: Any) -> None:
         """Send notification about device state change."""
-        states: list[DeviceState] = []
+        pending_states = await self._pending.async_get_all()
+        self._update_report_window(len(pending_states))
+        self._async_report_pending_states(pending_states)
+
+        self._unsub_report_states = None
+        return self._schedule_report_states()
+
+    async def _async_report_time_sensitive_states(self, *_: Any) -> None:
+        """Send notification about change of time sensitive states, other pending states are left for later."""
+        self._unsub_report_time_sensitive_states = None
+        self._async_report_pending_states(await self._pending.async_get_time_sensitive())
+        return self._schedule_report_states()
+
+    @callback
+    def _async_report_pending_states(self, pending_states: dict[str, list[ReportableDeviceState]]) -> None:
+        """Report pending states, older reports of the same capabilities and properties become superseded."""
+        if not pending_states:
+            return None
+
+        self._report_seq += 1
+        for device_states in pending_states.values():
+            for state in device_states:
+                self._report_seqs[state.key] = self._report_seq
 
-        for device_id, device_states in (await self._pending.async_get_all()).items():
+        return self._async_report_device_states(self._iter_device_states(pending_states), self._report_seq)
+
+    @callback
+    def _async_report_device_states(self, states: Iterator[DeviceState], seq: int) -> None:
+        """Create a task that sends the states, or queue them if there are failed states.
+
+        The states are consumed lazily by the task, chunk by chunk.
+        """
+        if self._failed.empty:
+            return self._async_create_report_task(self._async_send_states(states, seq))
+
+        # keep order of reports, the states are sent along with the failed ones
+        self._async_add_failed_states(list(states), seq)
+        return self._schedule_retry_states()
+
+    def _update_report_window(self, devices: int) -> None:
+        """Widen the report window when devices change often and shrink it when they change rarely.
+
+        The rate of changed devices per second since the previous report doesn't depend on the window length.
+        """
+        now = self._hass.loop.time()
+        rate = devices / max(now - self._reported_at, self._report_window.total_seconds())
+        if rate >= REPORT_STATE_WINDOW_BUSY_RATE:
+            self._report_window = min(self._report_window * 2, REPORT_STATE_WINDOW_MAX)
+        elif rate <= REPORT_STATE_WINDOW_IDLE_RATE:
+            self._report_window = max(self._report_window / 2, REPORT_STATE_WINDOW_MIN)
+
+        self._reported_at = now
+        return None
+
+    def _iter_device_states(self, pending_states: dict[str, list[ReportableDeviceState]]) -> Iterator[DeviceState]:
+        """Yield states of devices with pending capabilities and properties."""
+        for device_id, device_states in pending_states.items():
             capabilities: list[CapabilityInstanceState] = []
             properties: list[PropertyInstanceState] = []
 
@@ -302,42 +785,142 @@ class Notifier(ABC):
                     _LOGGER.warning(e)
 
             if capabilities or properties:
-                states.append(
-                    DeviceState(
-                        id=device_id,
-                        capabilities=capabilities or None,
-                        properties=properties or None,
+                yield DeviceState(id=device_id, capabilities=capabilities or None, properties=properties or None)
+
+    @callback
+    def _async_create_report_task(self, target: Coroutine[Any, Any, None]) -> None:
+        """Create a task that sends states, the task is cancelled on unload."""
+        task = self._hass.async_create_task(target, f"{DOMAIN} notifier states report")
+        self._report_tasks.add(task)
+        task.add_done_callback(self._report_tasks.discard)
+        return None
+
+    async def _async_send_states(self, states: Iterable[DeviceState], seq: int) -> None:
+        """Send device states in paced chunks of bounded size.
+
+        Reports are sent one by one in order of creation. States superseded by a newer report are dropped
+        right before a chunk is sent. States of a chunk that failed with a transient error (and of all following
+        chunks) are queued for retry.
+        """
+        async with self._report_lock:
+            chunks = _iter_device_states_chunks(states, self._config.chunk_devices, self._config.chunk_size)
+            sent = False
+            for chunk in chunks:
+                if sent:
+                    await asyncio.sleep(REPORT_STATES_CHUNK_DELAY.total_seconds())
+
+                if not (chunk := self._drop_superseded_states(chunk, seq)):
+                    continue
+
+                request = CallbackStatesRequest(
+                    payload=CallbackStatesRequestPayload(user_id=self._config.user_id, devices=chunk)
+                )
+                sent = True
+                if not await self._async_send_request(f"{self._base_url}/state", request):
+                    self._retry_attempts += 1
+                    self._async_add_failed_states(
+                        [*chunk, *self._drop_superseded_states([s for c in chunks for s in c], seq)], seq
                     )
+                    break
+
+                self._retry_attempts = 0
+                self._report_filter.mark_reported(chunk)
+                if not self._failed.empty:
+                    self._failed.discard(chunk, seq)
+                    self._async_failed_states_changed()
+
+        return self._schedule_retry_states()
+
+    def _drop_superseded_states(self, states: list[DeviceState], seq: int) -> list[DeviceState]:
+        """Return states without capabilities and properties that are reported by a newer report."""
+        if seq == self._report_seq:
+            return states
+
+        def _is_actual(device_id: str, instance_state: CapabilityInstanceState | PropertyInstanceState) -> bool:
+            return self._report_seqs.get((device_id, instance_state.type, instance_state.state.instance), 0) <= seq
+
+        actual_states: list[DeviceState] = []
+        for state in states:
+            if all(_is_actual(state.id, s) for s in _iter_instance_states(state)):
+                actual_states.append(state)
+                continue
+
+            capabilities = [c for c in state.capabilities or [] if _is_actual(state.id, c)]
+            properties = [p for p in state.properties or [] if _is_actual(state.id, p)]
+            if capabilities or properties:
+                actual_states.append(
+                    DeviceState(id=state.id, capabilities=capabilities or None, properties=properties or None)
                 )
 
-        if states:
-            request = CallbackStatesRequest(
-                payload=CallbackStatesRequestPayload(user_id=self._config.user_id, devices=states)
+        return actual_states
+
+    @callback
+    def _async_add_failed_states(self, states: list[DeviceState], seq: int) -> None:
+        """Queue states for retry."""
+        if dropped := self._failed.add(states, seq):
+            _LOGGER.warning(
+                self._format_log_message(f"Too many unsent states, states of {dropped} devices were discarded")
             )
 
-            asyncio.create_task(self._async_send_request(f"{self._base_url}/state", request))
+        return self._async_failed_states_changed()
 
-        if self._pending.empty:
-            self._unsub_report_states = None
-        else:
-            self._unsub_report_states = async_call_later(
-                self._hass,
-                delay=0 if self._pending.time_sensitive else REPORT_STATE_WINDOW,
-                action=HassJob(self._async_report_states),
-            )
+    @callback
+    def _async_failed_states_changed(self) -> None:
+        """Schedule saving of failed states to the store."""
+        if self._failed_store is not None:
+            self._failed_store.async_delay_save(self._failed.as_data, RETRY_STATES_SAVE_DELAY.total_seconds())
+
+        return None
 
+    @callback
+    def _schedule_retry_states(self) -> None:
+        """Schedule retry of failed states with jittered exponential backoff."""
+        if self._failed.empty or self._unsub_retry_states or self._retrying:
+            return None
+
+        delay = 0.0
+        if self._retry_attempts:
+            delay = min(
+                RETRY_STATES_MAX_DELAY.total_seconds(),
+                RETRY_STATES_INITIAL_DELAY.total_seconds() * 2 ** (self._retry_attempts - 1),
+            ) * uniform(0.5, 1)
+            self._debug_log(f"Retrying states report of {len(self._failed)} devices in {delay:.1f} seconds")
+
+        self._unsub_retry_states = async_call_later(
+            self._hass, delay=delay, action=HassJob(self._async_create_retry_states_task)
+        )
         return None
 
-    async def _async_send_request(self, url: str, request: CallbackRequest) -> None:
-        """Send a request to the url."""
+    @callback
+    def _async_create_retry_states_task(self, *_: Any) -> None:
+        """Create a task to send failed states."""
+        self._unsub_retry_states = None
+        return self._async_create_report_task(self._async_retry_states())
+
+    async def _async_retry_states(self) -> None:
+        """Send failed states again, states reported meanwhile are merged into failed ones."""
+        self._retrying = True
         try:
-            self._debug_log(f"Request: {url} (POST data: {request.as_json()})")
+            await self._async_send_states(self._failed.get_all(), self._report_seq)
+        finally:
+            self._retrying = False
+
+        return self._schedule_retry_states()
+
+    async def _async_send_request(self, url: str, request: CallbackRequest) -> bool:
+        """Send a request to the url, return False if the request failed with a transient error and can be retried."""
+        started_at, failure, retry = self._hass.loop.time(), None, False
+        data = request.as_json()
+        payload = JsonPayload(data, dumps=lambda p: p)
+        try:
+            self._debug_log(f"Request: {url} (POST data: {data})")
 
             r = await self._session.post(
                 url,
                 headers=self._request_headers,
-                data=JsonPayload(request.as_json(), dumps=lambda p: p),
-                timeout=ClientTimeout(total=5),
+                data=payload,
+                timeout=CALLBACK_REQUEST_TIMEOUT,
+                trace_request_ctx={"metrics": self.metrics},
             )
 
             response_body, error_message = await r.read(), ""
@@ -354,51 +937,240 @@ class Notifier(ABC):
                 _LOGGER.warning(
                     self._format_log_message(f"State notification request failed: {error_message or r.status}")
                 )
+                failure = f"http_{r.status}" if r.status != 202 else "error_response"
+                retry = r.status == 429 or r.status >= 500
         except ClientConnectionError as e:
             _LOGGER.warning(self._format_log_message(f"State notification request failed: {e!r}"))
+            failure, retry = "connection_error", True
         except asyncio.TimeoutError as e:
             self._debug_log(f"State notification request failed: {e!r}")
+            failure, retry = "timeout", True
         except Exception:
             _LOGGER.exception(self._format_log_message("Unexpected exception"))
+            failure = "unexpected_error"
 
-        return None
+        self.metrics.record_request(self._hass.loop.time() - started_at, payload.size or 0, failure)
+        return not retry
 
     async def _async_template_result_changed(
         self,
         event_type: Event[EventStateChangedData] | None,
         updates: list[TrackTemplateResult],
     ) -> None:
-        """Handle track template changes."""
-        if event_type is None:  # update during setup
-            return None
+        """Handle track template changes.
+
+        The template is rendered once for all devices that share it, states with the previous value are kept
+        to be compared with the next result.
+        """
+        if event_type is not None:
+            self.metrics.events += len(updates)
 
         for result in updates:
             if isinstance(result.result, TemplateError):
                 _LOGGER.warning(f"Error while processing template: {result.template.template}", exc_info=result.result)
+                self._template_states.pop(result.template, None)
                 continue
-            if isinstance(result.last_result, TemplateError):
-                result.last_result = None
 
-            for state in self._track_templates[result.template]:
-                old_state = state.new_with_value(result.last_result)
-                new_state = state.new_with_value(result.result)
+            template_states = self._track_templates[result.template]
+            new_states = [state.new_with_value(result.result) for state in template_states]
+            old_states = self._template_states.get(result.template)
+            self._template_states[result.template] = new_states
 
-                for pending_state in await self._pending.async_add([new_state], [old_state]):
-                    self._debug_log(
-                        f"State report with value '{pending_state.get_value()}' scheduled for {pending_state!r}"
-                    )
+            if event_type is None:  # update during setup
+                continue
+
+            if old_states is None:
+                last_result = None if isinstance(result.last_result, TemplateError) else result.last_result
+                old_states = [state.new_with_value(last_result) for state in template_states]
+
+            for pending_state in await self._async_schedule_filtered_states(new_states, old_states):
+                self._debug_log(
+                    f"State report with value '{pending_state.get_value()}' scheduled for {pending_state!r}"
+                )
+
+        if event_type is None:
+            return None
 
+        self._schedule_report_deferred_states()
         return self._schedule_report_states()
 
-    async def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
-        """Handle state changes."""
+    async def _async_schedule_states(
+        self, new_states: Sequence[ReportableDeviceState], old_states: Sequence[ReportableDeviceState]
+    ) -> list[ReportableDeviceState]:
+        """Add changed states to pending states and return list of them."""
+        scheduled_states = await self._pending.async_add(new_states, old_states)
+        self.metrics.scheduled_states += len(scheduled_states)
+        return scheduled_states
+
+    async def _async_schedule_filtered_states(
+        self, new_states: Sequence[ReportableDeviceState], old_states: Sequence[ReportableDeviceState]
+    ) -> list[ReportableDeviceState]:
+        """Add changed states that pass the report filter to pending states and return list of them."""
+        filtered_states, deadband_states = self._report_filter.filter(new_states)
+        if deadband_states:
+            await self._pending.async_discard(deadband_states)
+
+        return await self._async_schedule_states(filtered_states, old_states)
+
+    def _get_template_rate_limit(self, states: Sequence[ReportableTemplateDeviceState]) -> float | None:
+        """Return the longest template rate limit (in seconds) of devices that share the template."""
+        rate_limits = [
+            rate_limit.total_seconds()
+            for state in states
+            if (rate_limit := self._entry_data.get_entity_config(state.device_id).get(CONF_ENTITY_TEMPLATE_RATE_LIMIT))
+        ]
+        return max(rate_limits, default=None)
+
+    @callback
+    def _async_subscribe_state_changes(self) -> CALLBACK_TYPE:
+        """Subscribe to state changes of exposed and tracked entities, return a callback that unsubscribes.
+
+        Without the exposure index tracking all state changes are received.
+        """
+        exposure = self._entry_data.exposure
+        if not exposure.tracking:
+            return self._hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+        for entity_id in [*exposure.exposed_entity_ids, *self._track_entity_states]:
+            self._async_track_entity_state_changes(entity_id)
+
+        self._heartbeat_buckets = [{} for _ in range(HEARTBEAT_REPORT_BUCKETS)]
+        for entity_id in exposure.exposed_entity_ids:
+            self._heartbeat_buckets[_get_heartbeat_bucket(entity_id)][entity_id] = None
+
+        unsub_exposure_changes = exposure.async_track_changes(self._async_exposure_changed)
+
+        @callback
+        def _async_unsubscribe() -> None:
+            unsub_exposure_changes()
+            self._heartbeat_buckets = None
+            for unsub in self._unsub_entity_state_changed.values():
+                unsub()
+
+            self._unsub_entity_state_changed.clear()
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_track_entity_state_changes(self, entity_id: EntityId) -> None:
+        """Subscribe to state changes of the entity."""
+        if entity_id not in self._unsub_entity_state_changed:
+            self._unsub_entity_state_changed[entity_id] = async_track_state_change_event(
+                self._hass, entity_id, self._async_state_changed
+            )
+
+        return None
+
+    @callback
+    def _async_exposure_changed(self, entity_id: EntityId, exposed: bool) -> None:
+        """Update subscriptions and heartbeat buckets when the entity becomes exposed or unexposed."""
+        if self._heartbeat_buckets is not None:
+            heartbeat_bucket = self._heartbeat_buckets[_get_heartbeat_bucket(entity_id)]
+            if exposed:
+                heartbeat_bucket[entity_id] = None
+            else:
+                heartbeat_bucket.pop(entity_id, None)
+
+        if not exposed:
+            if entity_id not in self._track_entity_states and (
+                unsub := self._unsub_entity_state_changed.pop(entity_id, None)
+            ):
+                unsub()
+
+            return None
+
+        self._async_track_entity_state_changes(entity_id)
+
+        # the state change that made the entity known may be already dispatched
+        if (state := self._hass.states.get(entity_id)) is not None and entity_id not in self._state_changes:
+            self._state_changes[entity_id] = (None, state)
+            return self._schedule_flush_state_changes()
+
+        return None
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Buffer state changes, only the first old state and the last new state of the entity are kept.
+
+        Changes of entities with time sensitive states (e.g. events) are handled immediately, not yet seen entities are
+        buffered until the flush finds out if their states are time sensitive.
+        """
+        self.metrics.events += 1
         entity_id = str(event.data.get(ATTR_ENTITY_ID))
-        old_state: State | None = event.data.get("old_state")
         new_state: State | None = event.data.get("new_state")
 
         if not new_state:
             return None
 
+        if entity_id in self._state_changes:
+            old_state = self._state_changes[entity_id][0]
+        else:
+            old_state = event.data.get("old_state")
+
+        if self._time_sensitive_entities.get(entity_id, False):
+            self._state_changes.pop(entity_id, None)
+            self._hass.async_create_task(
+                self._async_handle_state_change(entity_id, old_state, new_state),
+                f"{DOMAIN} notifier state change",
+                eager_start=True,
+            )
+            return None
+
+        self._state_changes[entity_id] = (old_state, new_state)
+        return self._schedule_flush_state_changes()
+
+    async def _async_handle_state_change(self, entity_id: EntityId, old_state: State | None, new_state: State) -> None:
+        """Handle a state change of the entity without buffering."""
+        await self._async_schedule_state_change(entity_id, old_state, new_state)
+        self._schedule_report_deferred_states()
+        return self._schedule_report_states()
+
+    @callback
+    def _schedule_flush_state_changes(self) -> None:
+        """Schedule processing of buffered state changes, no more than once per report window."""
+        if self._state_changes_flush_scheduled:
+            return None
+
+        self._state_changes_flush_scheduled = True
+        delay = self._state_changes_flushed_at + self._report_window.total_seconds() - self._hass.loop.time()
+        if delay <= 0:
+            self._async_create_flush_state_changes_task()
+        else:
+            self._state_changes_flush_handle = self._hass.loop.call_later(
+                delay, self._async_create_flush_state_changes_task
+            )
+
+        return None
+
+    @callback
+    def _async_create_flush_state_changes_task(self) -> None:
+        """Create a task to process buffered state changes."""
+        self._state_changes_flush_handle = None
+        self._state_changes_flush_task = self._hass.async_create_task(
+            self._async_flush_state_changes(), f"{DOMAIN} notifier state changes"
+        )
+        return None
+
+    async def _async_flush_state_changes(self) -> None:
+        """Add changed capabilities and properties of buffered state changes to pending states."""
+        if self._state_changes_flush_handle is not None:
+            self._state_changes_flush_handle.cancel()
+            self._state_changes_flush_handle = None
+
+        state_changes, self._state_changes = self._state_changes, {}
+        self._state_changes_flush_scheduled = False
+        self._state_changes_flushed_at = self._hass.loop.time()
+
+        for entity_id, (old_state, new_state) in state_changes.items():
+            await self._async_schedule_state_change(entity_id, old_state, new_state)
+
+        self._schedule_report_deferred_states()
+        return self._schedule_report_states()
+
+    async def _async_schedule_state_change(
+        self, entity_id: EntityId, old_state: State | None, new_state: State
+    ) -> None:
+        """Add changed capabilities and properties of the entity to pending states."""
         old_device_states: list[ReportableDeviceState] = []
         new_device_states: list[ReportableDeviceState] = []
 
@@ -417,50 +1189,237 @@ class Notifier(ABC):
                 old_device_states.extend(old_device.get_state_capabilities())
                 old_device_states.extend(old_device.get_state_properties())
 
-        for pending_state in await self._pending.async_add(new_device_states, old_device_states):
+        self._time_sensitive_entities[entity_id] = any(s.time_sensitive for s in new_device_states)
+
+        for pending_state in await self._async_schedule_filtered_states(new_device_states, old_device_states):
             self._debug_log(f"State report with value '{pending_state.get_value()}' scheduled for {pending_state!r}")
 
+        return None
+
+    @callback
+    def _schedule_report_deferred_states(self) -> None:
+        """Schedule report of states deferred by the report filter."""
+        if (due := self._report_filter.deferred_due) is None or self._unsub_report_deferred_states:
+            return None
+
+        self._unsub_report_deferred_states = async_call_later(
+            self._hass,
+            delay=max(due - self._hass.loop.time(), 0),
+            action=HassJob(self._async_report_deferred_states),
+        )
+        return None
+
+    async def _async_report_deferred_states(self, *_: Any) -> None:
+        """Add states deferred by the report filter to pending."""
+        self._unsub_report_deferred_states = None
+        for pending_state in await self._async_schedule_states(self._report_filter.pop_deferred(), []):
+            self._debug_log(
+                f"Deferred state report with value '{pending_state.get_value()}' scheduled for {pending_state!r}"
+            )
+
+        self._schedule_report_deferred_states()
         return self._schedule_report_states()
 
     async def _async_initial_report(self, *_: Any) -> None:
-        """Schedule initial report."""
+        """Report states of all exposed devices.
+
+        States are built while the report is sent, so the whole home is never held in memory at once.
+        """
         self._debug_log("Reporting initial states")
-        for state in self._hass.states.async_all():
+        self._report_seq += 1
+        return self._async_report_device_states(self._iter_initial_device_states(self._report_seq), self._report_seq)
+
+    def _iter_initial_device_states(self, seq: int) -> Iterator[DeviceState]:
+        """Yield states of exposed devices for the initial report.
+
+        States of capabilities and properties that already were reported by a newer report are skipped later.
+        """
+        for state in self._entry_data.exposure.async_get_exposed_states():
             device = Device(self._hass, self._entry_data, state.entity_id, state)
-            if device.should_expose:
-                await self._pending.async_add(device.get_capabilities(), [])
-                await self._pending.async_add([p for p in device.get_properties() if p.heartbeat_report], [])
+            device_states: list[ReportableDeviceState] = [
+                *device.get_capabilities(),
+                *[p for p in device.get_properties() if p.heartbeat_report],
+            ]
 
-        return self._schedule_report_states()
+            for device_state in self._iter_device_states({device.id: device_states}):
+                for instance_state in _iter_instance_states(device_state):
+                    key = (device_state.id, instance_state.type, instance_state.state.instance)
+                    if self._report_seqs.get(key, 0) < seq:
+                        self._report_seqs[key] = seq
+
+                yield device_state
+
+        return None
 
     async def _async_hearbeat_report(self, *_: Any) -> None:
-        """Schedule periodical state report."""
-        self._debug_log("Reporting states (heartbeat)")
-        for state in self._hass.states.async_all():
+        """Schedule periodical state report of devices from the current bucket.
+
+        Devices are split into buckets, one bucket is reported per tick, so every device is reported once per interval.
+        """
+        bucket, self._heartbeat_bucket = self._heartbeat_bucket, (self._heartbeat_bucket + 1) % HEARTBEAT_REPORT_BUCKETS
+        self._debug_log(f"Reporting states (heartbeat, bucket {bucket})")
+
+        for state in self._iter_heartbeat_states(bucket):
             device = Device(self._hass, self._entry_data, state.entity_id, state)
-            if device.should_expose:
-                await self._pending.async_add([p for p in device.get_properties() if p.heartbeat_report], [])
+            await self._async_schedule_states([p for p in device.get_properties() if p.heartbeat_report], [])
 
         self._unsub_heartbeat_report = async_call_later(
             self._hass,
-            delay=HEARTBEAT_REPORT_INTERVAL,
+            delay=HEARTBEAT_REPORT_INTERVAL / HEARTBEAT_REPORT_BUCKETS,
             action=HassJob(self._async_hearbeat_report),
         )
         return self._schedule_report_states()
 
+    def _iter_heartbeat_states(self, bucket: int) -> Iterator[State]:
+        """Yield states of exposed entities from the heartbeat bucket.
+
+        Without the exposure index tracking the bucket of every exposed entity is calculated.
+        """
+        if self._heartbeat_buckets is None:
+            for state in self._entry_data.exposure.async_get_exposed_states():
+                if _get_heartbeat_bucket(state.entity_id) == bucket:
+                    yield state
+
+            return None
+
+        for entity_id in list(self._heartbeat_buckets[bucket]):
+            if (bucket_state := self._hass.states.get(entity_id)) is not None:
+                yield bucket_state
+
+        return None
+
     def _schedule_report_states(self) -> None:
-        """Schedule run report states job if there are pending states."""
-        if self._pending.empty or self._unsub_report_states:
+        """Schedule report of pending states.
+
+        Time sensitive states are reported immediately, other states are batched within the report window.
+        """
+        if self._pending.time_sensitive and not self._unsub_report_time_sensitive_states:
+            self._unsub_report_time_sensitive_states = async_call_later(
+                self._hass, delay=0, action=HassJob(self._async_report_time_sensitive_states)
+            )
+
+        if not self._pending.delayable or self._unsub_report_states:
             return None
 
+        if self._hass.loop.time() - self._reported_at > REPORT_STATE_WINDOW_MAX.total_seconds():
+            self._report_window = REPORT_STATE_WINDOW_MIN
+
         self._unsub_report_states = async_call_later(
-            self._hass,
-            delay=0 if self._pending.time_sensitive else REPORT_STATE_WINDOW,
-            action=HassJob(self._async_report_states),
+            self._hass, delay=self._report_window, action=HassJob(self._async_report_states)
         )
+        return None
+
+
+async def async_remove_failed_states_stores(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove stores of unsent states of the config entry for all platforms."""
+    for platform in SmartHomePlatform:
+        await _get_failed_states_store(hass, entry_id, platform).async_remove()
+
+    return None
+
+
+@callback
+@singleton(DATA_CALLBACK_SESSION)
+def async_get_callback_session(hass: HomeAssistant) -> ClientSession:
+    """Return client session for callback requests shared by all notifiers.
+
+    The session uses pooled connector of Home Assistant and collects connection metrics of notifiers.
+    """
+    trace_config = TraceConfig()
+    trace_config.on_connection_create_end.append(_async_on_connection_create_end)  # type: ignore[arg-type]
+    trace_config.on_connection_reuseconn.append(_async_on_connection_reuseconn)  # type: ignore[arg-type]
+
+    # the session outlives config entries, so it is detached only on shutdown
+    session = async_create_clientsession(hass, auto_cleanup=False, trace_configs=[trace_config])
+
+    @callback
+    def _async_detach_session(_: Event) -> None:
+        session.detach()
 
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_detach_session)
+    return session
+
+
+async def _async_on_connection_create_end(
+    _session: ClientSession, context: SimpleNamespace, _params: TraceConnectionCreateEndParams
+) -> None:
+    """Count a new connection."""
+    if context.trace_request_ctx and isinstance(metrics := context.trace_request_ctx.get("metrics"), NotifierMetrics):
+        metrics.connections_created += 1
+
+
+async def _async_on_connection_reuseconn(
+    _session: ClientSession, context: SimpleNamespace, _params: TraceConnectionReuseconnParams
+) -> None:
+    """Count a reused connection."""
+    if context.trace_request_ctx and isinstance(metrics := context.trace_request_ctx.get("metrics"), NotifierMetrics):
+        metrics.connections_reused += 1
+
+
+def _get_float_value(state: ReportableDeviceState) -> float | None:
+    """Return value of a float property, errors are ignored here and reported later."""
+    try:
+        value = state.get_value()
+    except APIError:
         return None
 
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+
+    return None
+
+
+def _in_deadband(value: float, reported_value: float, deadband: float | str | None) -> bool:
+    """Test if difference between the value and the last reported value is within the deadband."""
+    if deadband is None:
+        return False
+
+    if isinstance(deadband, str):
+        return abs(value - reported_value) < abs(reported_value) * float(deadband.rstrip("%")) / 100
+
+    return abs(value - reported_value) < deadband
+
+
+def _iter_instance_states(state: DeviceState) -> Iterator[CapabilityInstanceState | PropertyInstanceState]:
+    """Yield states of capabilities and properties of the device."""
+    yield from state.capabilities or []
+    yield from state.properties or []
+
+
+def _get_failed_states_store(
+    hass: HomeAssistant, entry_id: str, platform: SmartHomePlatform
+) -> Store[list[dict[str, Any]]]:
+    """Return store of unsent states of the config entry for the platform."""
+    return Store(hass, 1, f"{DOMAIN}.notifier.{entry_id}_{platform}")
+
+
+def _get_heartbeat_bucket(device_id: str) -> int:
+    """Return heartbeat bucket of the device (stable across restarts)."""
+    return zlib.crc32(device_id.encode()) % HEARTBEAT_REPORT_BUCKETS
+
+
+def _iter_device_states_chunks(
+    states: Iterable[DeviceState], max_devices: int, max_size: int
+) -> Iterator[list[DeviceState]]:
+    """Lazily split device states into chunks limited by number of devices and size of serialized states.
+
+    A serialized state is cached by the model and reused in the request payload.
+    """
+    chunk: list[DeviceState] = []
+    chunk_size = 0
+
+    for state in states:
+        state_size = len(state.as_json().encode())
+        if chunk and (len(chunk) >= max_devices or chunk_size + state_size > max_size):
+            yield chunk
+            chunk, chunk_size = [], 0
+
+        chunk.append(state)
+        chunk_size += state_size
+
+    if chunk:
+        yield chunk
+
 
 class YandexDirectNotifier(Notifier):
     """Notifier for direct connection."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Protocol, Self, runtime_checkable
 
 from homeassistant.const import ATTR_DEVICE_CLASS
@@ -89,6 +90,11 @@ class Property(Protocol):
         """Test if the property value differs from other property."""
         ...
 
+    @cached_property
+    def key(self) -> tuple[str, str, str]:
+        """Return identity key of the property: device id, type and instance."""
+        return self.device_id, self.type, self.instance
+
     def __str__(self) -> str:
         """Return string representation."""
         return f"instance {self.instance} of {self.type.short} property of {self.device_id}"
@@ -104,13 +110,18 @@ class Property(Protocol):
         )
 
     def __eq__(self, other: Any) -> bool:
-        """Compare properties."""
-        return bool(
-            isinstance(other, Property)
-            and self.type == other.type
-            and self.instance == other.instance
-            and self.device_id == other.device_id
-        )
+        """Compare property keys."""
+        if self is other:
+            return True
+
+        try:
+            return bool(self.key == other.key)
+        except AttributeError:
+            return False
+
+    def __hash__(self) -> int:
+        """Return hash of the property key."""
+        return hash(self.key)
 
 
 @runtime_checkable
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from copy import copy
 from functools import cached_property
 import logging
 from typing import TYPE_CHECKING, Any, Protocol, Self, cast
@@ -117,15 +118,10 @@ class CustomProperty(Property, Protocol):
             raise APIError(ResponseCode.INVALID_VALUE, f"Failed to get current value for {self}: {exc!r}")
 
     def new_with_value(self, value: Any) -> Self:
-        """Return copy of the state with new value."""
-        return self.__class__(
-            self._hass,
-            self._entry_data,
-            self._config,
-            self.device_id,
-            self._value_template,
-            value,
-        )
+        """Return copy of the state with new value (attributes cached from the configuration are shared)."""
+        state = copy(self)
+        state._value = value
+        return state
 
     def __repr__(self) -> str:
         """Return the representation."""
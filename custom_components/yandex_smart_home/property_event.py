@@ -1,10 +1,11 @@
 """Implement the Yandex Smart Home event properties."""
 
 from abc import abstractmethod
-from functools import cached_property
+from collections.abc import Iterable, Mapping
+from functools import cached_property, lru_cache
 from itertools import chain
 import logging
-from typing import Any, Protocol, Self, cast
+from typing import Any, Generic, Protocol, Self
 
 from homeassistant.components import binary_sensor, sensor
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
@@ -59,6 +60,39 @@ _BOOLEAN_FALSE = ["no", "false", "0", STATE_OFF]
 
 type EventMapT[EventInstanceEventT] = dict[EventInstanceEventT, list[str]]
 
+EVENT_MAPS_CACHE_SIZE = 1024
+
+
+class EventMap(Generic[EventInstanceEventT]):
+    """Compiled reverse mapping from HA values to Yandex events, the first mapped event wins."""
+
+    def __init__(self, event_map: Mapping[EventInstanceEventT, Iterable[str]]):
+        """Compile the mapping."""
+        self._events: dict[str, EventInstanceEventT] = {}
+        for event, values in event_map.items():
+            for value in values:
+                self._events.setdefault(value, event)
+
+        self.supported_native_values: tuple[str, ...] = tuple(chain.from_iterable(event_map.values()))
+
+    def get_event(self, value: str) -> EventInstanceEventT | None:
+        """Return Yandex event for HA value."""
+        return self._events.get(value)
+
+
+@lru_cache(maxsize=EVENT_MAPS_CACHE_SIZE)
+def _get_event_map(
+    property_type: type["EventProperty[Any]"],
+    instance: EventPropertyInstance,
+    event_map_config: tuple[tuple[str, tuple[str, ...]], ...],
+) -> EventMap[Any]:
+    """Return compiled event mapping shared by all properties with the same class, instance and configuration."""
+    if event_map_config:
+        event_cls = get_event_class_for_instance(instance)
+        return EventMap({event_cls(k): v for k, v in event_map_config})
+
+    return EventMap(property_type._event_map_default)
+
 
 class EventProperty(Property, Protocol[EventInstanceEventT]):
     """Base class for event properties."""
@@ -90,23 +124,6 @@ class EventProperty(Property, Protocol[EventInstanceEventT]):
         """Test if value changes should be reported immediately."""
         return True
 
-    @property
-    def event_map(self) -> dict[EventInstanceEventT, list[str]]:
-        """Return an event mapping between Yandex and HA."""
-        return self.event_map_config or self._event_map_default
-
-    @property
-    def event_map_config(self) -> dict[EventInstanceEventT, list[str]]:
-        """Return an event mapping from a entity configuration."""
-        if CONF_ENTITY_EVENT_MAP in self._entity_config:
-            event_cls = get_event_class_for_instance(self.instance)
-            return cast(
-                dict[EventInstanceEventT, list[str]],
-                {event_cls(k): v for k, v in self._entity_config[CONF_ENTITY_EVENT_MAP].get(self.instance, {}).items()},
-            )
-
-        return {}
-
     def get_value(self) -> EventInstanceEvent | None:
         """Return the current property value."""
         value = str(self._get_native_value()).lower()
@@ -114,9 +131,8 @@ class EventProperty(Property, Protocol[EventInstanceEventT]):
         if value in (STATE_UNAVAILABLE, STATE_UNKNOWN, STATE_NONE, STATE_NONE_UI, STATE_EMPTY):
             return None
 
-        for event, values in self.event_map.items():
-            if value in values:
-                return event
+        if (event := self._event_map.get_event(value)) is not None:
+            return event
 
         _LOGGER.debug(f"Unknown event {value} for instance {self.instance} of {self.device_id}")
 
@@ -133,9 +149,20 @@ class EventProperty(Property, Protocol[EventInstanceEventT]):
         ...
 
     @cached_property
-    def _supported_native_values(self) -> list[str]:
-        """Return a list of supported native values."""
-        return list(chain.from_iterable(self.event_map.values()))
+    def _event_map(self) -> EventMap[EventInstanceEventT]:
+        """Return compiled event mapping."""
+        event_map_config: tuple[tuple[str, tuple[str, ...]], ...] = ()
+        if CONF_ENTITY_EVENT_MAP in self._entity_config:
+            event_map_config = tuple(
+                (k, tuple(v)) for k, v in self._entity_config[CONF_ENTITY_EVENT_MAP].get(self.instance, {}).items()
+            )
+
+        return _get_event_map(type(self), self.instance, event_map_config)
+
+    @property
+    def _supported_native_values(self) -> tuple[str, ...]:
+        """Return supported native values."""
+        return self._event_map.supported_native_values
 
 
 class SensorEventProperty(EventProperty[Any]):
@@ -500,12 +527,10 @@ class ButtonPressStateEventProperty(StateEventProperty, ReactiveEventProperty, B
             return True
 
         if self.state.domain == sensor.DOMAIN and self._state_device_class == XGW3DeviceClass.ACTION:
-            possible_actions = self._supported_native_values
-            possible_actions.extend(
-                [
-                    "long_click_release",
-                    "release",
-                ]
+            possible_actions = (
+                *self._supported_native_values,
+                "long_click_release",
+                "release",
             )
 
             return self.state.attributes.get("action") in possible_actions
@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from contextlib import suppress
 from functools import cached_property
 import logging
-from typing import Protocol, Self
+from typing import Callable, Protocol, Self
 
 from homeassistant.components import air_quality, climate, fan, humidifier, light, sensor, switch, water_heater
 from homeassistant.components.air_quality import ATTR_CO2, ATTR_PM_0_1, ATTR_PM_2_5, ATTR_PM_10
@@ -109,26 +109,19 @@ class FloatProperty(Property, Protocol):
         if value is None:
             return None
 
-        if str(value).lower() in (STATE_UNAVAILABLE, STATE_UNKNOWN, STATE_NONE, STATE_NONE_UI, STATE_EMPTY):
-            return None
-
+        # numeric values are never unknown, so try to parse them first
         try:
             float_value = float(value)
         except (ValueError, TypeError):
+            if str(value).lower() in (STATE_UNAVAILABLE, STATE_UNKNOWN, STATE_NONE, STATE_NONE_UI, STATE_EMPTY):
+                return None
+
             raise APIError(ResponseCode.NOT_SUPPORTED_IN_CURRENT_MODE, f"Unsupported value '{value}' for {self}")
 
-        if self._native_unit_of_measurement and self.unit_of_measurement and self._unit_converter:
-            if self._native_unit_of_measurement in self._unit_converter.VALID_UNITS:
-                float_value = self._unit_converter.convert(
-                    float_value, self._native_unit_of_measurement, self.unit_of_measurement
-                )
-            else:
-                _LOGGER.warning(
-                    f"Unsupported unit of measurement '{self._native_unit_of_measurement}' for {self}. "
-                    f"Valid units are: %s" % ", ".join(sorted(map(str, self._unit_converter.VALID_UNITS)))
-                )
+        if self._unit_conversion:
+            float_value = self._unit_conversion(float_value)
 
-        lower_limit, upper_limit = self.parameters.range
+        lower_limit, upper_limit = self._range
         if lower_limit is not None and float_value < lower_limit:
             return lower_limit
         if upper_limit is not None and float_value > upper_limit:
@@ -171,6 +164,27 @@ class FloatProperty(Property, Protocol):
         """Return the unit converter."""
         return None  # pragma: nocover
 
+    @cached_property
+    def _unit_conversion(self) -> Callable[[float], float] | None:
+        """Return a function to convert the native value to the property unit."""
+        if not self._native_unit_of_measurement or not self.unit_of_measurement or not self._unit_converter:
+            return None
+
+        if self._native_unit_of_measurement not in self._unit_converter.VALID_UNITS:
+            _LOGGER.warning(
+                f"Unsupported unit of measurement '{self._native_unit_of_measurement}' for {self}. "
+                f"Valid units are: %s" % ", ".join(sorted(map(str, self._unit_converter.VALID_UNITS)))
+            )
+            return None
+
+        # conversion functions are cached by the converter for each pair of units
+        return self._unit_converter.converter_factory(self._native_unit_of_measurement, self.unit_of_measurement)
+
+    @cached_property
+    def _range(self) -> tuple[int | None, int | None]:
+        """Return limits of the property value."""
+        return self.parameters.range
+
 
 class TemperatureProperty(FloatProperty, ABC):
     """Base class for temperature properties."""
@@ -1,9 +1,45 @@
 """Base class for API response schemas."""
 
+from enum import StrEnum
+import json
 from typing import Any
 
 from pydantic.v1 import BaseModel
 from pydantic.v1.generics import GenericModel
+from pydantic.v1.json import pydantic_encoder
+
+
+class SerializerBackend(StrEnum):
+    """Backend used to serialize API models."""
+
+    PYDANTIC = "pydantic"
+    FAST = "fast"
+
+
+_serializer_backend = SerializerBackend.PYDANTIC
+
+
+def get_serializer_backend() -> SerializerBackend:
+    """Return current serializer backend."""
+    return _serializer_backend
+
+
+def set_serializer_backend(backend: SerializerBackend) -> None:
+    """Change serializer backend for all API models."""
+    global _serializer_backend
+    _serializer_backend = backend
+
+
+def _fast_encode(value: Any) -> Any:
+    """Convert a value to builtin types the same way as BaseModel.dict(exclude_none=True) does."""
+    if isinstance(value, BaseModel):
+        return {k: _fast_encode(v) for k, v in value.__dict__.items() if v is not None}
+    if isinstance(value, dict):
+        return {k: _fast_encode(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return value.__class__(_fast_encode(v) for v in value)
+
+    return value
 
 
 class APIModel(BaseModel):
@@ -11,10 +47,16 @@ class APIModel(BaseModel):
 
     def as_json(self) -> str:
         """Generate a JSON representation of the model."""
+        if _serializer_backend == SerializerBackend.FAST:
+            return json.dumps(_fast_encode(self), default=pydantic_encoder, ensure_ascii=False)
+
         return super().json(exclude_none=True, ensure_ascii=False)
 
     def as_dict(self) -> dict[str, Any]:
         """Generate a dictionary representation of the model."""
+        if _serializer_backend == SerializerBackend.FAST:
+            return dict(_fast_encode(self))
+
         return super().dict(exclude_none=True)
 
 
@@ -4,6 +4,7 @@ https://yandex.ru/dev/dialogs/smart-home/doc/reference-alerts/resources-alerts.h
 """
 
 from enum import StrEnum
+import json
 import time
 
 from pydantic.v1 import Field
@@ -18,6 +19,11 @@ class CallbackStatesRequestPayload(APIModel):
     user_id: str
     devices: list[DeviceState]
 
+    def as_json(self) -> str:
+        """Generate a JSON representation of the model from cached device states."""
+        devices = ", ".join(d.as_json() for d in self.devices)
+        return f'{{"user_id": {json.dumps(self.user_id, ensure_ascii=False)}, "devices": [{devices}]}}'
+
 
 class CallbackStatesRequest(APIModel):
     """Request body for notification about device state change."""
@@ -25,6 +31,10 @@ class CallbackStatesRequest(APIModel):
     ts: float = Field(default_factory=lambda: time.time())
     payload: CallbackStatesRequestPayload
 
+    def as_json(self) -> str:
+        """Generate a JSON representation of the model, the payload is serialized by itself."""
+        return f'{{"ts": {json.dumps(self.ts)}, "payload": {self.payload.as_json()}}}'
+
 
 class CallbackDiscoveryRequestPayload(APIModel):
     """Payload of request body for notification about change of devices' parameters."""
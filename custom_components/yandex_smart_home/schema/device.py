@@ -6,8 +6,11 @@ https://yandex.ru/dev/dialogs/smart-home/doc/reference/post-action.html
 """
 
 from enum import StrEnum
+import json
 from typing import Any, Literal
 
+from pydantic.v1 import PrivateAttr
+
 from .base import APIModel
 from .capability import (
     CapabilityDescription,
@@ -100,6 +103,15 @@ class DeviceDescription(APIModel):
     properties: list[PropertyDescription] | None = None
     device_info: DeviceInfo | None = None
 
+    _json: str | None = PrivateAttr(default=None)
+
+    def as_json(self) -> str:
+        """Generate a JSON representation of the model, the result is cached (description must not be changed)."""
+        if self._json is None:
+            self._json = super().as_json()
+
+        return self._json
+
 
 class DeviceState(APIModel):
     """Device state for a state query request."""
@@ -110,6 +122,15 @@ class DeviceState(APIModel):
     error_code: ResponseCode | None = None
     error_message: str | None = None
 
+    _json: str | None = PrivateAttr(default=None)
+
+    def as_json(self) -> str:
+        """Generate a JSON representation of the model, the result is cached (state must not be changed)."""
+        if self._json is None:
+            self._json = super().as_json()
+
+        return self._json
+
 
 class DeviceList(ResponsePayload):
     """Response payload for a device list request."""
@@ -117,6 +138,11 @@ class DeviceList(ResponsePayload):
     user_id: str
     devices: list[DeviceDescription]
 
+    def as_json(self) -> str:
+        """Generate a JSON representation of the model from cached device descriptions."""
+        devices = ", ".join(d.as_json() for d in self.devices)
+        return f'{{"user_id": {json.dumps(self.user_id, ensure_ascii=False)}, "devices": [{devices}]}}'
+
 
 class DeviceStates(ResponsePayload):
     """Response payload for a state query request."""
@@ -4,6 +4,7 @@ https://yandex.ru/dev/dialogs/smart-home/doc/concepts/response-codes.html
 """
 
 from enum import StrEnum
+import json
 
 from .base import APIModel
 
@@ -50,3 +51,14 @@ class Response(APIModel):
 
     request_id: str | None = None
     payload: ResponsePayload | None = None
+
+    def as_json(self) -> str:
+        """Generate a JSON representation of the model, the payload is serialized by itself."""
+        if self.payload is None:
+            return super().as_json()
+
+        payload = self.payload.as_json()
+        if self.request_id is None:
+            return f'{{"payload": {payload}}}'
+
+        return f'{{"request_id": {json.dumps(self.request_id, ensure_ascii=False)}, "payload": {payload}}}'
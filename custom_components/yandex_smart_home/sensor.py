@@ -0,0 +1,135 @@
+"""Diagnostic sensors with metrics of notifiers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Callable
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorEntityDescription, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, SIGNAL_NOTIFIERS_SETUP
+
+if TYPE_CHECKING:
+    from . import YandexSmartHome
+    from .notifier import Notifier
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass(frozen=True, kw_only=True)
+class NotifierSensorEntityDescription(SensorEntityDescription):
+    """Describe a sensor with a metric of the notifier."""
+
+    value_fn: Callable[[Notifier], float | int | None]
+
+
+def _get_latency_ms(notifier: Notifier, percent: int) -> float | None:
+    """Return a percentile of callback request latency in milliseconds."""
+    if (latency := notifier.metrics.get_latency_percentile(percent)) is not None:
+        return round(latency * 1000, 1)
+
+    return None
+
+
+SENSORS: tuple[NotifierSensorEntityDescription, ...] = (
+    NotifierSensorEntityDescription(
+        key="events",
+        translation_key="events",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda n: n.metrics.events,
+    ),
+    NotifierSensorEntityDescription(
+        key="scheduled_states",
+        translation_key="scheduled_states",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda n: n.metrics.scheduled_states,
+    ),
+    NotifierSensorEntityDescription(
+        key="pending_states",
+        translation_key="pending_states",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda n: n.pending_states,
+    ),
+    NotifierSensorEntityDescription(
+        key="requests",
+        translation_key="requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda n: n.metrics.requests,
+    ),
+    NotifierSensorEntityDescription(
+        key="failed_requests",
+        translation_key="failed_requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda n: n.metrics.failed_requests,
+    ),
+    NotifierSensorEntityDescription(
+        key="payload_bytes",
+        translation_key="payload_bytes",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda n: n.metrics.payload_bytes,
+    ),
+    *(
+        NotifierSensorEntityDescription(
+            key=f"latency_p{percent}",
+            translation_key=f"latency_p{percent}",
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            state_class=SensorStateClass.MEASUREMENT,
+            value_fn=partial(_get_latency_ms, percent=percent),
+        )
+        for percent in (50, 95, 99)
+    ),
+)
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
+    """Set up sensors for notifiers of the config entry, notifiers may be set up after Home Assistant start."""
+    component: YandexSmartHome = hass.data[DOMAIN]
+    entry_data = component.get_entry_data(entry)
+
+    @callback
+    def _async_add_notifier_sensors() -> None:
+        async_add_entities(
+            NotifierSensor(entry, notifier, description) for notifier in entry_data.notifiers for description in SENSORS
+        )
+
+    _async_add_notifier_sensors()
+    entry.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_NOTIFIERS_SETUP.format(entry.entry_id), _async_add_notifier_sensors)
+    )
+
+
+class NotifierSensor(SensorEntity):
+    """Representation of a notifier metric."""
+
+    entity_description: NotifierSensorEntityDescription
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, entry: ConfigEntry, notifier: Notifier, description: NotifierSensorEntityDescription):
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._notifier = notifier
+
+        self._attr_unique_id = f"{entry.entry_id}_notifier_{notifier.platform}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry.entry_id}_notifier_{notifier.platform}")},
+            name=f"{entry.title} ({notifier.platform})",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the value of the metric."""
+        return self.entity_description.value_fn(self._notifier)
@@ -530,3 +530,22 @@ async def test_capability_service_call(hass: HomeAssistant, entry_data: MockConf
     assert mock.call_args_list[0].kwargs["blocking"] is True
     assert mock.call_args_list[1].kwargs["blocking"] is True
     assert mock.call_args_list[2].kwargs["blocking"] is False
+
+
+async def test_capability_key(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    state = State("switch.test", STATE_ON)
+    cap = get_exact_one_capability(hass, entry_data, state, CapabilityType.ON_OFF, OnOffCapabilityInstance.ON)
+    assert cap.key == ("switch.test", "devices.capabilities.on_off", "on")
+
+    same_cap = get_exact_one_capability(hass, entry_data, state, CapabilityType.ON_OFF, OnOffCapabilityInstance.ON)
+    assert same_cap is not cap
+    assert same_cap == cap
+    assert hash(same_cap) == hash(cap)
+    assert len({cap, same_cap}) == 1
+
+    other_state = State("switch.other", STATE_ON)
+    other_cap = get_exact_one_capability(
+        hass, entry_data, other_state, CapabilityType.ON_OFF, OnOffCapabilityInstance.ON
+    )
+    assert other_cap != cap
+    assert cap != "switch.test"
@@ -41,7 +41,14 @@ from custom_components.yandex_smart_home.capability_color import (
     ColorTemperatureCapability,
     RGBColorCapability,
 )
-from custom_components.yandex_smart_home.color import ColorConverter, ColorName, rgb_to_int
+from custom_components.yandex_smart_home.color import (
+    ColorConverter,
+    ColorName,
+    ColorProfiles,
+    get_color_converter,
+    int_to_rgb,
+    rgb_to_int,
+)
 from custom_components.yandex_smart_home.const import CONF_COLOR_PROFILE, CONF_ENTITY_MODE_MAP
 from custom_components.yandex_smart_home.entry_data import ConfigEntryData
 from custom_components.yandex_smart_home.helpers import APIError
@@ -440,6 +447,59 @@ async def test_capability_color_setting_rgb_with_internal_profile(
         assert calls[0].data == {ATTR_ENTITY_ID: state.entity_id, ATTR_RGB_COLOR: (255, 0, 0)}
 
 
+async def test_capability_color_setting_shared_converters(hass: HomeAssistant) -> None:
+    config = _get_color_profile_entry_data(
+        hass, {"light.test": {CONF_COLOR_PROFILE: "test"}, "light.other": {CONF_COLOR_PROFILE: "test"}}
+    )
+    assert config.color_profiles is config.color_profiles
+    assert ColorProfiles._default_profiles["natural"].get(ColorName.WHITE) is None
+
+    caps = []
+    for entity_id in ("light.test", "light.other"):
+        state = State(
+            entity_id,
+            STATE_OFF,
+            {
+                ATTR_SUPPORTED_COLOR_MODES: [ColorMode.RGB, ColorMode.COLOR_TEMP],
+                ATTR_MIN_COLOR_TEMP_KELVIN: 2000,
+                ATTR_MAX_COLOR_TEMP_KELVIN: 6510,
+            },
+        )
+        caps.append(
+            (
+                cast(
+                    RGBColorCapability,
+                    get_exact_one_capability(
+                        hass, config, state, CapabilityType.COLOR_SETTING, ColorSettingCapabilityInstance.RGB
+                    ),
+                ),
+                _get_temperature_capability(hass, config, state),
+            )
+        )
+
+    assert caps[0][0]._converter is caps[1][0]._converter
+    assert caps[0][1]._converter is caps[1][1]._converter
+    assert get_color_converter(None) is get_color_converter({})
+    assert get_color_converter(None) is not caps[0][0]._converter
+
+    converter = caps[0][0]._converter
+    for ha_value, yandex_value in converter._ha_mapping.items():
+        ha_color = int_to_rgb(ha_value)
+        for offset in range(-3, 4):
+            color = RGBColor(ha_color.r, max(0, min(255, ha_color.g + offset)), ha_color.b)
+            expected = rgb_to_int(color)
+            for mapped_ha_value, mapped_yandex_value in converter._ha_mapping.items():
+                mapped_color = int_to_rgb(mapped_ha_value)
+                if (color.r - mapped_color.r) ** 2 + (color.g - mapped_color.g) ** 2 + (
+                    color.b - mapped_color.b
+                ) ** 2 <= 4:
+                    expected = mapped_yandex_value
+                    break
+
+            assert converter.get_yandex_color(color) == expected
+        assert converter.get_yandex_color(ha_color) == yandex_value
+
+
 @pytest.mark.parametrize(
     "attributes,temp_range",
     [
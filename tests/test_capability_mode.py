@@ -154,6 +154,44 @@ async def test_capability_mode_custom_mapping(hass: HomeAssistant) -> None:
     assert cap.supported_yandex_modes == [ModeCapabilityMode.ECO, ModeCapabilityMode.LATTE]
 
 
+async def test_capability_mode_compiled_map(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    state = State("switch.test", STATE_OFF, {"modes_list": ["mode_1", "Mode_2", "foo"]})
+    cap = MockModeCapabilityA(hass, entry_data, state.entity_id, state)
+    other_cap = MockModeCapabilityA(hass, entry_data, "switch.other", state)
+    assert cap._mode_map is other_cap._mode_map
+    assert cap._mode_map is not MockModeCapability(hass, entry_data, state.entity_id, state)._mode_map
+
+    assert cap.get_ha_mode_by_yandex_mode(ModeCapabilityMode.PIZZA) == "Mode_2"
+    assert cap.get_ha_mode_by_yandex_mode(ModeCapabilityMode.THREE) == "foo"
+    assert cap.get_ha_mode_by_yandex_mode(ModeCapabilityMode.PIZZA) == "Mode_2"
+    assert MockModeCapability._modes_map_default[ModeCapabilityMode.PIZZA] == ["mode_2"]
+
+    state = State("switch.test", STATE_OFF, {"modes_list": ["mode_1", "Mode_2", "foo", "bar"]})
+    cap = MockModeCapabilityA(hass, entry_data, state.entity_id, state)
+    assert cap._mode_map is not other_cap._mode_map
+    assert cap.supported_yandex_modes == [
+        ModeCapabilityMode.FOUR,
+        ModeCapabilityMode.FOWL,
+        ModeCapabilityMode.PIZZA,
+        ModeCapabilityMode.THREE,
+    ]
+
+
+async def test_capability_mode_unsupported_ha_mode(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    state = State("switch.test", STATE_OFF, {"modes_list": ["mode_1", "mode_3"]})
+    cap = MockModeCapability(hass, entry_data, state.entity_id, state)
+    assert cap._mode_map.get_yandex_mode("mode_2") == (ModeCapabilityMode.PIZZA, True)
+    assert cap._mode_map.get_yandex_mode("eco") == (ModeCapabilityMode.ECO, False)
+    assert cap._mode_map.get_yandex_mode("mode_3") == (ModeCapabilityMode.PUERH_TEA, True)
+
+    with pytest.raises(APIError) as e:
+        cap.get_yandex_mode_by_ha_mode("mode_2")
+    assert e.value.code == ResponseCode.INVALID_VALUE
+
+    assert cap.get_yandex_mode_by_ha_mode("eco") == ModeCapabilityMode.ECO
+    assert cap.get_yandex_mode_by_ha_mode("mode_3") == ModeCapabilityMode.PUERH_TEA
+
+
 async def test_capability_mode_fallback_index(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
     state = State("switch.test", STATE_OFF, {"modes_list": ["some", "mode_1", "foo", "off"]})
     cap = MockModeCapabilityA(hass, entry_data, state.entity_id, state)
@@ -1,3 +1,4 @@
+import asyncio
 from asyncio import TimeoutError
 import json
 from typing import Any, Generator, Self
@@ -17,6 +18,8 @@ from pytest_homeassistant_custom_component.test_util.aiohttp import AiohttpClien
 
 from custom_components.yandex_smart_home import DOMAIN, YandexSmartHome
 from custom_components.yandex_smart_home.cloud import CloudManager
+from custom_components.yandex_smart_home.helpers import RequestData
+from custom_components.yandex_smart_home.schema import Response
 
 
 class MockWSConnection:
@@ -483,3 +486,139 @@ async def test_cloud_req_user_devices_action(
     switch_ac_state = hass.states.get("switch.ac")
     assert switch_ac_state
     assert switch_ac_state.state == "on"
+
+
+async def test_cloud_req_pipelining(
+    hass_platform: HomeAssistant, config_entry_cloud: MockConfigEntry, aioclient_mock: AiohttpClientMocker
+) -> None:
+    hass = hass_platform
+    slow_request_done = asyncio.Event()
+
+    async def _async_handle_request(_hass: HomeAssistant, data: RequestData, action: str, _payload: str) -> Response:
+        if action == "slow":
+            await slow_request_done.wait()
+
+        return Response(request_id=data.request_id)
+
+    requests = [
+        {"request_id": "req_slow", "platform": "yandex", "action": "slow"},
+        {"request_id": "req_fast_1", "platform": "yandex", "action": "fast"},
+        {"request_id": "req_fast_2", "platform": "yandex", "action": "fast"},
+    ]
+    session = MockSession(
+        aioclient_mock, msg=[WSMessage(type=WSMsgType.TEXT, extra=None, data=json.dumps(r)) for r in requests]
+    )
+    with (
+        patch("custom_components.yandex_smart_home.cloud.MAX_IN_FLIGHT_REQUESTS", 2),
+        patch("custom_components.yandex_smart_home.handlers.async_handle_request", _async_handle_request),
+    ):
+        mock_client_session(hass, session)
+        config_entry_cloud.add_to_hass(hass)
+        await hass.config_entries.async_setup(config_entry_cloud.entry_id)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        manager = _get_manager(hass, config_entry_cloud)
+        assert session.ws
+        assert [json.loads(r)["request_id"] for r in session.ws.send_queue] == ["req_fast_1", "req_fast_2"]
+        assert manager.in_flight_requests == 1
+        assert manager.queued_requests == 0
+
+        slow_request_done.set()
+        await hass.async_block_till_done()
+        assert [json.loads(r)["request_id"] for r in session.ws.send_queue] == ["req_fast_1", "req_fast_2", "req_slow"]
+        assert manager.in_flight_requests == 0
+
+    await hass.config_entries.async_unload(config_entry_cloud.entry_id)
+
+
+async def test_cloud_req_in_flight_window(
+    hass_platform: HomeAssistant, config_entry_cloud: MockConfigEntry, aioclient_mock: AiohttpClientMocker
+) -> None:
+    hass = hass_platform
+    requests_done = asyncio.Event()
+
+    async def _async_handle_request(_hass: HomeAssistant, data: RequestData, _action: str, _payload: str) -> Response:
+        await requests_done.wait()
+        return Response(request_id=data.request_id)
+
+    requests = [{"request_id": f"req_{i}", "platform": "yandex", "action": "foo"} for i in range(3)]
+    session = MockSession(
+        aioclient_mock, msg=[WSMessage(type=WSMsgType.TEXT, extra=None, data=json.dumps(r)) for r in requests]
+    )
+    with (
+        patch("custom_components.yandex_smart_home.cloud.MAX_IN_FLIGHT_REQUESTS", 1),
+        patch("custom_components.yandex_smart_home.handlers.async_handle_request", _async_handle_request),
+    ):
+        mock_client_session(hass, session)
+        config_entry_cloud.add_to_hass(hass)
+        await hass.config_entries.async_setup(config_entry_cloud.entry_id)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        manager = _get_manager(hass, config_entry_cloud)
+        assert manager.in_flight_requests == 1
+        assert manager.queued_requests == 2
+        assert manager.get_diagnostics() == {"in_flight_requests": 1, "queued_requests": 2}
+
+        requests_done.set()
+        await hass.async_block_till_done()
+        assert session.ws
+        assert [json.loads(r)["request_id"] for r in session.ws.send_queue] == ["req_0", "req_1", "req_2"]
+        assert manager.in_flight_requests == 0
+        assert manager.queued_requests == 0
+
+    await hass.config_entries.async_unload(config_entry_cloud.entry_id)
+
+
+async def test_cloud_req_failed(
+    hass_platform: HomeAssistant,
+    config_entry_cloud: MockConfigEntry,
+    aioclient_mock: AiohttpClientMocker,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    hass = hass_platform
+    request_done = asyncio.Event()
+
+    async def _async_handle_request(_hass: HomeAssistant, data: RequestData, action: str, _payload: str) -> Response:
+        if action == "fail":
+            raise Exception("boom")
+        if action == "slow":
+            await request_done.wait()
+
+        return Response(request_id=data.request_id)
+
+    requests = [
+        {"request_id": "req_fail", "platform": "yandex", "action": "fail"},
+        {"request_id": "req_ok", "platform": "yandex", "action": "ok"},
+        {"request_id": "req_slow", "platform": "yandex", "action": "slow"},
+        {"request_id": "req_queued", "platform": "yandex", "action": "slow"},
+    ]
+    session = MockSession(
+        aioclient_mock, msg=[WSMessage(type=WSMsgType.TEXT, extra=None, data=json.dumps(r)) for r in requests]
+    )
+    with (
+        patch("custom_components.yandex_smart_home.cloud.MAX_IN_FLIGHT_REQUESTS", 1),
+        patch("custom_components.yandex_smart_home.handlers.async_handle_request", _async_handle_request),
+    ):
+        mock_client_session(hass, session)
+        config_entry_cloud.add_to_hass(hass)
+        await hass.config_entries.async_setup(config_entry_cloud.entry_id)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        manager = _get_manager(hass, config_entry_cloud)
+        assert session.ws
+        assert [json.loads(r)["request_id"] for r in session.ws.send_queue] == ["req_ok"]
+        assert "Failed to handle request req_fail" in caplog.messages
+        assert manager.get_diagnostics() == {"in_flight_requests": 1, "queued_requests": 1}
+        tasks = set(manager._request_tasks)
+        assert len(tasks) == 2
+
+        await manager.async_disconnect()
+        await hass.async_block_till_done()
+        assert all(t.cancelled() for t in tasks)
+        assert manager.get_diagnostics() == {"in_flight_requests": 0, "queued_requests": 0}
+        assert [json.loads(r)["request_id"] for r in session.ws.send_queue] == ["req_ok"]
+
+    await hass.config_entries.async_unload(config_entry_cloud.entry_id)
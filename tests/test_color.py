@@ -0,0 +1,68 @@
+import random
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.components.light import (
+    ATTR_HS_COLOR,
+    ATTR_RGB_COLOR,
+    ATTR_RGBWW_COLOR,
+    ATTR_SUPPORTED_COLOR_MODES,
+    ATTR_XY_COLOR,
+    ColorMode,
+)
+from homeassistant.const import STATE_ON
+from homeassistant.core import State
+from homeassistant.util.color import RGBColor, color_hs_to_RGB, color_xy_to_RGB
+import pytest
+
+from custom_components.yandex_smart_home import color
+from custom_components.yandex_smart_home.color import LightState, get_rgb_colors, hs_to_rgb_colors, xy_to_rgb_colors
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_bulk_color_conversion(use_numpy: bool) -> None:
+    rnd = random.Random(1)
+    hs_colors: list[tuple[float, float]] = [(h, s) for h in range(0, 361, 15) for s in (0, 1, 33.3, 50, 99.5, 100)]
+    hs_colors += [(rnd.uniform(0, 360), rnd.uniform(0, 100)) for _ in range(1000)]
+    xy_colors: list[tuple[float, float]] = [(x / 20, y / 20) for x in range(0, 21) for y in range(0, 21)]
+    xy_colors += [(rnd.random(), rnd.random()) for _ in range(1000)]
+
+    with patch.object(color, "np", color.np if use_numpy else None):
+        assert hs_to_rgb_colors(hs_colors) == [RGBColor(*color_hs_to_RGB(*c)) for c in hs_colors]
+        assert xy_to_rgb_colors(xy_colors) == [RGBColor(*color_xy_to_RGB(*c, Gamut=None)) for c in xy_colors]
+        assert hs_to_rgb_colors(hs_colors[:2]) == [RGBColor(255, 255, 255), RGBColor(255, 252, 252)]
+        assert hs_to_rgb_colors([]) == []
+        assert xy_to_rgb_colors([]) == []
+
+
+def test_get_rgb_colors() -> None:
+    class _LightState(LightState):
+        def __init__(self, state: State):
+            self.state = state
+
+    attributes: list[dict[str, Any]] = [
+        {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.HS], ATTR_HS_COLOR: (230.769, 10.196)},
+        {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.HS, ColorMode.XY], ATTR_XY_COLOR: (0.303, 0.3055)},
+        {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.XY], ATTR_HS_COLOR: (0, 100), ATTR_XY_COLOR: (0.701, 0.299)},
+        {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.RGBWW], ATTR_RGBWW_COLOR: (229, 233, 255, 10, 15)},
+        {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.RGBWW], ATTR_RGB_COLOR: (229, 233, 255)},
+        {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.RGB], ATTR_RGB_COLOR: (1, 2, 3)},
+        {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.ONOFF]},
+    ]
+    states = [State(f"light.test_{i}", STATE_ON, attributes[i % len(attributes)]) for i in range(50)]
+
+    rgb_colors = get_rgb_colors(states)
+    assert rgb_colors == [_LightState(s)._rgb_color for s in states]
+    assert rgb_colors[:7] == [
+        RGBColor(229, 233, 255),
+        RGBColor(229, 233, 255),
+        RGBColor(255, 0, 0),
+        RGBColor(229, 233, 255),
+        None,
+        RGBColor(1, 2, 3),
+        None,
+    ]
+
+    light_state = _LightState(states[0])
+    light_state.set_rgb_color(RGBColor(1, 1, 1))
+    assert light_state._rgb_color == RGBColor(1, 1, 1)
@@ -501,3 +501,37 @@ yandex_smart_home:
                 "type": "float.pm2.5_density",
             },
         ]
+
+
+async def test_invalid_report_filter(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
+    files = {
+        YAML_CONFIG_FILE: """
+yandex_smart_home:
+  entity_config:
+    sensor.test:
+      report_filter:
+        invalid:
+          deadband: 1
+"""
+    }
+    with patch_yaml_files(files):
+        assert await async_integration_yaml_config(hass, DOMAIN) is None
+    assert (
+        "Float instance 'invalid' is not supported, see valid values at "
+        "https://docs.yaha-cloud.ru/v1.0.x/devices/sensor/float/#type"
+    ) in caplog.messages[-2]
+
+    for deadband in ["-1", "'-5%'", "'foo%'", "foo"]:
+        files = {
+            YAML_CONFIG_FILE: f"""
+yandex_smart_home:
+  entity_config:
+    sensor.test:
+      report_filter:
+        power:
+          deadband: {deadband}
+"""
+        }
+        with patch_yaml_files(files):
+            assert await async_integration_yaml_config(hass, DOMAIN) is None
+        assert "Invalid config for 'yandex_smart_home'" in caplog.messages[-1]
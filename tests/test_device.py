@@ -5,7 +5,15 @@ from homeassistant.components import light, media_player
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.cover import CoverDeviceClass
 from homeassistant.components.demo.light import DemoLight
-from homeassistant.components.light import ColorMode, LightEntityFeature
+from homeassistant.components.light import (
+    ATTR_HS_COLOR,
+    ATTR_RGB_COLOR,
+    ATTR_RGBW_COLOR,
+    ATTR_SUPPORTED_COLOR_MODES,
+    ATTR_XY_COLOR,
+    ColorMode,
+    LightEntityFeature,
+)
 from homeassistant.components.media_player import MediaPlayerDeviceClass, MediaPlayerEntityFeature
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.switch import SwitchDeviceClass
@@ -51,6 +59,7 @@ from custom_components.yandex_smart_home.capability_onoff import (
 )
 from custom_components.yandex_smart_home.capability_range import BrightnessCapability, VolumeCapability
 from custom_components.yandex_smart_home.capability_toggle import MuteCapability, StateToggleCapability
+from custom_components.yandex_smart_home.color import get_rgb_colors
 from custom_components.yandex_smart_home.const import (
     CONF_BACKLIGHT_ENTITY_ID,
     CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ENTITY_ID,
@@ -69,7 +78,7 @@ from custom_components.yandex_smart_home.const import (
     CONF_ENTRY_ALIASES,
     DOMAIN,
 )
-from custom_components.yandex_smart_home.device import BacklightCapability, Device
+from custom_components.yandex_smart_home.device import BacklightCapability, Device, async_get_device_states
 from custom_components.yandex_smart_home.helpers import APIError
 from custom_components.yandex_smart_home.property_custom import (
     ButtonPressCustomEventProperty,
@@ -367,6 +376,45 @@ async def test_device_properties(hass: HomeAssistant, caplog: pytest.LogCaptureF
     assert caplog.messages[-1] == "Unsupported entity binary_sensor.foo for temperature property of sensor.temp"
 
 
+async def test_device_plan(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    state = State(
+        "media_player.tv",
+        STATE_ON,
+        attributes={ATTR_SUPPORTED_FEATURES: MediaPlayerEntityFeature.VOLUME_MUTE},
+    )
+    device = Device(hass, entry_data, state.entity_id, state)
+    assert [type(c) for c in device.get_capabilities()] == [MuteCapability]
+    assert device.get_properties() == []
+
+    plan = entry_data.device_plans.async_get(state.entity_id, state, entry_data.cache.revision)
+    assert plan.capability_types == [MuteCapability]
+    assert plan.property_types == []
+
+    with patch.object(MuteCapability, "supported", PropertyMock(return_value=True)) as mock_supported:
+        device = Device(hass, entry_data, state.entity_id, State(state.entity_id, STATE_OFF, state.attributes))
+        assert [type(c) for c in device.get_capabilities()] == [MuteCapability]
+        assert mock_supported.call_count == 1
+
+    state = State(
+        state.entity_id,
+        STATE_ON,
+        attributes={
+            ATTR_SUPPORTED_FEATURES: MediaPlayerEntityFeature.VOLUME_MUTE | MediaPlayerEntityFeature.VOLUME_SET
+        },
+    )
+    device = Device(hass, entry_data, state.entity_id, state)
+    assert [type(c) for c in device.get_capabilities()] == [VolumeCapability, MuteCapability]
+    assert entry_data.device_plans.async_get(state.entity_id, state, entry_data.cache.revision) is not plan
+
+    plan = entry_data.device_plans.async_get(state.entity_id, state, entry_data.cache.revision)
+    entry_data.cache.save_attr_value(state.entity_id, "foo", "bar")
+    assert entry_data.device_plans.async_get(state.entity_id, state, entry_data.cache.revision) is not plan
+
+    plan = entry_data.device_plans.async_get(state.entity_id, state, entry_data.cache.revision)
+    entry_data.device_plans.async_invalidate(state.entity_id)
+    assert entry_data.device_plans.async_get(state.entity_id, state, entry_data.cache.revision) is not plan
+
+
 async def test_device_info(
     hass: HomeAssistant,
     entry_data: MockConfigEntryData,
@@ -802,6 +850,37 @@ async def test_device_query(hass: HomeAssistant, entry_data: MockConfigEntryData
         assert device.query().as_dict() == {"id": "switch.test"}
 
 
+async def test_device_query_bulk_colors(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    color_attributes: list[dict[str, Any]] = [
+        {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.HS], ATTR_HS_COLOR: (120.5, 80)},
+        {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.XY], ATTR_XY_COLOR: (0.701, 0.299)},
+        {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.RGBW], ATTR_RGBW_COLOR: (255, 0, 0, 10)},
+        {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.RGB, ColorMode.COLOR_TEMP], ATTR_RGB_COLOR: (255, 255, 255)},
+        {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.ONOFF]},
+    ]
+    device_ids = []
+    for idx in range(10):
+        hass.states.async_set(f"light.test_{idx}", STATE_ON, color_attributes[idx % len(color_attributes)])
+        device_ids.append(f"light.test_{idx}")
+    hass.states.async_set("switch.test", STATE_ON)
+    device_ids += ["switch.test", "light.missing"]
+
+    with patch("custom_components.yandex_smart_home.device.BULK_COLOR_CONVERSION_MIN_LIGHTS", 100):
+        expected = [s.as_dict() for s in await async_get_device_states(hass, entry_data, device_ids)]
+
+    with patch(
+        "custom_components.yandex_smart_home.device.get_rgb_colors", wraps=get_rgb_colors
+    ) as mock_get_rgb_colors:
+        assert [s.as_dict() for s in await async_get_device_states(hass, entry_data, device_ids)] == expected
+        mock_get_rgb_colors.assert_called_once()
+        assert len(mock_get_rgb_colors.call_args[0][0]) == 10
+
+    assert expected[1]["capabilities"][0] == {
+        "type": "devices.capabilities.color_setting",
+        "state": {"instance": "rgb", "value": 16711680},
+    }
+
+
 async def test_device_execute(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
     state = State("switch.test", STATE_ON)
     device = Device(hass, entry_data, state.entity_id, state)
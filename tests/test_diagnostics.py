@@ -19,6 +19,7 @@ from custom_components.yandex_smart_home.const import (
     CONF_CONNECTION_TYPE,
     CONF_FILTER,
     CONF_FILTER_SOURCE,
+    CONF_LINKED_PLATFORMS,
     CONF_SKILL,
     CONF_USER_ID,
     ConnectionType,
@@ -54,6 +55,7 @@ async def test_diagnostics(
             CONF_CONNECTION_TYPE: ConnectionType.DIRECT,
             CONF_CLOUD_INSTANCE: {CONF_CLOUD_INSTANCE_PASSWORD: "foo"},
             CONF_PLATFORM: SmartHomePlatform.YANDEX,
+            CONF_LINKED_PLATFORMS: [SmartHomePlatform.YANDEX],
         },
         options={
             CONF_FILTER_SOURCE: EntityFilterSource.CONFIG_ENTRY,
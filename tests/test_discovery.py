@@ -0,0 +1,208 @@
+from unittest.mock import MagicMock, patch
+
+from homeassistant.components.light import ATTR_BRIGHTNESS, ATTR_COLOR_MODE, ATTR_SUPPORTED_COLOR_MODES, ColorMode
+from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import area_registry as ar, device_registry as dr, entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.yandex_smart_home import discovery
+from custom_components.yandex_smart_home.const import (
+    CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ENTITY_ID,
+    CONF_ENTITY_CUSTOM_TOGGLES,
+)
+from custom_components.yandex_smart_home.device import async_get_device_description, async_get_devices
+from custom_components.yandex_smart_home.discovery import DiscoverySnapshot
+from tests import MockConfigEntryData, generate_entity_filter
+
+LIGHT_ATTRS = {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.BRIGHTNESS], ATTR_COLOR_MODE: ColorMode.BRIGHTNESS}
+
+
+async def test_discovery_snapshot_untracked(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    hass.states.async_set("switch.test", STATE_ON)
+    hass.states.async_set("switch.not_expose", STATE_ON)
+    hass.states.async_set("light.test", STATE_ON, LIGHT_ATTRS)
+    hass.states.async_set("light.unavailable", STATE_UNAVAILABLE)
+
+    snapshot = DiscoverySnapshot(hass, entry_data)
+    assert snapshot.tracking is False
+
+    descriptions = []
+    for device in await async_get_devices(hass, entry_data):
+        if (description := await async_get_device_description(hass, device)) is not None:
+            descriptions.append(description)
+
+    assert [d.id for d in descriptions] == ["switch.test", "light.test"]
+    assert await snapshot.async_get_device_descriptions() == descriptions
+
+    hass.states.async_remove("switch.test")
+    assert [d.id for d in await snapshot.async_get_device_descriptions()] == ["light.test"]
+
+
+async def test_discovery_snapshot_incremental(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    hass.states.async_set("switch.test", STATE_ON)
+    hass.states.async_set("light.test", STATE_ON, LIGHT_ATTRS)
+
+    snapshot = DiscoverySnapshot(hass, entry_data)
+    unsub = snapshot.async_setup()
+    assert snapshot.tracking is True
+
+    with patch.object(
+        discovery, "async_get_device_description", MagicMock(wraps=async_get_device_description)
+    ) as mock_describe:
+        descriptions = await snapshot.async_get_device_descriptions()
+        assert [d.id for d in descriptions] == ["switch.test", "light.test"]
+        assert all(d._json is not None for d in descriptions)
+        assert mock_describe.call_count == 2
+        snapshot_hash = snapshot.hash
+
+        mock_describe.reset_mock()
+        assert len(await snapshot.async_get_device_descriptions()) == 2
+        assert mock_describe.call_count == 0
+
+        hass.states.async_set("switch.test", STATE_OFF)
+        hass.states.async_set("light.test", STATE_ON, LIGHT_ATTRS | {ATTR_BRIGHTNESS: 100})
+        assert len(await snapshot.async_get_device_descriptions()) == 2
+        assert mock_describe.call_count == 1
+        assert mock_describe.call_args[0][1].id == "light.test"
+        assert snapshot.hash == snapshot_hash
+
+        mock_describe.reset_mock()
+        hass.states.async_set("light.test", STATE_UNAVAILABLE)
+        assert [d.id for d in await snapshot.async_get_device_descriptions()] == ["switch.test"]
+        assert mock_describe.call_count == 0
+        assert snapshot.hash == snapshot_hash
+
+        hass.states.async_set("light.test", STATE_ON, {ATTR_SUPPORTED_COLOR_MODES: [ColorMode.ONOFF]})
+        assert [d.id for d in await snapshot.async_get_device_descriptions()] == ["switch.test", "light.test"]
+        assert mock_describe.call_count == 1
+        assert snapshot.hash != snapshot_hash
+        snapshot_hash = snapshot.hash
+
+        hass.states.async_remove("switch.test")
+        hass.states.async_set("switch.not_expose", STATE_ON)
+        assert [d.id for d in await snapshot.async_get_device_descriptions()] == ["light.test"]
+        assert snapshot.hash != snapshot_hash
+
+        entry_data.cache.revision += 1
+        mock_describe.reset_mock()
+        assert [d.id for d in await snapshot.async_get_device_descriptions()] == ["light.test"]
+        assert mock_describe.call_count == 1
+
+    unsub()
+    assert snapshot.tracking is False
+
+
+async def test_discovery_snapshot_registry(
+    hass: HomeAssistant,
+    entry_data: MockConfigEntryData,
+    entity_registry: er.EntityRegistry,
+    device_registry: dr.DeviceRegistry,
+    area_registry: ar.AreaRegistry,
+) -> None:
+    config_entry = MockConfigEntry(domain="test", data={})
+    config_entry.add_to_hass(hass)
+    device_entry = device_registry.async_get_or_create(
+        identifiers={("test", "test")}, config_entry_id=config_entry.entry_id
+    )
+    entity_entry = entity_registry.async_get_or_create("switch", "test", "1", device_id=device_entry.id)
+    hass.states.async_set(entity_entry.entity_id, STATE_ON)
+    hass.states.async_set("switch.other", STATE_ON)
+    area = area_registry.async_create("Кухня")
+    await hass.async_block_till_done()
+
+    snapshot = DiscoverySnapshot(hass, entry_data)
+    snapshot.async_setup()
+
+    with patch.object(
+        discovery, "async_get_device_description", MagicMock(wraps=async_get_device_description)
+    ) as mock_describe:
+        descriptions = await snapshot.async_get_device_descriptions()
+        assert [d.room for d in descriptions] == [None, None]
+
+        device_registry.async_update_device(device_entry.id, area_id=area.id)
+        await hass.async_block_till_done()
+
+        mock_describe.reset_mock()
+        descriptions = await snapshot.async_get_device_descriptions()
+        assert [d.room for d in descriptions] == ["Кухня", None]
+        assert [c[0][1].id for c in mock_describe.call_args_list] == [entity_entry.entity_id]
+
+        entity_registry.async_update_entity(entity_entry.entity_id, aliases={"Лампа"})
+        await hass.async_block_till_done()
+
+        mock_describe.reset_mock()
+        descriptions = await snapshot.async_get_device_descriptions()
+        assert [d.name for d in descriptions] == ["Лампа", "other"]
+        assert mock_describe.call_count == 1
+
+        area_registry.async_update(area.id, name="Спальня")
+        await hass.async_block_till_done()
+
+        mock_describe.reset_mock()
+        descriptions = await snapshot.async_get_device_descriptions()
+        assert [d.room for d in descriptions] == ["Спальня", None]
+        assert mock_describe.call_count == 2
+
+
+async def test_discovery_snapshot_dependents(hass: HomeAssistant) -> None:
+    entry_data = MockConfigEntryData(
+        hass,
+        entity_config={
+            "switch.test": {
+                CONF_ENTITY_CUSTOM_TOGGLES: {
+                    "mute": {CONF_ENTITY_CUSTOM_CAPABILITY_STATE_ENTITY_ID: "input_boolean.mute"},
+                }
+            }
+        },
+        entity_filter=generate_entity_filter(include_entity_globs=["switch.*"]),
+    )
+    hass.states.async_set("switch.test", STATE_ON)
+
+    snapshot = DiscoverySnapshot(hass, entry_data)
+    snapshot.async_setup()
+
+    with patch.object(
+        discovery, "async_get_device_description", MagicMock(wraps=async_get_device_description)
+    ) as mock_describe:
+        await snapshot.async_get_device_descriptions()
+        mock_describe.reset_mock()
+
+        hass.states.async_set("input_boolean.mute", STATE_ON)
+        await snapshot.async_get_device_descriptions()
+        assert mock_describe.call_count == 1
+        assert mock_describe.call_args[0][1].id == "switch.test"
+
+
+async def test_discovery_snapshot_track_changes(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    hass.states.async_set("switch.test", STATE_ON)
+
+    snapshot = DiscoverySnapshot(hass, entry_data)
+    snapshot.async_setup()
+    listener = MagicMock()
+
+    with patch.object(discovery, "async_call_later") as mock_call_later:
+        unsub_listener = snapshot.async_track_changes(listener)
+        mock_call_later.assert_called_once()
+        await mock_call_later.call_args[0][2].target()
+        listener.assert_not_called()
+
+        mock_call_later.reset_mock()
+        hass.states.async_set("switch.test", STATE_OFF)
+        hass.states.async_set("switch.test", STATE_UNAVAILABLE)
+        hass.states.async_set("switch.test", STATE_ON)
+        mock_call_later.assert_called_once()
+        await mock_call_later.call_args[0][2].target()
+        listener.assert_not_called()
+
+        mock_call_later.reset_mock()
+        hass.states.async_set("light.test", STATE_ON, LIGHT_ATTRS)
+        hass.states.async_set("light.test", STATE_ON, LIGHT_ATTRS | {ATTR_BRIGHTNESS: 10})
+        mock_call_later.assert_called_once()
+        await mock_call_later.call_args[0][2].target()
+        listener.assert_called_once()
+
+        unsub_listener()
+        mock_call_later.reset_mock()
+        hass.states.async_remove("light.test")
+        mock_call_later.assert_not_called()
@@ -2,7 +2,7 @@ from unittest.mock import patch
 
 from homeassistant.auth.models import User
 from homeassistant.const import CONF_PLATFORM
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import entity_registry as er, issue_registry as ir
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
@@ -18,6 +18,8 @@ from custom_components.yandex_smart_home.const import (
     CONF_LABEL,
     CONF_LINKED_PLATFORMS,
     CONF_NOTIFIER,
+    CONF_NOTIFIER_CHUNK_DEVICES,
+    CONF_NOTIFIER_CHUNK_SIZE,
     CONF_PRESSURE_UNIT,
     CONF_SETTINGS,
     CONF_USER_ID,
@@ -191,6 +193,19 @@ async def test_entry_data_unsupported_linked_platform(hass: HomeAssistant, caplo
     assert caplog.messages == ["Unsupported platform: foo"]
 
 
+async def test_entry_data_notifier_chunks(hass: HomeAssistant) -> None:
+    entry_data = MockConfigEntryData(hass=hass)
+    assert entry_data.notifier_chunk_devices == 100
+    assert entry_data.notifier_chunk_size == 65536
+
+    entry_data = MockConfigEntryData(
+        hass=hass,
+        yaml_config={CONF_SETTINGS: {CONF_NOTIFIER_CHUNK_DEVICES: 20, CONF_NOTIFIER_CHUNK_SIZE: 16384}},
+    )
+    assert entry_data.notifier_chunk_devices == 20
+    assert entry_data.notifier_chunk_size == 16384
+
+
 async def test_entry_data_should_expose_labels(hass: HomeAssistant, entity_registry: er.EntityRegistry) -> None:
     entry = MockConfigEntry(
         domain=DOMAIN,
@@ -213,6 +228,31 @@ async def test_entry_data_should_expose_labels(hass: HomeAssistant, entity_regis
     assert entry_data.should_expose("sensor.test_1") is True
 
 
+async def test_entry_data_device_plans_invalidation(hass: HomeAssistant, entity_registry: er.EntityRegistry) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=ConfigFlowHandler.VERSION,
+        data={CONF_CONNECTION_TYPE: ConnectionType.DIRECT},
+        options={CONF_FILTER_SOURCE: EntityFilterSource.YAML},
+    )
+    entry_data = MockConfigEntryData(hass, entry=entry)
+    await entry_data.async_setup()
+
+    e = entity_registry.async_get_or_create("sensor", "test", "1")
+    state = State(e.entity_id, "1")
+    plan = entry_data.device_plans.async_get(state.entity_id, state, entry_data.cache.revision)
+    assert entry_data.device_plans.async_get(state.entity_id, state, entry_data.cache.revision) is plan
+
+    entity_registry.async_update_entity(e.entity_id, name="foo")
+    await hass.async_block_till_done()
+    assert entry_data.device_plans.async_get(state.entity_id, state, entry_data.cache.revision) is not plan
+
+    plan = entry_data.device_plans.async_get(state.entity_id, state, entry_data.cache.revision)
+    entity_registry.async_update_entity(e.entity_id, new_entity_id="sensor.test_2")
+    await hass.async_block_till_done()
+    assert entry_data.device_plans.async_get(state.entity_id, state, entry_data.cache.revision) is not plan
+
+
 async def test_deprecated_pressure_unit(
     hass: HomeAssistant,
     config_entry_direct: MockConfigEntry,
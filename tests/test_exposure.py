@@ -0,0 +1,113 @@
+from unittest.mock import MagicMock, patch
+
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.yandex_smart_home.config_flow import ConfigFlowHandler
+from custom_components.yandex_smart_home.const import (
+    CONF_CONNECTION_TYPE,
+    CONF_FILTER_SOURCE,
+    CONF_LABEL,
+    DOMAIN,
+    ConnectionType,
+    EntityFilterSource,
+)
+from custom_components.yandex_smart_home.exposure import ExposureIndex
+from tests import MockConfigEntryData
+
+
+async def test_exposure_index_untracked(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    hass.states.async_set("switch.test", STATE_ON)
+    hass.states.async_set("switch.not_expose", STATE_ON)
+
+    evaluate = MagicMock(wraps=entry_data._evaluate_should_expose)
+    index = ExposureIndex(hass, evaluate)
+    assert index.tracking is False
+
+    assert index.should_expose("switch.test") is True
+    assert index.should_expose("switch.test") is True
+    assert index.should_expose("switch.not_expose") is False
+    assert evaluate.call_count == 3
+
+    assert [s.entity_id for s in index.async_get_exposed_states()] == ["switch.test"]
+
+
+async def test_exposure_index_tracked(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    hass.states.async_set("switch.test", STATE_ON)
+    hass.states.async_set("switch.not_expose", STATE_ON)
+
+    evaluate = MagicMock(wraps=entry_data._evaluate_should_expose)
+    index = ExposureIndex(hass, evaluate)
+    unsub = index.async_setup()
+    assert index.tracking is True
+    assert evaluate.call_count == 2
+
+    evaluate.reset_mock()
+    assert index.should_expose("switch.test") is True
+    assert index.should_expose("switch.not_expose") is False
+    assert evaluate.call_count == 0
+
+    hass.states.async_set("light.test", STATE_ON)
+    hass.states.async_set("light.test", "off")
+    assert evaluate.call_count == 1
+    assert index.should_expose("light.test") is True
+    assert [s.entity_id for s in index.async_get_exposed_states()] == ["switch.test", "light.test"]
+
+    with patch.object(index, "_evaluate", return_value=False):
+        index._async_update_entity("switch.test")
+    index._async_update_entity("switch.test")
+    assert list(index._exposed) == ["light.test", "switch.test"]
+    assert [s.entity_id for s in index.async_get_exposed_states()] == ["switch.test", "light.test"]
+
+    hass.states.async_remove("switch.test")
+    assert index.should_expose("switch.test") is True
+    assert [s.entity_id for s in index.async_get_exposed_states()] == ["light.test"]
+
+    evaluate.reset_mock()
+    assert index.should_expose("sensor.unknown") is True
+    assert evaluate.call_count == 1
+
+    unsub()
+    assert index.should_expose("switch.test") is True
+    assert evaluate.call_count == 2
+
+
+async def test_exposure_index_labels(hass: HomeAssistant, entity_registry: er.EntityRegistry) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=ConfigFlowHandler.VERSION,
+        data={CONF_CONNECTION_TYPE: ConnectionType.DIRECT},
+        options={CONF_FILTER_SOURCE: EntityFilterSource.LABEL, CONF_LABEL: "foo"},
+    )
+    entity_registry.async_get_or_create("sensor", "test", "1", suggested_object_id="exposed")
+    entity_registry.async_update_entity("sensor.exposed", labels={"foo"})
+    hass.states.async_set("sensor.exposed", "1")
+
+    entry_data = MockConfigEntryData(hass, entry=entry)
+    await entry_data.async_setup()
+    assert entry_data.exposure.tracking is True
+    assert entry_data.should_expose("sensor.exposed") is True
+    assert [s.entity_id for s in entry_data.exposure.async_get_exposed_states()] == ["sensor.exposed"]
+
+    e = entity_registry.async_get_or_create("sensor", "test", "2", suggested_object_id="test")
+    hass.states.async_set(e.entity_id, "2")
+    assert entry_data.should_expose(e.entity_id) is False
+
+    listener = MagicMock()
+    unsub_listener = entry_data.exposure.async_track_changes(listener)
+    entity_registry.async_update_entity(e.entity_id, labels={"foo"})
+    assert entry_data.should_expose(e.entity_id) is True
+    listener.assert_called_once_with(e.entity_id, True)
+    unsub_listener()
+    assert [s.entity_id for s in entry_data.exposure.async_get_exposed_states()] == ["sensor.exposed", "sensor.test"]
+
+    entity_registry.async_update_entity(e.entity_id, new_entity_id="sensor.renamed")
+    hass.states.async_set("sensor.renamed", "2")
+    assert entry_data.should_expose("sensor.test") is False
+    assert entry_data.should_expose("sensor.renamed") is True
+
+    entity_registry.async_remove("sensor.exposed")
+    assert entry_data.should_expose("sensor.exposed") is False
+    assert [s.entity_id for s in entry_data.exposure.async_get_exposed_states()] == ["sensor.renamed"]
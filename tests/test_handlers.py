@@ -1,3 +1,4 @@
+import asyncio
 import json
 from typing import Any
 from unittest.mock import Mock, patch
@@ -17,6 +18,8 @@ from custom_components.yandex_smart_home.const import (
     CONF_ENTITY_PROPERTIES,
     CONF_ENTITY_PROPERTY_TYPE,
     CONF_ENTITY_PROPERTY_VALUE_TEMPLATE,
+    CONF_PARALLEL_ACTIONS,
+    CONF_SETTINGS,
     EVENT_DEVICE_ACTION,
 )
 from custom_components.yandex_smart_home.helpers import APIError, RequestData, SmartHomePlatform
@@ -457,6 +460,105 @@ async def test_handler_devices_action(
         ]
 
 
+async def test_handler_devices_action_parallel(hass: HomeAssistant) -> None:
+    calls: list[tuple[str, str, str]] = []
+    running: set[str] = set()
+    max_running = 0
+
+    class MockCapability(StateToggleCapability):
+        @property
+        def supported(self) -> bool:
+            return True
+
+        def get_value(self) -> bool | None:
+            return None
+
+        async def set_instance_state(
+            self, context: Context, state: ToggleCapabilityInstanceActionState
+        ) -> CapabilityInstanceActionResultValue:
+            nonlocal max_running
+            calls.append((self.device_id, state.instance, "start"))
+            running.add(self.device_id)
+            max_running = max(max_running, len(running))
+            for _ in range(3):
+                await asyncio.sleep(0)
+            running.discard(self.device_id)
+            calls.append((self.device_id, state.instance, "end"))
+            return None
+
+    class MockCapabilityA(MockCapability):
+        instance = ToggleCapabilityInstance.PAUSE
+
+    class MockCapabilityB(MockCapability):
+        instance = ToggleCapabilityInstance.BACKLIGHT
+
+    entry_data = MockConfigEntryData(
+        hass,
+        yaml_config={CONF_SETTINGS: {CONF_PARALLEL_ACTIONS: 2}},
+        entity_filter=generate_entity_filter(include_entity_globs=["*"]),
+    )
+    request_data = RequestData(entry_data, Context(), SmartHomePlatform.YANDEX, "test", REQ_ID)
+    device_action_event = Mock()
+    hass.bus.async_listen(EVENT_DEVICE_ACTION, device_action_event)
+
+    device_ids = ["switch.test_1", "switch.test_2", "switch.test_3"]
+    for device_id in device_ids:
+        hass.states.async_set(device_id, STATE_OFF)
+
+    def _action(instance: ToggleCapabilityInstance) -> dict[str, Any]:
+        return {"type": MockCapability.type, "state": {"instance": instance, "value": True}}
+
+    payload = json.dumps(
+        {
+            "payload": {
+                "devices": [
+                    {
+                        "id": device_id,
+                        "capabilities": [_action(MockCapabilityA.instance), _action(MockCapabilityB.instance)],
+                    }
+                    for device_id in device_ids
+                ]
+                + [{"id": "switch.test_1", "capabilities": [_action(MockCapabilityB.instance)]}]
+            }
+        }
+    )
+
+    with patch(
+        "custom_components.yandex_smart_home.device.STATE_CAPABILITIES_REGISTRY",
+        [MockCapabilityA, MockCapabilityB],
+    ):
+        resp = await handlers.async_devices_action(hass, request_data, payload)
+
+    assert resp
+    assert [d["id"] for d in resp.as_dict()["devices"]] == device_ids + ["switch.test_1"]
+    assert resp.as_dict()["devices"][0] == {
+        "id": "switch.test_1",
+        "capabilities": [
+            {
+                "type": "devices.capabilities.toggle",
+                "state": {"instance": "pause", "action_result": {"status": "DONE"}},
+            },
+            {
+                "type": "devices.capabilities.toggle",
+                "state": {"instance": "backlight", "action_result": {"status": "DONE"}},
+            },
+        ],
+    }
+
+    assert max_running == 2
+    assert [c for c in calls if c[0] == "switch.test_1"] == [
+        ("switch.test_1", "pause", "start"),
+        ("switch.test_1", "pause", "end"),
+        ("switch.test_1", "backlight", "start"),
+        ("switch.test_1", "backlight", "end"),
+        ("switch.test_1", "backlight", "start"),
+        ("switch.test_1", "backlight", "end"),
+    ]
+
+    await hass.async_block_till_done()
+    assert device_action_event.call_count == 7
+
+
 async def test_handler_devices_action_error_template(hass: HomeAssistant, caplog: pytest.LogCaptureFixture) -> None:
     class MockCapabilityA(OnOffCapability):
         @property
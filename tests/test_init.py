@@ -1,3 +1,5 @@
+from datetime import timedelta
+from typing import Any
 from unittest.mock import patch
 
 from homeassistant.auth.models import User
@@ -24,6 +26,7 @@ from custom_components.yandex_smart_home.const import (
     CONF_NOTIFIER_USER_ID,
     EntityFilterSource,
 )
+from custom_components.yandex_smart_home.schema.base import SerializerBackend, get_serializer_backend
 
 
 async def test_bad_config(hass: HomeAssistant) -> None:
@@ -57,7 +60,7 @@ async def test_valid_config(hass: HomeAssistant) -> None:
     }
 
     entity_config = config[DOMAIN]["entity_config"]
-    assert len(entity_config) == 17
+    assert len(entity_config) == 18
 
     assert entity_config["switch.kitchen"] == {
         "name": "Выключатель",
@@ -228,6 +231,7 @@ async def test_valid_config(hass: HomeAssistant) -> None:
 
     assert entity_config["camera.pet"] == {
         "state_template": Template('{{ states("switch.pet_camera") }}', hass),
+        "template_rate_limit": timedelta(seconds=10),
         "turn_off": {
             "action": "switch.turn_off",
             "entity_id": [
@@ -242,6 +246,13 @@ async def test_valid_config(hass: HomeAssistant) -> None:
         },
     }
 
+    assert entity_config["sensor.power_meter"] == {
+        "report_filter": {
+            "power": {"deadband": 5.0, "min_interval": timedelta(seconds=30)},
+            "voltage": {"deadband": "2.0%"},
+        }
+    }
+
 
 async def test_empty_dict_config(hass: HomeAssistant) -> None:
     files = {
@@ -283,6 +294,19 @@ yandex_smart_home:
     assert component._yaml_config["entity_config"]["sensor.test"]["name"] == "Test"
 
 
+async def test_serializer_backend(hass: HomeAssistant, hass_admin_user: User) -> None:
+    await async_setup_component(hass, DOMAIN, {DOMAIN: {"settings": {"serializer": "fast"}}})
+    assert get_serializer_backend() == SerializerBackend.FAST
+
+    with patch_yaml_files({YAML_CONFIG_FILE: "yandex_smart_home:"}):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_RELOAD, blocking=True, context=Context(user_id=hass_admin_user.id)
+        )
+        await hass.async_block_till_done()
+
+    assert get_serializer_backend() == SerializerBackend.PYDANTIC
+
+
 async def test_reload_with_config_entry(
     hass: HomeAssistant,
     hass_admin_user: User,
@@ -438,14 +462,22 @@ async def test_unload_entry(hass: HomeAssistant, config_entry_direct: MockConfig
     assert entry_data.entry.state == ConfigEntryState.NOT_LOADED  # type: ignore[comparison-overlap]
 
 
-async def test_remove_entry(hass: HomeAssistant, config_entry_direct: MockConfigEntry) -> None:
+async def test_remove_entry(
+    hass: HomeAssistant, config_entry_direct: MockConfigEntry, hass_storage: dict[str, Any]
+) -> None:
     config_entry_direct.add_to_hass(hass)
     await hass.config_entries.async_setup(config_entry_direct.entry_id)
 
+    storage_keys = [f"{DOMAIN}.notifier.{config_entry_direct.entry_id}_{p}" for p in ("yandex", "vk")]
+    for storage_key in storage_keys:
+        hass_storage[storage_key] = {"version": 1, "key": storage_key, "data": []}
+
     component: YandexSmartHome = hass.data[DOMAIN]
     assert len(component._entry_datas) == 1
     await hass.config_entries.async_remove(config_entry_direct.entry_id)
     assert len(component._entry_datas) == 0
+    for storage_key in storage_keys:
+        assert storage_key not in hass_storage
 
 
 async def test_remove_entry_unloaded(hass: HomeAssistant, config_entry_direct: MockConfigEntry) -> None:
@@ -1,10 +1,13 @@
 import asyncio
+from dataclasses import replace
 from datetime import timedelta
 import json
 import logging
 import time
+from types import SimpleNamespace
 from typing import Any, Coroutine, Generator, cast
-from unittest.mock import AsyncMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, call, patch
+import zlib
 
 from aiohttp.client_exceptions import ClientConnectionError
 from homeassistant.auth.models import User
@@ -18,12 +21,15 @@ from homeassistant.const import (
     CONF_TOKEN,
     CONF_TYPE,
     EVENT_HOMEASSISTANT_STARTED,
+    STATE_OFF,
+    STATE_ON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfPressure,
 )
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_track_template_result
 from homeassistant.helpers.template import Template
 from homeassistant.setup import async_setup_component
 import pytest
@@ -35,6 +41,7 @@ from custom_components.yandex_smart_home.capability_custom import CustomOnOffCap
 from custom_components.yandex_smart_home.capability_onoff import OnOffCapabilityBasic
 from custom_components.yandex_smart_home.config_flow import ConfigFlowHandler
 from custom_components.yandex_smart_home.const import (
+    CONF_BACKLIGHT_ENTITY_ID,
     CONF_CLOUD_INSTANCE,
     CONF_CLOUD_INSTANCE_CONNECTION_TOKEN,
     CONF_CLOUD_INSTANCE_ID,
@@ -47,18 +54,26 @@ from custom_components.yandex_smart_home.const import (
     CONF_ENTITY_PROPERTIES,
     CONF_ENTITY_PROPERTY_ENTITY,
     CONF_ENTITY_PROPERTY_TYPE,
+    CONF_ENTITY_TEMPLATE_RATE_LIMIT,
     CONF_LINKED_PLATFORMS,
     CONF_SKILL,
     CONF_USER_ID,
     ConnectionType,
 )
+from custom_components.yandex_smart_home.device import Device
 from custom_components.yandex_smart_home.helpers import APIError, SmartHomePlatform
 from custom_components.yandex_smart_home.notifier import (
+    HEARTBEAT_REPORT_BUCKETS,
     CloudNotifier,
+    FailedStates,
     Notifier,
     NotifierConfig,
+    NotifierMetrics,
     PendingStates,
     YandexDirectNotifier,
+    _async_on_connection_create_end,
+    _async_on_connection_reuseconn,
+    async_get_callback_session,
 )
 from custom_components.yandex_smart_home.property_custom import (
     ButtonPressCustomEventProperty,
@@ -70,9 +85,16 @@ from custom_components.yandex_smart_home.property_custom import (
 )
 from custom_components.yandex_smart_home.property_float import HumiditySensor, TemperatureSensor
 from custom_components.yandex_smart_home.schema import (
+    CapabilityInstanceState,
+    CapabilityInstanceStateValue,
     CapabilityType,
+    DeviceState,
     EventPropertyInstance,
     FloatPropertyInstance,
+    OnOffCapabilityInstance,
+    PropertyInstanceState,
+    PropertyInstanceStateValue,
+    PropertyType,
     RangeCapabilityInstance,
     ResponseCode,
 )
@@ -245,7 +267,18 @@ async def test_notifier_lifecycle_link_platform_cloud(
         assert notifier._unsub_discovery is not None
         assert notifier._config.platform is not None
 
+    entry_data = component.get_entry_data(config_entry)
+    assert entry_data.discovery.tracking is True
+    assert entry_data.discovery._change_listener is not None
+    with patch.object(notifier.__class__, "async_send_discovery") as mock_send_discovery:
+        entry_data.discovery._change_listener()
+        await hass.async_block_till_done()
+        assert mock_send_discovery.call_count == len(platforms)
+
     await hass.config_entries.async_unload(config_entry.entry_id)
+    discovery = component.get_entry_data(config_entry).discovery
+    assert discovery.tracking is False
+    assert discovery._change_listener is None
 
     for notifier in component.get_entry_data(config_entry)._notifiers:
         assert notifier._unsub_state_changed is None
@@ -514,7 +547,7 @@ async def test_notifier_track_templates(
     assert pending["sensor.outside_temp"][0].get_value() == "double_click"
     mock_call_later.assert_called_once()
     assert mock_call_later.call_args[1]["delay"] == 0
-    assert notifier._unsub_report_states is not None
+    assert notifier._unsub_report_time_sensitive_states is not None
 
     # float
     mock_call_later.reset_mock()
@@ -538,7 +571,8 @@ async def test_notifier_track_templates(
     assert (
         caplog.messages[-1] == "Unsupported value 'q' for instance co2_level of float property of sensor.outside_temp"
     )
-    mock_call_later.assert_not_called()
+    mock_call_later.assert_called_once()
+    assert mock_call_later.call_args[1]["delay"] == timedelta(seconds=1)
 
     # onoff
     mock_call_later.reset_mock()
@@ -645,6 +679,62 @@ async def test_notifier_track_templates_exception(
     await notifier.async_unload()
 
 
+async def test_notifier_track_templates_shared(hass_platform: HomeAssistant, mock_call_later: AsyncMock) -> None:
+    hass = hass_platform
+    entry_data = MockConfigEntryData(
+        hass=hass,
+        entity_config={
+            "switch.foo": {CONF_STATE_TEMPLATE: Template("{{ states('sensor.shared') }}", hass)},
+            "switch.bar": {
+                CONF_STATE_TEMPLATE: Template("{{ states('sensor.shared') }}", hass),
+                CONF_ENTITY_TEMPLATE_RATE_LIMIT: timedelta(seconds=30),
+            },
+            "switch.baz": {
+                CONF_STATE_TEMPLATE: Template("{{ states('sensor.other') }}", hass),
+                CONF_ENTITY_TEMPLATE_RATE_LIMIT: timedelta(seconds=10),
+            },
+        },
+        entity_filter=generate_entity_filter(include_entity_globs=["*"]),
+    )
+
+    hass.states.async_set("sensor.shared", "off")
+    notifier = YandexDirectNotifier(
+        hass_platform,
+        entry_data,
+        BASIC_CONFIG,
+        entry_data._get_trackable_templates(),
+        entry_data._get_trackable_entity_states(),
+    )
+    shared_template = Template("{{ states('sensor.shared') }}", hass)
+    assert len(notifier._track_templates) == 2
+    assert [s.device_id for s in notifier._track_templates[shared_template]] == ["switch.foo", "switch.bar"]
+
+    with patch(
+        "custom_components.yandex_smart_home.notifier.async_track_template_result",
+        wraps=async_track_template_result,
+    ) as mock_track_template_result:
+        await notifier.async_setup()
+
+    track_templates = mock_track_template_result.call_args[0][1]
+    assert [(t.template.template, t.rate_limit) for t in track_templates] == [
+        ("{{ states('sensor.shared') }}", 30),
+        ("{{ states('sensor.other') }}", 10),
+    ]
+    assert [s.get_value() for s in notifier._template_states[shared_template]] == [False, False]
+    assert notifier._pending.empty is True
+
+    await _async_set_state(hass, "sensor.shared", "on")
+    pending = await notifier._pending.async_get_all()
+    assert list(pending.keys()) == ["switch.foo", "switch.bar"]
+    assert [s.get_value() for s in pending["switch.foo"] + pending["switch.bar"]] == [True, True]
+    assert pending["switch.foo"][0] is notifier._template_states[shared_template][0]
+    assert pending["switch.bar"][0] is notifier._template_states[shared_template][1]
+    assert notifier.metrics.events == 2  # state change and template update
+    assert notifier.metrics.scheduled_states == 2
+
+    await notifier.async_unload()
+
+
 async def test_notifier_track_entity_states(
     hass_platform: HomeAssistant, mock_call_later: AsyncMock, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -701,6 +791,7 @@ async def test_notifier_track_entity_states(
 
     mock_call_later.reset_mock()
     await _async_set_state(hass, "event.motion", STATE_UNKNOWN, {ATTR_EVENT_TYPE: "motion"})
+    await notifier._async_flush_state_changes()
     assert cast(bool, notifier._pending.empty) is False
     pending = await notifier._pending.async_get_all()
     assert list(pending.keys()) == ["light.kitchen"]
@@ -708,6 +799,7 @@ async def test_notifier_track_entity_states(
     assert pending["light.kitchen"][0].get_value() == "detected"
 
     await _async_set_state(hass, "event.button", STATE_UNKNOWN, {ATTR_EVENT_TYPE: "pressed"})
+    await notifier._async_flush_state_changes()
     pending = await notifier._pending.async_get_all()
     assert list(pending.keys()) == ["light.kitchen", "input_text.button"]
     assert pending["light.kitchen"][0].get_value() == "click"
@@ -718,6 +810,7 @@ async def test_notifier_track_entity_states(
 
     mock_call_later.reset_mock()
     await _async_set_state(hass, "event.button", "tick", {ATTR_EVENT_TYPE: "pressed"})
+    await notifier._async_flush_state_changes()
     pending = await notifier._pending.async_get_all()
     assert list(pending.keys()) == ["light.kitchen", "input_text.button"]
 
@@ -741,13 +834,16 @@ async def test_notifier_state_changed(
     await notifier.async_setup()
 
     await _async_set_state(hass, "switch.not_exposed", "on")
+    await notifier._async_flush_state_changes()
     await _async_set_state(hass, "switch.not_exposed", "off")
+    await notifier._async_flush_state_changes()
     assert notifier._pending.empty is True
     assert notifier._unsub_report_states is None
 
     caplog.clear()
     mock_call_later.reset_mock()
     await _async_set_state(hass, "sensor.button", "click", {ATTR_DEVICE_CLASS: "button"})
+    await notifier._async_flush_state_changes()
     pending = await notifier._pending.async_get_all()
     assert list(pending.keys()) == ["sensor.button"]
     assert len(pending["sensor.button"]) == 1
@@ -757,9 +853,11 @@ async def test_notifier_state_changed(
         "device_id=sensor.button type=devices.properties.event instance=button>"
     )
     mock_call_later.assert_called_once()
-    assert notifier._unsub_report_states is not None
+    assert notifier._unsub_report_time_sensitive_states is not None
+    assert notifier._unsub_report_states is None
 
-    await _async_set_state(hass, "binary_sensor.front_door", "off", {ATTR_DEVICE_CLASS: "door"})  # type: ignore[unreachable]
+    await _async_set_state(hass, "binary_sensor.front_door", "off", {ATTR_DEVICE_CLASS: "door"})
+    await notifier._async_flush_state_changes()
     pending = await notifier._pending.async_get_all()
     assert list(pending.keys()) == ["binary_sensor.front_door"]
     assert len(pending["binary_sensor.front_door"]) == 1
@@ -768,6 +866,7 @@ async def test_notifier_state_changed(
     light_state = hass.states.get("light.kitchen")
     assert light_state
     await _async_set_state(hass, light_state.entity_id, "off", light_state.attributes)
+    await notifier._async_flush_state_changes()
     pending = await notifier._pending.async_get_all()
     assert list(pending.keys()) == ["light.kitchen"]
     assert len(pending["light.kitchen"]) == 1
@@ -783,6 +882,138 @@ async def test_notifier_state_changed(
     await notifier.async_unload()
 
 
+async def test_notifier_state_changed_coalesce(hass_platform: HomeAssistant, mock_call_later: AsyncMock) -> None:
+    hass = hass_platform
+    entry_data = MockConfigEntryData(hass=hass, entity_filter=generate_entity_filter(include_entity_globs=["*"]))
+
+    notifier = YandexDirectNotifier(
+        hass_platform,
+        entry_data,
+        BASIC_CONFIG,
+        entry_data._get_trackable_templates(),
+        entry_data._get_trackable_entity_states(),
+    )
+    await notifier.async_setup()
+
+    await _async_set_state(hass, "switch.test", STATE_ON)
+    assert notifier._state_changes == {}
+    assert notifier._state_changes_flush_handle is None
+    assert notifier._state_changes_flush_task is not None
+    pending = await notifier._pending.async_get_all()
+    assert list(pending.keys()) == ["switch.test"]
+    assert pending["switch.test"][0].get_value() is True
+
+    await _async_set_state(hass, "switch.test_2", STATE_OFF)
+    assert list(notifier._state_changes.keys()) == ["switch.test_2"]
+    assert notifier._state_changes_flush_handle is not None
+    flush_delay = notifier._state_changes_flush_handle.when() - hass.loop.time()  # type: ignore[unreachable]
+    assert flush_delay == pytest.approx(notifier._report_window.total_seconds(), abs=0.1)
+    await notifier._async_flush_state_changes()
+    assert notifier._time_sensitive_entities == {"switch.test": False, "switch.test_2": False}
+    await notifier._pending.async_get_all()
+
+    with patch.object(Device, "get_state_capabilities", wraps=Device.get_state_capabilities, autospec=True) as mock:
+        for state in [STATE_OFF, STATE_ON, STATE_OFF, STATE_ON]:
+            await _async_set_state(hass, "switch.test", state)
+        await _async_set_state(hass, "switch.test_2", STATE_ON)
+
+        assert notifier._pending.empty is True
+        assert list(notifier._state_changes.keys()) == ["switch.test", "switch.test_2"]
+        assert cast(State, notifier._state_changes["switch.test"][0]).state == STATE_ON
+        assert notifier._state_changes["switch.test"][1].state == STATE_ON
+        assert notifier._state_changes_flush_handle is not None
+        mock.assert_not_called()
+
+        await notifier._async_flush_state_changes()
+        assert mock.call_count == 4
+        assert notifier._state_changes_flush_handle is None
+
+    pending = await notifier._pending.async_get_all()
+    assert list(pending.keys()) == ["switch.test_2"]
+
+    await _async_set_state(hass, "switch.test", STATE_OFF)
+    assert notifier._state_changes_flush_handle is not None
+    await notifier.async_unload()
+    assert notifier._state_changes == {}
+    assert notifier._state_changes_flush_handle is None
+    assert notifier._state_changes_flush_task is None
+
+
+async def test_notifier_state_changed_time_sensitive(hass_platform: HomeAssistant, mock_call_later: AsyncMock) -> None:
+    hass = hass_platform
+    entry_data = MockConfigEntryData(hass=hass, entity_filter=generate_entity_filter(include_entity_globs=["*"]))
+
+    notifier = YandexDirectNotifier(
+        hass_platform,
+        entry_data,
+        BASIC_CONFIG,
+        entry_data._get_trackable_templates(),
+        entry_data._get_trackable_entity_states(),
+    )
+    await notifier.async_setup()
+
+    for action in ["click", "double_click", "click"]:
+        await _async_set_state(hass, "sensor.button", action, {ATTR_DEVICE_CLASS: EventDeviceClass.BUTTON})
+        assert notifier._state_changes == {}
+        assert notifier._state_changes_flush_handle is None
+        assert notifier._pending.time_sensitive is True
+        pending = await notifier._pending.async_get_time_sensitive()
+        assert [s.get_value() for s in pending["sensor.button"]] == [action]
+
+    assert notifier._time_sensitive_entities == {"sensor.button": True}
+    await notifier.async_unload()
+
+
+async def test_notifier_state_changed_exposed_entities(hass: HomeAssistant, mock_call_later: AsyncMock) -> None:
+    entry_data = MockConfigEntryData(
+        hass=hass,
+        entity_config={"switch.test": {CONF_BACKLIGHT_ENTITY_ID: "light.backlight"}},
+        entity_filter=generate_entity_filter(include_entity_globs=["switch.*"]),
+    )
+    hass.states.async_set("switch.test", STATE_ON)
+    hass.states.async_set("light.backlight", STATE_ON)
+    hass.states.async_set("sensor.other", "1")
+    entry_data.exposure.async_setup()
+
+    notifier = YandexDirectNotifier(
+        hass,
+        entry_data,
+        BASIC_CONFIG,
+        entry_data._get_trackable_templates(),
+        entry_data._get_trackable_entity_states(),
+    )
+    await notifier.async_setup()
+    assert notifier._unsub_entity_state_changed.keys() == {"switch.test", "light.backlight"}
+
+    await _async_set_state(hass, "sensor.other", "2")
+    assert notifier._state_changes == {}
+
+    await _async_set_state(hass, "switch.test", STATE_OFF)
+    assert list((await notifier._pending.async_get_all()).keys()) == ["switch.test"]
+    await _async_set_state(hass, "light.backlight", STATE_OFF)
+    assert list(notifier._state_changes.keys()) == ["light.backlight"]
+    await notifier._async_flush_state_changes()
+    assert list((await notifier._pending.async_get_all()).keys()) == ["switch.test"]
+    assert notifier._time_sensitive_entities == {"switch.test": False, "light.backlight": False}
+
+    await _async_set_state(hass, "light.backlight", STATE_ON)
+    assert list(notifier._state_changes.keys()) == ["light.backlight"]
+
+    await _async_set_state(hass, "switch.new", STATE_ON)
+    assert notifier._unsub_entity_state_changed.keys() == {"switch.test", "light.backlight", "switch.new"}
+    assert list(notifier._state_changes.keys()) == ["light.backlight", "switch.new"]
+    await notifier._async_flush_state_changes()
+    assert list((await notifier._pending.async_get_all()).keys()) == ["switch.test", "switch.new"]
+
+    notifier._async_exposure_changed("switch.new", False)
+    notifier._async_exposure_changed("light.backlight", False)
+    assert notifier._unsub_entity_state_changed.keys() == {"switch.test", "light.backlight"}
+
+    await notifier.async_unload()
+    assert notifier._unsub_entity_state_changed == {}
+    assert entry_data.exposure._change_listeners == []
+
+
 @pytest.mark.parametrize("use_custom", [True, False])
 async def test_notifier_track_templates_over_states(
     hass_platform: HomeAssistant, mock_call_later: AsyncMock, use_custom: bool
@@ -829,6 +1060,7 @@ async def test_notifier_track_templates_over_states(
         test_light.state,
         test_light.attributes | {ATTR_BRIGHTNESS: "99"},
     )
+    await notifier._async_flush_state_changes()
     if use_custom:
         assert notifier._pending.empty is True
     else:
@@ -840,6 +1072,7 @@ async def test_notifier_track_templates_over_states(
         "99",
         test_sensor.attributes,
     )
+    await notifier._async_flush_state_changes()
     if use_custom:
         assert notifier._pending.empty is True
     else:
@@ -849,7 +1082,10 @@ async def test_notifier_track_templates_over_states(
 
 
 async def test_notifier_initial_report(
-    hass_platform: HomeAssistant, mock_call_later: AsyncMock, caplog: pytest.LogCaptureFixture
+    hass_platform: HomeAssistant,
+    mock_call_later: AsyncMock,
+    caplog: pytest.LogCaptureFixture,
+    aioclient_mock: AiohttpClientMocker,
 ) -> None:
     entry_data = MockConfigEntryData(
         hass=hass_platform,
@@ -878,20 +1114,21 @@ async def test_notifier_initial_report(
         "sensor.button", "on", {ATTR_DEVICE_CLASS: EventDeviceClass.BUTTON, "last_action": "click"}
     )
 
+    aioclient_mock.post(
+        f"https://dialogs.yandex.net/api/v1/skills/{BASIC_CONFIG.skill_id}/callback/state",
+        status=202,
+        json={"request_id": REQ_ID, "status": "ok"},
+    )
     await notifier._async_initial_report()
-    mock_call_later.assert_called_once()
+    await hass_platform.async_block_till_done()
+    mock_call_later.assert_not_called()
 
-    devices = await notifier._pending.async_get_all()
+    assert aioclient_mock.call_count == 1
+    devices = {d["id"]: d for d in json.loads(aioclient_mock.mock_calls[0][2]._value)["payload"]["devices"]}
     assert list(devices.keys()) == ["sensor.outside_temp", "light.kitchen"]
 
     def _get_states(entity_id: str) -> list[dict[str, Any]]:
-        states: list[dict[str, Any]] = []
-        for s in devices[entity_id]:
-            instance_state = s.get_instance_state()
-            if instance_state:
-                states.append(instance_state.as_dict())
-
-        return states
+        return [*devices[entity_id].get("capabilities", []), *devices[entity_id].get("properties", [])]
 
     assert _get_states("sensor.outside_temp") == [
         {"state": {"instance": "temperature", "value": 15.6}, "type": "devices.properties.float"},
@@ -904,11 +1141,22 @@ async def test_notifier_initial_report(
     ]
 
     assert notifier._pending.empty is True
-    assert caplog.messages[-1:] == ["Unsupported entity binary_sensor.foo for temperature property of light.kitchen"]
+    assert "Unsupported entity binary_sensor.foo for temperature property of light.kitchen" in caplog.messages
+
+    notifier._report_seq = 5
+    notifier._report_seqs[("light.kitchen", "devices.capabilities.on_off", "on")] = 5
+    states = notifier._drop_superseded_states(list(notifier._iter_initial_device_states(3)), 3)
+    assert [(s.id, [c.state.instance for c in s.capabilities or []]) for s in states] == [
+        ("sensor.outside_temp", []),
+        ("light.kitchen", ["temperature_k", "brightness"]),
+    ]
+    assert notifier._report_seqs[("light.kitchen", "devices.capabilities.range", "brightness")] == 3
+    assert notifier._report_seqs[("light.kitchen", "devices.capabilities.on_off", "on")] == 5
 
 
+@pytest.mark.parametrize("tracking", [True, False])
 async def test_notifier_heartbeat_report(
-    hass_platform: HomeAssistant, mock_call_later: AsyncMock, caplog: pytest.LogCaptureFixture
+    hass_platform: HomeAssistant, mock_call_later: AsyncMock, caplog: pytest.LogCaptureFixture, tracking: bool
 ) -> None:
     entry_data = MockConfigEntryData(
         hass=hass_platform,
@@ -936,36 +1184,53 @@ async def test_notifier_heartbeat_report(
         "sensor.button", "on", {ATTR_DEVICE_CLASS: EventDeviceClass.BUTTON, "last_action": "click"}
     )
 
+    if tracking:
+        entry_data.exposure.async_setup()
+
     await notifier.async_setup()
+    assert (notifier._heartbeat_buckets is not None) is tracking
 
     call_args = mock_call_later.mock_calls[1].kwargs
     assert isinstance(call_args["delay"], timedelta)
-    assert 3660 <= call_args["delay"].seconds <= 3600 + 15 * 60
-
-    mock_call_later.reset_mock()
-    await notifier._async_hearbeat_report()
-
-    devices = await notifier._pending.async_get_all()
-    assert list(devices.keys()) == ["sensor.outside_temp", "light.kitchen"]
-
-    def _get_states(entity_id: str) -> list[dict[str, Any]]:
-        states: list[dict[str, Any]] = []
-        for s in devices[entity_id]:
-            instance_state = s.get_instance_state()
-            if instance_state:
-                states.append(instance_state.as_dict())
+    assert 60 <= call_args["delay"].total_seconds() <= 120
+
+    reported: dict[str, list[int]] = {}
+    for bucket in range(HEARTBEAT_REPORT_BUCKETS):
+        mock_call_later.reset_mock()
+        await notifier._async_hearbeat_report()
+
+        call_args = mock_call_later.mock_calls[0].kwargs
+        assert call_args["delay"] == timedelta(minutes=1)
+
+        devices = await notifier._pending.async_get_all()
+        for device_id, device_states in devices.items():
+            reported.setdefault(device_id, []).append(bucket)
+            if device_id == "sensor.outside_temp":
+                assert [s.get_instance_state().as_dict() for s in device_states] == [  # type: ignore[union-attr]
+                    {"state": {"instance": "temperature", "value": 15.6}, "type": "devices.properties.float"},
+                ]
 
-        return states
+    assert reported == {
+        "sensor.outside_temp": [zlib.crc32(b"sensor.outside_temp") % HEARTBEAT_REPORT_BUCKETS],
+        "light.kitchen": [zlib.crc32(b"light.kitchen") % HEARTBEAT_REPORT_BUCKETS],
+    }
+    assert notifier._heartbeat_bucket == 0
+    assert notifier._pending.empty is True
 
-    assert _get_states("sensor.outside_temp") == [
-        {"state": {"instance": "temperature", "value": 15.6}, "type": "devices.properties.float"},
-    ]
+    if tracking:
+        bucket = zlib.crc32(b"light.kitchen") % HEARTBEAT_REPORT_BUCKETS
+        notifier._heartbeat_bucket = bucket
+        notifier._async_exposure_changed("light.kitchen", False)
+        await notifier._async_hearbeat_report()
+        assert notifier._pending.empty is True
 
-    assert notifier._pending.empty is True
+        notifier._heartbeat_bucket = bucket
+        notifier._async_exposure_changed("light.kitchen", True)
+        await notifier._async_hearbeat_report()
+        assert list(await notifier._pending.async_get_all()) == ["light.kitchen"]
 
-    call_args = mock_call_later.mock_calls[0].kwargs
-    assert isinstance(call_args["delay"], timedelta)
-    assert call_args["delay"].seconds == 3600
+    await notifier.async_unload()
+    assert notifier._heartbeat_buckets is None
 
 
 async def test_notifier_send_callback_exception(
@@ -985,6 +1250,8 @@ async def test_notifier_send_callback_exception(
         assert caplog.records[-1].message == "State notification request failed: TimeoutError()"
         assert caplog.records[-1].levelno == logging.DEBUG
 
+    assert notifier.metrics.failures == {"connection_error": 1, "timeout": 1}
+
 
 async def test_notifier_send_direct(
     hass: HomeAssistant,
@@ -1087,6 +1354,100 @@ async def test_notifier_send_direct(
         assert aioclient_mock.call_count == 0
     assert "Unexpected exception" in caplog.messages[-1]
 
+    assert notifier.metrics.requests == 6
+    assert notifier.metrics.failed_requests == 4
+    assert notifier.metrics.failures == {"http_400": 2, "http_500": 1, "unexpected_error": 1}
+    assert notifier.metrics.payload_bytes > 0
+    assert notifier.metrics.average_latency is not None
+    assert notifier.metrics.max_latency >= notifier.metrics.average_latency
+    assert notifier.metrics.get_latency_percentile(50) is not None
+
+
+async def test_notifier_callback_session(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    notifier = YandexDirectNotifier(hass, entry_data, BASIC_CONFIG, {}, {})
+    other_notifier = CloudNotifier(hass, entry_data, BASIC_CONFIG, {}, {})
+    assert notifier._session is other_notifier._session
+    assert notifier._session is async_get_callback_session(hass)
+    assert notifier.metrics is not other_notifier.metrics
+
+    trace_config = notifier._session.trace_configs[0]
+    assert _async_on_connection_create_end in trace_config.on_connection_create_end  # type: ignore[comparison-overlap]
+    assert _async_on_connection_reuseconn in trace_config.on_connection_reuseconn  # type: ignore[comparison-overlap]
+    for ctx in (None, {}, {"metrics": notifier.metrics}):
+        context = SimpleNamespace(trace_request_ctx=ctx)
+        await _async_on_connection_create_end(notifier._session, context, MagicMock())
+        for _ in range(3):
+            await _async_on_connection_reuseconn(notifier._session, context, MagicMock())
+
+    assert notifier.metrics.as_dict() == {
+        "events": 0,
+        "scheduled_states": 0,
+        "requests": 0,
+        "failed_requests": 0,
+        "failures": {},
+        "payload_bytes": 0,
+        "connections_created": 1,
+        "connections_reused": 3,
+        "connection_reuse_rate": 0.75,
+        "total_latency": 0.0,
+        "average_latency": None,
+        "max_latency": 0.0,
+        "latency_p50": None,
+        "latency_p95": None,
+        "latency_p99": None,
+    }
+    assert other_notifier.metrics.connection_reuse_rate is None
+
+
+def test_notifier_metrics() -> None:
+    metrics = NotifierMetrics()
+    assert metrics.get_latency_percentile(50) is None
+
+    metrics.record_request(0.5, 100)
+    assert metrics.get_latency_percentile(50) == 0.5
+    assert metrics.get_latency_percentile(99) == 0.5
+
+    for latency in range(1, 100):
+        metrics.record_request(latency / 1000, 10, "timeout" if latency % 10 == 0 else None)
+
+    assert metrics.requests == 100
+    assert metrics.failed_requests == 9
+    assert metrics.failures == {"timeout": 9}
+    assert metrics.payload_bytes == 1090
+    assert metrics.get_latency_percentile(50) == 0.05
+    assert metrics.get_latency_percentile(95) == 0.095
+    assert metrics.get_latency_percentile(99) == 0.099
+    assert metrics.max_latency == 0.5
+
+    with patch("custom_components.yandex_smart_home.notifier.CALLBACK_LATENCY_SAMPLES", 10):
+        metrics = NotifierMetrics()
+        for latency in range(1, 100):
+            metrics.record_request(latency, 0)
+
+    assert metrics.requests == 99
+    assert list(metrics.latencies) == list(range(90, 100))
+    assert metrics.get_latency_percentile(50) == 94
+
+
+async def test_notifier_diagnostics(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    notifier = YandexDirectNotifier(hass, entry_data, BASIC_CONFIG, {}, {})
+    other_notifier = CloudNotifier(
+        hass, entry_data, NotifierConfig(user_id="foo", token="bar", platform=SmartHomePlatform.VK), {}, {}
+    )
+    assert notifier.platform == SmartHomePlatform.YANDEX
+    assert other_notifier.platform == SmartHomePlatform.VK
+
+    await notifier._pending.async_add(
+        [ButtonPressCustomEventProperty(hass, entry_data, {}, "btn", Template("click", hass))], []
+    )
+    notifier._failed.add([DeviceState(id="foo"), DeviceState(id="bar")], 1)
+
+    diagnostics = notifier.get_diagnostics()
+    assert diagnostics["platform"] == "yandex"
+    assert diagnostics["pending_states"] == 1
+    assert diagnostics["failed_devices"] == 2
+    assert diagnostics["metrics"] == notifier.metrics.as_dict()
+
 
 @pytest.mark.parametrize(
     "platform,config",
@@ -1281,7 +1642,7 @@ async def test_notifier_report_states(
         "ts": now,
     }
 
-    with patch.object(notifier._pending, "async_get_all", return_value=notifier._pending._device_states):
+    with patch.object(notifier._pending, "async_get_all", return_value={}):
         await notifier._pending.async_add(
             [OnOffCapabilityBasic(hass, entry_data, "switch.on", State("switch.on", "on"))], []
         )
@@ -1291,12 +1652,481 @@ async def test_notifier_report_states(
         assert notifier._unsub_report_states is not None
 
 
+async def test_notifier_report_states_chunks(
+    hass: HomeAssistant,
+    entry_data: MockConfigEntryData,
+    mock_call_later: AsyncMock,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    notifier = YandexDirectNotifier(hass, entry_data, replace(BASIC_CONFIG, chunk_devices=2), {}, {})
+    aioclient_mock.post(
+        f"https://dialogs.yandex.net/api/v1/skills/{BASIC_CONFIG.skill_id}/callback/state",
+        status=202,
+        json={"request_id": REQ_ID, "status": "ok"},
+    )
+
+    async def _async_report(count: int) -> list[list[str]]:
+        call_count = aioclient_mock.call_count
+        for i in range(count):
+            await notifier._pending.async_add(
+                [OnOffCapabilityBasic(hass, entry_data, f"switch.test_{i}", State(f"switch.test_{i}", "on"))], []
+            )
+        await notifier._async_report_states()
+        await hass.async_block_till_done()
+        return [
+            [d["id"] for d in json.loads(c[2]._value)["payload"]["devices"]]
+            for c in aioclient_mock.mock_calls[call_count:]
+        ]
+
+    with (
+        patch("custom_components.yandex_smart_home.notifier.REPORT_STATES_CHUNK_DELAY", timedelta(milliseconds=1)),
+        patch("asyncio.sleep", wraps=asyncio.sleep) as mock_sleep,
+    ):
+        assert await _async_report(1) == [["switch.test_0"]]
+        assert mock_sleep.call_args_list.count(call(0.001)) == 0
+
+        assert await _async_report(5) == [
+            ["switch.test_0", "switch.test_1"],
+            ["switch.test_2", "switch.test_3"],
+            ["switch.test_4"],
+        ]
+        assert mock_sleep.call_args_list.count(call(0.001)) == 2
+
+        notifier._config.chunk_size = 300
+        assert await _async_report(3) == [["switch.test_0", "switch.test_1"], ["switch.test_2"]]
+
+        notifier._config.chunk_size = 1
+        assert await _async_report(2) == [["switch.test_0"], ["switch.test_1"]]
+
+    notifier._config.chunk_devices = 1
+    for i in range(2):
+        await notifier._pending.async_add(
+            [OnOffCapabilityBasic(hass, entry_data, f"switch.test_{i}", State(f"switch.test_{i}", "on"))], []
+        )
+    await notifier._async_report_states()
+    assert len(notifier._report_tasks) == 1
+    task = next(iter(notifier._report_tasks))
+    await notifier.async_unload()
+    await hass.async_block_till_done()
+    assert task.cancelled()
+
+
+async def test_notifier_report_states_serialized(
+    hass: HomeAssistant,
+    entry_data: MockConfigEntryData,
+    mock_call_later: AsyncMock,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    notifier = YandexDirectNotifier(hass, entry_data, replace(BASIC_CONFIG, chunk_devices=1), {}, {})
+    aioclient_mock.post(
+        f"https://dialogs.yandex.net/api/v1/skills/{BASIC_CONFIG.skill_id}/callback/state",
+        status=202,
+        json={"request_id": REQ_ID, "status": "ok"},
+    )
+
+    async def _async_add(entity_id: str, state: str, old_state: str | None = None) -> None:
+        await notifier._pending.async_add(
+            [OnOffCapabilityBasic(hass, entry_data, entity_id, State(entity_id, state))],
+            [OnOffCapabilityBasic(hass, entry_data, entity_id, State(entity_id, old_state))] if old_state else [],
+        )
+
+    with patch("custom_components.yandex_smart_home.notifier.REPORT_STATES_CHUNK_DELAY", timedelta(milliseconds=1)):
+        for i in range(3):
+            await _async_add(f"switch.test_{i}", "on")
+        await notifier._async_report_states()
+
+        await _async_add("switch.test_2", "off", "on")
+        await _async_add("switch.test_3", "on")
+        await notifier._async_report_states()
+        assert len(notifier._report_tasks) == 2
+
+        await hass.async_block_till_done()
+
+    assert [
+        [(d["id"], d["capabilities"][0]["state"]["value"]) for d in json.loads(c[2]._value)["payload"]["devices"]]
+        for c in aioclient_mock.mock_calls
+    ] == [
+        [("switch.test_0", True)],
+        [("switch.test_1", True)],
+        [("switch.test_2", False)],
+        [("switch.test_3", True)],
+    ]
+    assert notifier._failed.empty
+
+
+async def test_notifier_report_window(
+    hass: HomeAssistant,
+    entry_data: MockConfigEntryData,
+    mock_call_later: AsyncMock,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    notifier = YandexDirectNotifier(hass, entry_data, BASIC_CONFIG, {}, {})
+    aioclient_mock.post(
+        f"https://dialogs.yandex.net/api/v1/skills/{BASIC_CONFIG.skill_id}/callback/state",
+        status=202,
+        json={"request_id": REQ_ID, "status": "ok"},
+    )
+
+    async def _async_add(count: int) -> None:
+        for i in range(count):
+            await notifier._pending.async_add(
+                [OnOffCapabilityBasic(hass, entry_data, f"switch.test_{i}", State(f"switch.test_{i}", "on"))], []
+            )
+
+    async def _async_report(count: int) -> timedelta:
+        await _async_add(count)
+        await notifier._async_report_states()
+        await hass.async_block_till_done()
+        return notifier._report_window
+
+    await _async_add(1)
+    notifier._schedule_report_states()
+    mock_call_later.assert_called_once_with(hass, delay=timedelta(seconds=1), action=ANY)
+    notifier._unsub_report_states = None
+
+    assert await _async_report(10) == timedelta(seconds=2)
+    assert await _async_report(50) == timedelta(seconds=4)
+    assert await _async_report(50) == timedelta(seconds=5)
+    assert await _async_report(25) == timedelta(seconds=5)
+
+    # same rate of changes doesn't widen the window further
+    notifier._report_window = timedelta(seconds=2)
+    notifier._reported_at -= 4
+    assert await _async_report(20) == timedelta(seconds=2)
+
+    assert await _async_report(4) == timedelta(seconds=1)
+    for _ in range(4):
+        await _async_report(0)
+    assert notifier._report_window == timedelta(milliseconds=100)
+
+    assert await _async_report(20) == timedelta(milliseconds=200)
+    mock_call_later.reset_mock()
+    notifier._reported_at -= 10
+    await _async_add(1)
+    notifier._schedule_report_states()
+    mock_call_later.assert_called_once_with(hass, delay=timedelta(milliseconds=100), action=ANY)
+    notifier._unsub_report_states = None
+    await notifier._pending.async_get_all()
+
+    # time sensitive states are sent immediately and separately
+    button = get_custom_property(
+        hass,
+        entry_data,
+        {CONF_ENTITY_PROPERTY_TYPE: EventPropertyInstance.BUTTON, CONF_ENTITY_PROPERTY_ENTITY: "sensor.button"},
+        "sensor.button",
+    )
+    assert button
+    mock_call_later.reset_mock()
+    aioclient_mock.clear_requests()
+    aioclient_mock.post(
+        f"https://dialogs.yandex.net/api/v1/skills/{BASIC_CONFIG.skill_id}/callback/state",
+        status=202,
+        json={"request_id": REQ_ID, "status": "ok"},
+    )
+    await _async_add(1)
+    await notifier._pending.async_add([button.new_with_value("click")], [])
+    notifier._schedule_report_states()
+    assert mock_call_later.call_count == 2
+    assert mock_call_later.call_args_list[0].kwargs["delay"] == 0
+    assert mock_call_later.call_args_list[1].kwargs["delay"] == timedelta(milliseconds=100)
+
+    await notifier._async_report_time_sensitive_states()
+    await hass.async_block_till_done()
+    assert notifier._unsub_report_time_sensitive_states is None
+    assert aioclient_mock.call_count == 1
+    assert [d["id"] for d in json.loads(aioclient_mock.mock_calls[0][2]._value)["payload"]["devices"]] == [
+        "sensor.button"
+    ]
+    assert list(notifier._pending._device_states.keys()) == ["switch.test_0"]
+    assert notifier._unsub_report_states is not None
+
+
+async def test_notifier_report_filter(
+    hass: HomeAssistant, mock_call_later: AsyncMock, aioclient_mock: AiohttpClientMocker
+) -> None:
+    entry_data = MockConfigEntryData(
+        hass,
+        entity_config={
+            "sensor.power": {"report_filter": {"power": {"deadband": 5.0, "min_interval": timedelta(seconds=30)}}},
+            "sensor.voltage": {"report_filter": {"voltage": {"deadband": "2.0%"}}},
+        },
+        entity_filter=generate_entity_filter(include_entity_globs=["*"]),
+    )
+    notifier = YandexDirectNotifier(hass, entry_data, BASIC_CONFIG, {}, {})
+    aioclient_mock.post(
+        f"https://dialogs.yandex.net/api/v1/skills/{BASIC_CONFIG.skill_id}/callback/state",
+        status=202,
+        json={"request_id": REQ_ID, "status": "ok"},
+    )
+    await notifier.async_setup()
+
+    async def _async_set(entity_id: str, value: str, device_class: str, unit: str) -> dict[str, list[Any]]:
+        hass.states.async_set(entity_id, value, {ATTR_DEVICE_CLASS: device_class, ATTR_UNIT_OF_MEASUREMENT: unit})
+        await hass.async_block_till_done()
+        await notifier._async_flush_state_changes()
+        return {
+            device_id: [s.get_value() for s in device_states.values() if s.key[1] == "devices.properties.float"]
+            for device_id, device_states in notifier._pending._device_states.items()
+        }
+
+    async def _async_report() -> None:
+        await notifier._async_report_states()
+        await hass.async_block_till_done()
+
+    assert await _async_set("sensor.power", "100", "power", "W") == {"sensor.power": [100]}
+    await _async_report()
+    assert await _async_set("sensor.power", "103", "power", "W") == {}
+    assert await _async_set("sensor.power", "97", "power", "W") == {}
+
+    mock_call_later.reset_mock()
+    assert await _async_set("sensor.power", "110", "power", "W") == {}
+    assert await _async_set("sensor.power", "112", "power", "W") == {}
+    mock_call_later.assert_called_once()
+    assert 29 < mock_call_later.call_args.kwargs["delay"] <= 30
+    assert notifier._unsub_report_deferred_states is not None
+
+    await notifier._async_report_deferred_states()
+    assert notifier._pending.empty is True
+    mock_call_later.reset_mock()
+    notifier._unsub_report_deferred_states = None
+    notifier._report_filter._deferred[("sensor.power", "devices.properties.float", "power")] = (
+        0.0,
+        notifier._report_filter._deferred[("sensor.power", "devices.properties.float", "power")][1],
+    )
+    await notifier._async_report_deferred_states()
+    assert {k: [s.get_value() for s in v.values()] for k, v in notifier._pending._device_states.items()} == {
+        "sensor.power": [112]
+    }
+    assert notifier._report_filter.deferred_due is None
+    await _async_report()
+
+    assert await _async_set("sensor.power", "101", "power", "W") == {}
+    assert len(notifier._report_filter._deferred) == 1
+    assert await _async_set("sensor.power", "110", "power", "W") == {}
+    assert len(notifier._report_filter._deferred) == 0
+
+    assert await _async_set("sensor.voltage", "220", "voltage", "V") == {"sensor.voltage": [220]}
+    await _async_report()
+    assert await _async_set("sensor.voltage", "224", "voltage", "V") == {}
+    assert await _async_set("sensor.voltage", "215", "voltage", "V") == {"sensor.voltage": [215]}
+    await _async_report()
+    assert await _async_set("sensor.voltage", "225", "voltage", "V") == {"sensor.voltage": [225]}
+    assert await _async_set("sensor.voltage", "215.1", "voltage", "V") == {}
+
+    assert await _async_set("sensor.current", "1", "current", "A") == {"sensor.current": [1]}
+    await _async_report()
+    assert await _async_set("sensor.current", "1.01", "current", "A") == {"sensor.current": [1.01]}
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.post(
+        f"https://dialogs.yandex.net/api/v1/skills/{BASIC_CONFIG.skill_id}/callback/state",
+        exc=ClientConnectionError(),
+    )
+    assert await _async_set("sensor.voltage", "230", "voltage", "V") == {
+        "sensor.current": [1.01],
+        "sensor.voltage": [230],
+    }
+    await _async_report()
+    assert notifier._report_filter._reported[("sensor.voltage", "devices.properties.float", "voltage")][0] == 215
+
+    await notifier.async_unload()
+
+
+async def test_notifier_retry_states(
+    hass: HomeAssistant,
+    entry_data: MockConfigEntryData,
+    mock_call_later: AsyncMock,
+    aioclient_mock: AiohttpClientMocker,
+) -> None:
+    notifier = YandexDirectNotifier(hass, entry_data, BASIC_CONFIG, {}, {})
+    url = f"https://dialogs.yandex.net/api/v1/skills/{BASIC_CONFIG.skill_id}/callback/state"
+
+    async def _async_report(entity_id: str, state: str) -> None:
+        await notifier._pending.async_add(
+            [OnOffCapabilityBasic(hass, entry_data, entity_id, State(entity_id, state))], []
+        )
+        await notifier._async_report_states()
+        await hass.async_block_till_done()
+
+    async def _async_retry() -> None:
+        assert notifier._unsub_retry_states is not None
+        mock_call_later.reset_mock()
+        notifier._async_create_retry_states_task()
+        await hass.async_block_till_done()
+
+    def _failed_states() -> list[tuple[str, bool]]:
+        return [(s.id, s.capabilities[0].state.value) for s in notifier._failed.get_all() if s.capabilities]
+
+    with patch("custom_components.yandex_smart_home.notifier.uniform", return_value=1):
+        aioclient_mock.post(url, exc=ClientConnectionError())
+        await _async_report("switch.a", "on")
+        assert aioclient_mock.call_count == 1
+        assert _failed_states() == [("switch.a", True)]
+        assert mock_call_later.call_args.kwargs["delay"] == 5
+
+        mock_call_later.reset_mock()
+        await _async_report("switch.a", "off")
+        await _async_report("switch.b", "on")
+        assert aioclient_mock.call_count == 1
+        assert _failed_states() == [("switch.a", False), ("switch.b", True)]
+        mock_call_later.assert_not_called()
+
+        await _async_retry()
+        assert aioclient_mock.call_count == 2
+        assert mock_call_later.call_args.kwargs["delay"] == 10
+
+        aioclient_mock.clear_requests()
+        aioclient_mock.post(url, status=500)
+        await _async_retry()
+        assert aioclient_mock.call_count == 1
+        assert mock_call_later.call_args.kwargs["delay"] == 20
+
+        with patch("custom_components.yandex_smart_home.notifier.RETRY_STATES_MAX_DELAY", timedelta(seconds=15)):
+            await _async_retry()
+            assert mock_call_later.call_args.kwargs["delay"] == 15
+
+        aioclient_mock.clear_requests()
+        aioclient_mock.post(url, status=202, json={"request_id": REQ_ID, "status": "ok"})
+        await _async_retry()
+        assert aioclient_mock.call_count == 1
+        assert [d["id"] for d in json.loads(aioclient_mock.mock_calls[0][2]._value)["payload"]["devices"]] == [
+            "switch.a",
+            "switch.b",
+        ]
+        assert notifier._failed.empty
+        mock_call_later.assert_not_called()
+
+        aioclient_mock.clear_requests()
+        aioclient_mock.post(url, status=400)
+        await _async_report("switch.a", "on")
+        assert aioclient_mock.call_count == 1
+        assert notifier._failed.empty
+
+        aioclient_mock.clear_requests()
+        aioclient_mock.post(url, status=429)
+        await _async_report("switch.a", "off")
+        assert _failed_states() == [("switch.a", False)]
+        assert mock_call_later.call_args.kwargs["delay"] == 5
+
+
+def test_notifier_failed_states(caplog: pytest.LogCaptureFixture) -> None:
+    def _on(value: bool) -> CapabilityInstanceState:
+        return CapabilityInstanceState(
+            type=CapabilityType.ON_OFF,
+            state=CapabilityInstanceStateValue(instance=OnOffCapabilityInstance.ON, value=value),
+        )
+
+    def _temperature(value: float) -> PropertyInstanceState:
+        return PropertyInstanceState(
+            type=PropertyType.FLOAT,
+            state=PropertyInstanceStateValue(instance=FloatPropertyInstance.TEMPERATURE, value=value),
+        )
+
+    fs = FailedStates(max_devices=2)
+    assert len(fs) == 0
+    assert fs.add([DeviceState(id="a", capabilities=[_on(True)], properties=[_temperature(20)])], 2) == 0
+    assert fs.add([DeviceState(id="a", capabilities=[_on(False)])], 1) == 0
+    assert fs.add([DeviceState(id="a", properties=[_temperature(21)])], 3) == 0
+    assert len(fs) == 1
+    assert fs.get_all() == [DeviceState(id="a", capabilities=[_on(True)], properties=[_temperature(21)])]
+
+    fs.discard([DeviceState(id="a", capabilities=[_on(True)], properties=[_temperature(21)])], 2)
+    fs.discard([DeviceState(id="b", capabilities=[_on(True)])], 2)
+    assert fs.get_all() == [DeviceState(id="a", properties=[_temperature(21)])]
+
+    assert fs.add([DeviceState(id="b", capabilities=[_on(True)])], 4) == 0
+    assert fs.add([DeviceState(id="c", capabilities=[_on(False)])], 4) == 1
+    assert [s.id for s in fs.get_all()] == ["b", "c"]
+
+    fs_loaded = FailedStates()
+    fs_loaded.load(json.loads(json.dumps(fs.as_data())))
+    assert fs_loaded.get_all() == fs.get_all()
+
+    fs_loaded.load([{"foo": "bar"}])
+    assert fs_loaded.get_all() == fs.get_all()
+    assert "Failed to load unsent states" in caplog.messages[-1]
+
+    fs.discard(fs.get_all(), 4)
+    assert fs.empty is True
+    assert fs.as_data() == []
+
+
+async def test_notifier_spool_failed_states(
+    hass: HomeAssistant,
+    entry_data: MockConfigEntryData,
+    mock_call_later: AsyncMock,
+    hass_storage: dict[str, Any],
+) -> None:
+    config = NotifierConfig(user_id="bread", token="xyz", skill_id="a-b-c", spool=True)
+    storage_key = f"{DOMAIN}.notifier.{entry_data.entry.entry_id}_yandex"
+    state = DeviceState(
+        id="switch.a",
+        capabilities=[
+            CapabilityInstanceState(
+                type=CapabilityType.ON_OFF,
+                state=CapabilityInstanceStateValue(instance=OnOffCapabilityInstance.ON, value=True),
+            )
+        ],
+    )
+
+    notifier = YandexDirectNotifier(hass, entry_data, config, {}, {})
+    await notifier.async_setup()
+    assert notifier._failed.empty
+    notifier._async_add_failed_states([state], 1)
+    await notifier.async_unload()
+    assert hass_storage[storage_key]["data"] == [state.as_dict()]
+
+    mock_call_later.reset_mock()
+    notifier = YandexDirectNotifier(hass, entry_data, config, {}, {})
+    await notifier.async_setup()
+    assert notifier._failed.get_all() == [state]
+    mock_call_later.assert_any_call(hass, delay=0.0, action=ANY)
+    await notifier.async_unload()
+
+    notifier = YandexDirectNotifier(hass, entry_data, BASIC_CONFIG, {}, {})
+    assert notifier._failed_store is None
+
+
 async def test_notifier_pending_states(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
     ps = PendingStates()
     await ps.async_add([OnOffCapabilityBasic(hass, entry_data, "switch.test", State("switch.test", "on"))], [])
-    assert ps._device_states["switch.test"][0].get_value() is True
+    assert len(ps._device_states["switch.test"]) == 1
+    assert ps._device_states["switch.test"][("switch.test", "devices.capabilities.on_off", "on")].get_value() is True
     await ps.async_add([OnOffCapabilityBasic(hass, entry_data, "switch.test", State("switch.test", "off"))], [])
-    assert ps._device_states["switch.test"][0].get_value() is False
+    assert len(ps._device_states["switch.test"]) == 1
+    assert ps._device_states["switch.test"][("switch.test", "devices.capabilities.on_off", "on")].get_value() is False
+    assert ps.time_sensitive is False
+
+    button = get_custom_property(
+        hass,
+        entry_data,
+        {CONF_ENTITY_PROPERTY_TYPE: EventPropertyInstance.BUTTON, CONF_ENTITY_PROPERTY_ENTITY: "sensor.button"},
+        "sensor.button",
+    )
+    assert button
+    assert button.time_sensitive is True
+    await ps.async_add([button.new_with_value("click")], [])
+    assert ps.time_sensitive is True
+    await ps.async_add([button.new_with_value("double_click")], [])  # type: ignore[unreachable]
+    assert ps.time_sensitive is True
+    assert list(ps._device_states.keys()) == ["switch.test", "sensor.button"]
+
+    assert ps.delayable is True
+
+    pending = await ps.async_get_time_sensitive()
+    assert list(pending.keys()) == ["sensor.button"]
+    assert [s.get_value() for s in pending["sensor.button"]] == ["double_click"]
+    assert list(ps._device_states.keys()) == ["switch.test"]
+    assert ps.time_sensitive is False
+    assert ps.delayable is True
+    assert await ps.async_get_time_sensitive() == {}
+
+    await ps.async_add([button.new_with_value("click")], [])
+    pending = await ps.async_get_all()
+    assert [s.get_value() for s in pending["sensor.button"]] == ["click"]
+    assert ps.empty is True
+    assert ps.time_sensitive is False
+    assert ps.delayable is False
 
 
 async def test_notifier_capability_check_value_change(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
@@ -3,7 +3,8 @@ from unittest.mock import patch
 
 from homeassistant import core
 from homeassistant.components import demo
-from homeassistant.const import Platform
+from homeassistant.components.sensor import SensorDeviceClass
+from homeassistant.const import ATTR_DEVICE_CLASS, Platform
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component
 
@@ -261,3 +262,20 @@ async def test_property_demo_platform(hass: HomeAssistant, entry_data: MockConfi
     assert device.type == "devices.types.sensor.button"
     props = list((p.type, p.instance) for p in device.get_properties())
     assert props == [("devices.properties.event", "button")]
+
+
+async def test_property_key(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    state = State("sensor.test", "20", {ATTR_DEVICE_CLASS: SensorDeviceClass.TEMPERATURE})
+    (prop,) = get_properties(hass, entry_data, state, PropertyType.FLOAT, FloatPropertyInstance.TEMPERATURE)
+    assert prop.key == ("sensor.test", "devices.properties.float", "temperature")
+
+    (same_prop,) = get_properties(hass, entry_data, state, PropertyType.FLOAT, FloatPropertyInstance.TEMPERATURE)
+    assert same_prop is not prop
+    assert same_prop == prop
+    assert hash(same_prop) == hash(prop)
+    assert len({prop, same_prop}) == 1
+
+    other_state = State("sensor.other", "20", {ATTR_DEVICE_CLASS: SensorDeviceClass.TEMPERATURE})
+    (other_prop,) = get_properties(hass, entry_data, other_state, PropertyType.FLOAT, FloatPropertyInstance.TEMPERATURE)
+    assert other_prop != prop
+    assert prop != "sensor.test"
@@ -1,3 +1,5 @@
+from itertools import chain
+
 from homeassistant.components import input_text, sensor
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.event import ATTR_EVENT_TYPE, EventDeviceClass
@@ -6,6 +8,7 @@ from homeassistant.core import HomeAssistant, State
 import pytest
 
 from custom_components.yandex_smart_home.const import CONF_ENTITY_EVENT_MAP
+from custom_components.yandex_smart_home.property_event import ButtonPressStateEventProperty
 from custom_components.yandex_smart_home.schema import EventPropertyInstance, PropertyType
 
 from . import MockConfigEntryData
@@ -45,6 +48,46 @@ async def test_property_event_custom_mapping(hass: HomeAssistant, entry_data: Mo
     assert prop.get_value() == "double_click"
 
 
+async def test_property_event_compiled_map(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    state = State("sensor.button", "", {ATTR_DEVICE_CLASS: "action", "action": "release"})
+    prop = get_exact_one_property(hass, entry_data, state, PropertyType.EVENT, EventPropertyInstance.BUTTON)
+    other_prop = get_exact_one_property(hass, entry_data, state, PropertyType.EVENT, EventPropertyInstance.BUTTON)
+    assert isinstance(prop, ButtonPressStateEventProperty)
+    assert isinstance(other_prop, ButtonPressStateEventProperty)
+    assert prop._event_map is other_prop._event_map
+    assert "release" not in prop._supported_native_values
+    assert "release" not in chain.from_iterable(ButtonPressStateEventProperty._event_map_default.values())
+
+    config = {
+        state.entity_id: {
+            CONF_ENTITY_EVENT_MAP: {
+                "button": {
+                    "click": ["foo", "bar"],
+                    "double_click": ["bar"],
+                }
+            }
+        }
+    }
+    props = [
+        get_exact_one_property(
+            hass,
+            MockConfigEntryData(hass, entity_config=config),
+            State(state.entity_id, "bar", {ATTR_DEVICE_CLASS: "button"}),
+            PropertyType.EVENT,
+            EventPropertyInstance.BUTTON,
+        )
+        for _ in range(2)
+    ]
+    assert props[0]._event_map is props[1]._event_map
+    assert props[0]._event_map is not prop._event_map
+    assert props[0]._supported_native_values == ("foo", "bar", "bar")
+    assert props[0].get_value() == "click"
+    props[0].state.state = "BAR"
+    assert props[0].get_value() == "click"
+    props[0].state.state = "click"
+    assert props[0].get_value() is None
+
+
 @pytest.mark.parametrize(
     "device_class,supported",
     [
@@ -1,4 +1,5 @@
 from typing import Any
+from unittest.mock import patch
 
 from homeassistant.components import (
     air_quality,
@@ -29,10 +30,12 @@ from homeassistant.const import (
     UnitOfVolume,
 )
 from homeassistant.core import HomeAssistant, State
+from homeassistant.util.unit_conversion import TemperatureConverter
 import pytest
 
+from custom_components.yandex_smart_home.helpers import APIError
 from custom_components.yandex_smart_home.property_float import PropertyType
-from custom_components.yandex_smart_home.schema import FloatPropertyInstance
+from custom_components.yandex_smart_home.schema import FloatPropertyInstance, ResponseCode
 from custom_components.yandex_smart_home.unit_conversion import UnitOfPressure
 from tests import MockConfigEntryData
 
@@ -238,6 +241,34 @@ async def test_property_float_temperature_convertion(hass: HomeAssistant, entry_
     assert prop.get_value() == 10.06
 
 
+async def test_property_float_cached_conversion(hass: HomeAssistant, entry_data: MockConfigEntryData) -> None:
+    state = State(
+        "sensor.test",
+        "50.10",
+        {
+            ATTR_DEVICE_CLASS: SensorDeviceClass.TEMPERATURE,
+            ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.FAHRENHEIT,
+        },
+    )
+    prop = get_exact_one_property(hass, entry_data, state, PropertyType.FLOAT, FloatPropertyInstance.TEMPERATURE)
+
+    with patch.object(TemperatureConverter, "converter_factory", wraps=TemperatureConverter.converter_factory) as mock:
+        assert prop.get_value() == 10.06
+        assert prop.get_value() == 10.06
+        mock.assert_called_once_with(UnitOfTemperature.FAHRENHEIT, UnitOfTemperature.CELSIUS)
+
+    with patch.object(prop, "_get_native_value", return_value=50):
+        assert prop.get_value() == 10.0
+    with patch.object(prop, "_get_native_value", return_value="Unknown"):
+        assert prop.get_value() is None
+    with patch.object(prop, "_get_native_value", return_value=""):
+        assert prop.get_value() is None
+    with patch.object(prop, "_get_native_value", return_value="foo"):
+        with pytest.raises(APIError) as e:
+            prop.get_value()
+        assert e.value.code == ResponseCode.NOT_SUPPORTED_IN_CURRENT_MODE
+
+
 @pytest.mark.parametrize("device_class", [SensorDeviceClass.PRESSURE, SensorDeviceClass.ATMOSPHERIC_PRESSURE])
 @pytest.mark.parametrize(
     "unit_of_measurement,property_unit,assert_value",
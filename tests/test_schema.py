@@ -1,6 +1,35 @@
+from enum import Enum
+import types
+from typing import Annotated, Any, Generator, Literal, Union, get_args, get_origin
+from unittest.mock import patch
+
+from pydantic.v1 import BaseModel
+import pytest
 from pytest_homeassistant_custom_component.common import load_fixture
 
-from custom_components.yandex_smart_home.schema import ActionRequest, GetStreamInstanceActionStateValue
+from custom_components.yandex_smart_home.schema import (
+    ActionRequest,
+    ButtonEventPropertyParameters,
+    CallbackStatesRequest,
+    CallbackStatesRequestPayload,
+    DeviceDescription,
+    DeviceInfo,
+    DeviceList,
+    DeviceState,
+    DeviceType,
+    Error,
+    EventPropertyParameters,
+    GetStreamInstanceActionStateValue,
+    Response,
+    ResponseCode,
+)
+from custom_components.yandex_smart_home.schema.base import (
+    APIModel,
+    SerializerBackend,
+    _fast_encode,
+    get_serializer_backend,
+    set_serializer_backend,
+)
 from custom_components.yandex_smart_home.schema.capability import *
 from custom_components.yandex_smart_home.schema.capability_color import *
 from custom_components.yandex_smart_home.schema.capability_mode import *
@@ -58,3 +87,161 @@ def test_devices_action_request_vk() -> None:
     assert request.payload.devices[0].capabilities[0] == RangeCapabilityInstanceAction(
         state=RangeCapabilityInstanceActionState(instance=RangeCapabilityInstance.VOLUME, value=54.0, relative=False),
     )
+
+
+def test_device_list_as_json() -> None:
+    def _pydantic_json(model: BaseModel) -> str:
+        return BaseModel.json(model, exclude_none=True, ensure_ascii=False)
+
+    devices = [
+        DeviceDescription(
+            id="light.kitchen",
+            name='Люстра "Кухня"',
+            room="Кухня",
+            type=DeviceType.LIGHT,
+            capabilities=[
+                CapabilityDescription(type=CapabilityType.ON_OFF, retrievable=True, reportable=True, parameters=None),
+                CapabilityDescription(
+                    type=CapabilityType.COLOR_SETTING,
+                    parameters=ColorSettingCapabilityParameters(
+                        color_model=CapabilityParameterColorModel.RGB,
+                        temperature_k=CapabilityParameterTemperatureK(min=2700, max=6500),
+                    ),
+                    retrievable=True,
+                    reportable=True,
+                ),
+            ],
+            device_info=DeviceInfo(model="light.kitchen"),
+        ),
+        DeviceDescription(id="switch.test", name="test", type=DeviceType.SWITCH),
+    ]
+    device_list = DeviceList(user_id="юзер", devices=devices)
+
+    assert devices[0].as_json() == _pydantic_json(devices[0])
+    assert devices[0].as_json() is devices[0].as_json()
+    assert device_list.as_json() == _pydantic_json(device_list)
+    assert DeviceList(user_id="foo", devices=[]).as_json() == '{"user_id": "foo", "devices": []}'
+
+    for response in (
+        Response(request_id="req", payload=device_list),
+        Response(payload=device_list),
+        Response(request_id="req", payload=Error(error_code=ResponseCode.INTERNAL_ERROR)),
+        Response(request_id="req"),
+        Response(),
+    ):
+        assert response.as_json() == _pydantic_json(response)
+
+
+def test_callback_states_request_as_json() -> None:
+    def _pydantic_json(model: BaseModel) -> str:
+        return BaseModel.json(model, exclude_none=True, ensure_ascii=False)
+
+    states = [
+        DeviceState(
+            id="light.kitchen",
+            capabilities=[
+                CapabilityInstanceState(
+                    type=CapabilityType.ON_OFF,
+                    state=CapabilityInstanceStateValue(instance=OnOffCapabilityInstance.ON, value=True),
+                )
+            ],
+        ),
+        DeviceState(id="switch.test", error_code=ResponseCode.DEVICE_UNREACHABLE),
+    ]
+    request = CallbackStatesRequest(payload=CallbackStatesRequestPayload(user_id="юзер", devices=states))
+
+    assert states[0].as_json() == _pydantic_json(states[0])
+    assert states[0].as_json() is states[0].as_json()
+    assert request.payload.as_json() == _pydantic_json(request.payload)
+    assert request.as_json() == _pydantic_json(request)
+
+
+def _get_api_models() -> list[type[APIModel]]:
+    models: list[type[APIModel]] = []
+    candidates: list[type[APIModel]] = [APIModel]
+    while candidates:
+        for model in candidates.pop().__subclasses__():
+            if model not in models:
+                models.append(model)
+                candidates.append(model)
+
+    # generic base is serialized only through parametrized subclasses
+    return [m for m in models if m not in (EventPropertyParameters, EventPropertyParameters[Any])]
+
+
+def _get_sample_value(value_type: Any, full: bool) -> Any:
+    origin = get_origin(value_type)
+    if origin is Annotated:
+        return _get_sample_value(get_args(value_type)[0], full)
+    if origin in (Union, types.UnionType):
+        return _get_sample_value(next(a for a in get_args(value_type) if a is not type(None)), full)
+    if origin is Literal:
+        return get_args(value_type)[0]
+    if origin is list:
+        return [_get_sample_value(get_args(value_type)[0], full)]
+    if origin is dict:
+        key_type, item_type = get_args(value_type)
+        return {_get_sample_value(key_type, full): _get_sample_value(item_type, full)}
+    if value_type is Any:
+        return {"ключ": [1, None, 2.5, '"ü"', {"nested": None}]}
+    if value_type is None or value_type is type(None):
+        return None
+
+    assert isinstance(value_type, type)
+    if issubclass(value_type, EventPropertyParameters):
+        return ButtonEventPropertyParameters()
+    if issubclass(value_type, BaseModel):
+        return _get_sample_model(value_type, full)
+    if issubclass(value_type, Enum):
+        return list(value_type)[-1]
+
+    return {bool: True, int: 42, float: 1.5, str: 'значение "x" \\ /'}[value_type]
+
+
+def _get_sample_model(model: type[BaseModel], full: bool) -> BaseModel:
+    values = {}
+    for field in model.__fields__.values():
+        if field.required or full:
+            values[field.name] = _get_sample_value(field.outer_type_, full)
+
+    if model is ColorSettingCapabilityParameters and not full:
+        values["color_model"] = CapabilityParameterColorModel.HSV
+
+    return model(**values)
+
+
+@pytest.fixture
+def restore_serializer_backend() -> Generator[None, None, None]:
+    backend = get_serializer_backend()
+    yield
+    set_serializer_backend(backend)
+
+
+@pytest.mark.usefixtures("restore_serializer_backend")
+@pytest.mark.parametrize("full", [True, False], ids=["full", "required"])
+@pytest.mark.parametrize("model", _get_api_models(), ids=lambda m: str(m.__name__))
+def test_serializer_backend_parity(model: type[APIModel], full: bool) -> None:
+    instance = _get_sample_model(model, full)
+    assert isinstance(instance, APIModel)
+    # a copy is taken before serialization, so JSON cached by device descriptions and states isn't reused
+    fast_instance = instance.copy(deep=True)
+
+    set_serializer_backend(SerializerBackend.PYDANTIC)
+    expected_json = BaseModel.json(instance, exclude_none=True, ensure_ascii=False)
+    expected_dict = BaseModel.dict(instance, exclude_none=True)
+    assert instance.as_json() == expected_json
+    assert instance.as_dict() == expected_dict
+
+    set_serializer_backend(SerializerBackend.FAST)
+    assert get_serializer_backend() == SerializerBackend.FAST
+    with patch("custom_components.yandex_smart_home.schema.base._fast_encode", wraps=_fast_encode) as mock_encode:
+        assert fast_instance.as_json() == expected_json
+        assert mock_encode.called
+
+    assert fast_instance.as_dict() == expected_dict
+
+
+def test_serializer_backend_models_coverage() -> None:
+    names = {m.__name__ for m in _get_api_models()}
+    assert {"DeviceList", "DeviceDescription", "Response", "CallbackStatesRequest", "ActionResult"} <= names
+    assert len(names) > 90
@@ -0,0 +1,119 @@
+from unittest.mock import patch
+
+from homeassistant.auth.models import User
+from homeassistant.const import (
+    CONF_ID,
+    CONF_PLATFORM,
+    CONF_TOKEN,
+    EVENT_HOMEASSISTANT_STARTED,
+    STATE_UNKNOWN,
+    EntityCategory,
+)
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.yandex_smart_home import DOMAIN, YandexSmartHome
+from custom_components.yandex_smart_home.config_flow import ConfigFlowHandler
+from custom_components.yandex_smart_home.const import (
+    CONF_CONNECTION_TYPE,
+    CONF_LINKED_PLATFORMS,
+    CONF_SKILL,
+    CONF_USER_ID,
+    ConnectionType,
+)
+from custom_components.yandex_smart_home.helpers import SmartHomePlatform
+
+
+def _get_config_entry(user: User) -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        version=ConfigFlowHandler.VERSION,
+        data={
+            CONF_CONNECTION_TYPE: ConnectionType.DIRECT,
+            CONF_PLATFORM: SmartHomePlatform.YANDEX,
+            CONF_LINKED_PLATFORMS: [SmartHomePlatform.YANDEX],
+        },
+        options={CONF_SKILL: {CONF_ID: "skill_id", CONF_TOKEN: "token", CONF_USER_ID: user.id}},
+    )
+
+
+async def test_sensor_disabled(hass: HomeAssistant, hass_admin_user: User) -> None:
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {}})
+    config_entry = _get_config_entry(hass_admin_user)
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    component: YandexSmartHome = hass.data[DOMAIN]
+    assert len(component.get_entry_data(config_entry).notifiers) == 1
+    assert hass.states.async_entity_ids("sensor") == []
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_sensor(
+    hass: HomeAssistant,
+    hass_admin_user: User,
+    entity_registry: er.EntityRegistry,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {"settings": {"notifier_sensors": True}}})
+    config_entry = _get_config_entry(hass_admin_user)
+    config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    component: YandexSmartHome = hass.data[DOMAIN]
+    notifier = component.get_entry_data(config_entry).notifiers[0]
+    entity_ids = hass.states.async_entity_ids("sensor")
+    assert len(entity_ids) == 9
+
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{config_entry.entry_id}_notifier_yandex_requests"
+    )
+    assert entity_id == "sensor.mock_title_yandex_otpravlennye_uvedomleniia"
+    entity = entity_registry.async_get(entity_id)
+    assert entity is not None
+    assert entity.entity_category == EntityCategory.DIAGNOSTIC
+    assert entity.device_id is not None
+    device = device_registry.async_get(entity.device_id)
+    assert device is not None
+    assert device.name == "Mock Title (yandex)"
+    assert device.entry_type == dr.DeviceEntryType.SERVICE
+
+    latency_entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{config_entry.entry_id}_notifier_yandex_latency_p95"
+    )
+    assert latency_entity_id is not None
+    assert hass.states.get(entity_id).state == "0"  # type: ignore[union-attr]
+    assert hass.states.get(latency_entity_id).state == STATE_UNKNOWN  # type: ignore[union-attr]
+
+    notifier.metrics.record_request(0.25, 100)
+    notifier.metrics.record_request(0.5, 100, "timeout")
+    await async_update_entity(hass, entity_id)
+    await async_update_entity(hass, latency_entity_id)
+    assert hass.states.get(entity_id).state == "2"  # type: ignore[union-attr]
+    assert hass.states.get(latency_entity_id).state == "500.0"  # type: ignore[union-attr]
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    assert hass.states.get(entity_id).state == "unavailable"  # type: ignore[union-attr]
+
+
+async def test_sensor_postponed_notifiers(hass: HomeAssistant, hass_admin_user: User) -> None:
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {"settings": {"notifier_sensors": True}}})
+    config_entry = _get_config_entry(hass_admin_user)
+
+    with patch.object(hass, "state", return_value=CoreState.starting):
+        config_entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert hass.states.async_entity_ids("sensor") == []
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+        assert len(hass.states.async_entity_ids("sensor")) == 9
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)